@@ -5,10 +5,18 @@ from datetime import datetime, timedelta
 from typing import Optional, List
 from app.db.database import get_db
 from app.core.dependencies import get_current_admin
-from app.models.user import User
+from app.core.security import revoke_jti
+from app.core.user_cache import invalidate_user
+from app.models.user import User, Session as UserSession
 from app.models.post import Post, Comment, Category
 from app.models.partner import Partner
 from app.models.admin import Report, ReportStatus, Banner, AuditLog, SystemNotice, BlockedKeyword, SystemSettings
+from app.services.post_counter import post_counter
+from app.services.translation import translation_service
+from app.services.read_stats import read_stats
+from app.services.response_cache import response_cache, post_tags, CATEGORY_TAGS
+from app.services.translation_quota import translation_quota, global_windows, user_windows
+from app.utils.metrics import metrics
 from pydantic import BaseModel
 
 router = APIRouter()
@@ -265,6 +273,15 @@ async def get_users(
     users = query.order_by(User.created_at.desc()).offset(skip).limit(limit).all()
     return users
 
+async def _revoke_user_sessions(db: Session, user_id: int) -> int:
+    """사용자의 모든 세션 삭제 및 토큰 폐기 (커밋은 호출자가)"""
+    sessions = db.query(UserSession).filter(UserSession.user_id == user_id).all()
+    for session in sessions:
+        await revoke_jti(session.access_token_jti, session.expires_at)
+        await revoke_jti(session.refresh_token_jti, session.expires_at)
+        db.delete(session)
+    return len(sessions)
+
 @router.patch("/users/{user_id}/toggle-active")
 async def toggle_user_active(
     user_id: int,
@@ -277,10 +294,31 @@ async def toggle_user_active(
         raise HTTPException(status_code=404, detail="User not found")
 
     user.is_active = not user.is_active
+    if not user.is_active:
+        # 비활성화 시 기존 토큰 즉시 폐기
+        await _revoke_user_sessions(db, user_id)
     db.commit()
+    invalidate_user(user_id)
 
     return {"message": f"User {'activated' if user.is_active else 'deactivated'}", "is_active": user.is_active}
 
+@router.post("/users/{user_id}/revoke-sessions")
+async def revoke_user_sessions(
+    user_id: int,
+    db: Session = Depends(get_db),
+    admin_user = Depends(get_current_admin)
+):
+    """사용자 강제 로그아웃 (모든 세션 토큰 폐기)"""
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    revoked = await _revoke_user_sessions(db, user_id)
+    db.commit()
+    invalidate_user(user_id)
+
+    return {"message": "Sessions revoked", "revoked": revoked}
+
 @router.patch("/users/{user_id}/persona")
 async def update_user_persona(
     user_id: int,
@@ -315,6 +353,7 @@ async def update_user_persona(
 
     db.commit()
     db.refresh(user)
+    invalidate_user(user_id)
 
     return {"message": "Persona updated successfully", "user": user}
 
@@ -341,8 +380,11 @@ async def delete_post_admin(
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
 
+    category_id, post_status = post.category_id, post.status
     db.delete(post)
     db.commit()
+    await post_counter.adjust(category_id, post_status, -1)
+    await response_cache.invalidate(post_tags(category_id))
     return {"message": "Post deleted successfully"}
 
 # 배너 관리
@@ -514,8 +556,112 @@ async def update_system_setting(
     db.commit()
     db.refresh(setting)
 
+    # 이 워커는 바로 반영 (다른 워커는 설정 감시 주기 안에 반영)
+    if setting.category == "translation":
+        await translation_service.reload_settings()
+
     return setting
 
+@router.get("/metrics")
+async def get_metrics(
+    prefix: str = "",
+    admin_user: User = Depends(get_current_admin)
+):
+    """프로세스 내 메트릭 조회 (번역 대기열, 지연 시간 등 - 워커별 값)"""
+    return metrics.snapshot(prefix)
+
+@router.get("/translation/cache-stats")
+async def get_translation_cache_stats(
+    admin_user: User = Depends(get_current_admin)
+):
+    """번역 캐시 단계별 적중률 및 로컬 캐시 사용량 (워커별 값)"""
+    service = await translation_service.get()
+    return service.cache.stats()
+
+@router.get("/translation/providers")
+async def get_translation_providers(
+    admin_user: User = Depends(get_current_admin)
+):
+    """번역 프로바이더별 서킷 상태와 지연 시간 (워커별 값)"""
+    service = await translation_service.get()
+    return service.router.status()
+
+@router.post("/translation/cache/flush")
+async def flush_translation_cache(
+    admin_user: User = Depends(get_current_admin)
+):
+    """번역 캐시 전체 무효화 (네임스페이스 버전 증가 - 키를 지우지 않음)"""
+    service = await translation_service.get()
+    version = await service.clear_cache()
+    return {"version": version}
+
+@router.post("/translation/cache/purge")
+async def purge_translation_cache(
+    pattern: str = Query(..., min_length=1, description="삭제할 키 패턴 (translation:*{pattern}*)"),
+    admin_user: User = Depends(get_current_admin)
+):
+    """패턴에 맞는 번역 캐시 키를 백그라운드에서 SCAN + UNLINK로 삭제"""
+    service = await translation_service.get()
+    job_id = service.cache.start_purge(f"translation:*{pattern}*")
+    return {"job_id": job_id}
+
+@router.get("/translation/cache/purge/{job_id}")
+async def get_translation_cache_purge_status(
+    job_id: str,
+    admin_user: User = Depends(get_current_admin)
+):
+    """번역 캐시 삭제 작업 진행 상황 (scanned, deleted, status)"""
+    service = await translation_service.get()
+    progress = await service.cache.purge_status(job_id)
+    if progress is None:
+        raise HTTPException(status_code=404, detail="삭제 작업을 찾을 수 없습니다")
+    return progress
+
+@router.get("/translation/read-stats")
+async def get_translation_read_stats(
+    db: Session = Depends(get_db),
+    admin_user: User = Depends(get_current_admin)
+):
+    """카테고리별 원문 언어 / 독자 언어 상세 조회 수 (번역 방식 결정용)"""
+    stats = await read_stats.snapshot()
+    categories = {
+        category.id: category.slug
+        for category in db.query(Category).filter(Category.id.in_({item["category_id"] for item in stats})).all()
+    }
+    for item in stats:
+        item["category_slug"] = categories.get(item["category_id"])
+        item["translated"] = item["reader_lang"] not in (item["source_lang"], "guest")
+    return stats
+
+@router.get("/translation/usage")
+async def get_translation_usage(
+    user_id: Optional[int] = None,
+    admin_user: User = Depends(get_current_admin)
+):
+    """
+    번역 문자 수 사용량
+
+    global/user: 롤링 윈도별 한도 사용량 (전체 워커 합산)
+    providers: 프로바이더별 전송 문자 수, 캐시로 절약한 문자 수, 지연 시간 (워커별 값)
+    """
+    service = await translation_service.get()
+    providers = []
+    for status in service.router.status():
+        providers.append({
+            "provider": status["provider"],
+            "chars_sent": status["chars_sent"],
+            "chars_saved": metrics.counter("translation_chars_saved_total", provider=status["provider"]).snapshot(),
+            "latency": metrics.histogram("translation_router_latency_seconds", provider=status["provider"]).snapshot(),
+        })
+
+    usage = {
+        "global": await translation_quota.usage("global", global_windows()),
+        "providers": providers,
+    }
+    if user_id is not None:
+        usage["user"] = await translation_quota.usage(f"user:{user_id}", user_windows())
+    return usage
+
 @router.post("/test-deepl")
 async def test_deepl_connection(
     db: Session = Depends(get_db),
@@ -660,6 +806,7 @@ async def create_category(
     db.add(new_category)
     db.commit()
     db.refresh(new_category)
+    await response_cache.invalidate(CATEGORY_TAGS)
 
     return new_category
 
@@ -696,6 +843,7 @@ async def update_category(
     category.updated_at = datetime.utcnow()
     db.commit()
     db.refresh(category)
+    await response_cache.invalidate(CATEGORY_TAGS)
 
     return category
 
@@ -722,9 +870,11 @@ async def delete_category(
         category.is_active = False
         category.updated_at = datetime.utcnow()
         db.commit()
+        await response_cache.invalidate(CATEGORY_TAGS)
         return {"message": "카테고리가 비활성화되었습니다 (게시글이 존재함)"}
     else:
         # 실제 삭제
         db.delete(category)
         db.commit()
+        await response_cache.invalidate(CATEGORY_TAGS)
         return {"message": "카테고리가 삭제되었습니다"}
\ No newline at end of file
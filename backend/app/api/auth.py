@@ -1,18 +1,23 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import JWTError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 from typing import Optional
+import asyncio
 import httpx
 import secrets
 
-from app.db.database import get_db
+from app.db.database import get_async_db
 from app.core.security import (
     create_access_token, create_refresh_token,
     verify_password, get_password_hash,
-    verify_token, generate_verification_token,
-    generate_jti
+    verify_access_token, generate_verification_token,
+    generate_jti, revoke_jti
 )
+from app.core.dependencies import security
 from app.core.config import settings
 from app.models import User, Session as UserSession, EmailVerification, OAuthProvider
 from app.schemas.auth import (
@@ -28,21 +33,24 @@ router = APIRouter()
 @router.post("/email/register", response_model=TokenResponse)
 async def register(
     user_data: UserRegister,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # 이메일 중복 확인
-    if db.query(User).filter(User.email == user_data.email).first():
+    result = await db.execute(select(User.id).where(User.email == user_data.email))
+    if result.first():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 등록된 이메일입니다"
         )
 
     # 사용자명 중복 확인
-    if user_data.username and db.query(User).filter(User.username == user_data.username).first():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="이미 사용 중인 사용자명입니다"
-        )
+    if user_data.username:
+        result = await db.execute(select(User.id).where(User.username == user_data.username))
+        if result.first():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="이미 사용 중인 사용자명입니다"
+            )
 
     # 비밀번호 검증
     if not validate_password(user_data.password):
@@ -55,7 +63,7 @@ async def register(
     nickname_ko, nickname_ru = transliterate_nickname(user_data.nickname)
 
     # 사용자 생성
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await asyncio.to_thread(get_password_hash, user_data.password)
     user = User(
         email=user_data.email,
         username=user_data.username,
@@ -68,8 +76,7 @@ async def register(
         user_type='REAL'  # 실제 가입회원으로 설정
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
 
     # 이메일 인증 토큰 생성
     verification = EmailVerification(
@@ -79,7 +86,7 @@ async def register(
         expires_at=datetime.utcnow() + timedelta(hours=24)
     )
     db.add(verification)
-    db.commit()
+    await db.commit()
 
     # 인증 이메일 발송
     await send_verification_email(user.email, verification.token)
@@ -98,7 +105,7 @@ async def register(
         expires_at=datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     )
     db.add(session)
-    db.commit()
+    await db.commit()
 
     return TokenResponse(
         access_token=access_token,
@@ -111,11 +118,13 @@ async def register(
 async def login(
     credentials: UserLogin,
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     # 사용자 조회
-    user = db.query(User).filter(User.email == credentials.email).first()
-    if not user or not verify_password(credentials.password, user.password_hash):
+    result = await db.execute(select(User).where(User.email == credentials.email))
+    user = result.scalars().first()
+    # bcrypt 검증은 CPU를 오래 쓰므로 이벤트 루프 밖에서 실행
+    if not user or not await asyncio.to_thread(verify_password, credentials.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="이메일 또는 비밀번호가 올바르지 않습니다"
@@ -129,7 +138,7 @@ async def login(
 
     # 로그인 시간 업데이트
     user.last_login_at = datetime.utcnow()
-    db.commit()
+    await db.commit()
 
     # 토큰 생성
     access_jti = generate_jti()
@@ -147,7 +156,7 @@ async def login(
         expires_at=datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     )
     db.add(session)
-    db.commit()
+    await db.commit()
 
     return TokenResponse(
         access_token=access_token,
@@ -156,6 +165,38 @@ async def login(
         expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
     )
 
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """로그아웃 - 현재 세션 삭제 및 토큰 폐기"""
+    if not credentials:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증 토큰이 필요합니다",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    try:
+        payload = await verify_access_token(credentials.credentials)
+    except JWTError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않은 토큰입니다",
+        )
+
+    jti = payload.get("jti")
+    result = await db.execute(select(UserSession).where(UserSession.access_token_jti == jti))
+    session = result.scalars().first()
+    if session:
+        await revoke_jti(session.refresh_token_jti, session.expires_at)
+        await db.delete(session)
+        await db.commit()
+
+    await revoke_jti(jti, datetime.utcfromtimestamp(payload["exp"]))
+    return None
+
 @router.get("/oauth/{provider}")
 async def oauth_login(provider: str):
     """소셜 로그인 URL 리다이렉트"""
@@ -213,7 +254,7 @@ async def oauth_callback(
     provider: str,
     callback_data: OAuthCallback,
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """소셜 로그인 콜백 처리"""
     user_info = None
@@ -235,15 +276,19 @@ async def oauth_callback(
         )
 
     # 기존 사용자 확인
-    user = db.query(User).filter(
-        User.oauth_provider == provider,
-        User.oauth_uid == str(user_info["id"])
-    ).first()
+    result = await db.execute(
+        select(User).where(
+            User.oauth_provider == provider,
+            User.oauth_uid == str(user_info["id"])
+        )
+    )
+    user = result.scalars().first()
 
     if not user:
         # 이메일로 기존 계정 확인
         if user_info.get("email"):
-            user = db.query(User).filter(User.email == user_info["email"]).first()
+            result = await db.execute(select(User).where(User.email == user_info["email"]))
+            user = result.scalars().first()
 
         if not user:
             # 닉네임 음역
@@ -264,17 +309,16 @@ async def oauth_callback(
                 user_type='REAL'  # 실제 가입회원으로 설정
             )
             db.add(user)
-            db.commit()
-            db.refresh(user)
+            await db.commit()
         else:
             # OAuth 정보 업데이트
             user.oauth_provider = provider
             user.oauth_uid = str(user_info["id"])
-            db.commit()
+            await db.commit()
 
     # 로그인 처리
     user.last_login_at = datetime.utcnow()
-    db.commit()
+    await db.commit()
 
     # 토큰 생성
     access_jti = generate_jti()
@@ -292,7 +336,7 @@ async def oauth_callback(
         expires_at=datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     )
     db.add(session)
-    db.commit()
+    await db.commit()
 
     return TokenResponse(
         access_token=access_token,
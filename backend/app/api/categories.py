@@ -1,15 +1,30 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+import json
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from app.db.database import get_db
+from app.db.database import get_async_db
 from app.models import Category
+from app.services.response_cache import response_cache, CATEGORY_TAGS
+from app.utils.etag import etag_matches, not_modified
+from app.utils.responses import RawJSONResponse
 
 router = APIRouter()
 
 @router.get("/")
-async def get_categories(db: Session = Depends(get_db)):
-    categories = db.query(Category).filter(Category.is_active == True).order_by(Category.sort_order).all()
-    return [
+async def get_categories(request: Request, db: AsyncSession = Depends(get_async_db)):
+    """활성 카테고리 목록 (사용자와 무관하므로 응답 캐시 사용, If-None-Match 지원)"""
+    cached = await response_cache.get_or_build("categories", {}, CATEGORY_TAGS, _build_categories, db)
+    if etag_matches(request, cached.etag):
+        return not_modified(cached.etag)
+    return RawJSONResponse(cached.body, headers={"ETag": cached.etag, "Cache-Control": "no-cache"})
+
+async def _build_categories(db: AsyncSession) -> bytes:
+    result = await db.execute(
+        select(Category).where(Category.is_active == True).order_by(Category.sort_order)
+    )
+    categories = result.scalars().all()
+    data = [
         {
             "id": cat.id,
             "slug": cat.slug,
@@ -26,4 +41,5 @@ async def get_categories(db: Session = Depends(get_db)):
             "permission": cat.permission.value if hasattr(cat.permission, 'value') else str(cat.permission)
         }
         for cat in categories
-    ]
\ No newline at end of file
+    ]
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
@@ -4,9 +4,10 @@
 import json
 import os
 from pathlib import Path
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import JSONResponse
 from typing import Dict, Any
+from app.utils.etag import etag_matches, make_etag, not_modified
 
 router = APIRouter()
 
@@ -31,12 +32,18 @@ async def save_board_data(data: Dict[str, Any]):
         raise HTTPException(status_code=500, detail=f"데이터 저장 실패: {str(e)}")
 
 @router.get("/load")
-async def load_board_data():
-    """서버에서 게시판 데이터 로드"""
+async def load_board_data(request: Request):
+    """서버에서 게시판 데이터 로드 (ETag는 파일 수정 시각과 크기로 계산 - 변경 없으면 파일을 읽지 않고 304)"""
     try:
-        if not DATA_FILE.exists():
+        stat = DATA_FILE.stat() if DATA_FILE.exists() else None
+        etag = make_etag(stat.st_mtime_ns, stat.st_size) if stat else make_etag("empty")
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+        if stat is None:
             # 파일이 없으면 빈 데이터 반환
-            return {
+            return JSONResponse({
                 "freeboard": [],
                 "qna": [],
                 "lifeinfo": [],
@@ -44,12 +51,12 @@ async def load_board_data():
                 "jobs": [],
                 "marketplace": [],
                 "partners": []
-            }
+            }, headers=headers)
 
         with open(DATA_FILE, 'r', encoding='utf-8') as f:
             data = json.load(f)
 
-        return data
+        return JSONResponse(data, headers=headers)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"데이터 로드 실패: {str(e)}")
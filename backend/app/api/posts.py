@@ -1,16 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, load_only, with_expression
+from sqlalchemy import asc, case, desc, func, select, tuple_
+from typing import List, Optional, Union
 from datetime import datetime
 import re
 
-from app.db.database import get_db
-from app.models.post import Post, PostStatus, Category
+from app.core.config import settings
+from app.db.database import get_async_db
+from app.models.post import Post, PostStatus, Category, TranslationStatus
 from app.models.user import User
-from app.schemas.post import PostCreate, PostUpdate, PostResponse, PostListResponse
-from app.services.translation import translation_service
+from app.schemas.post import (
+    PostCreate, PostUpdate, PostResponse, PostListResponse,
+    PostLocalizedResponse, PostLocalizedListResponse, EXCERPT_LENGTH
+)
+from app.services.translation_queue import translation_queue, translate_post, POST_FIELDS
+from app.services.post_blob_cache import post_blob_cache
+from app.services.read_stats import read_stats
+from app.services.response_cache import response_cache, post_list_tags, post_tags
+from app.services.post_counter import post_counter
+from app.services.view_counter import view_counter
+from app.utils.etag import etag_matches, make_etag, not_modified
 from app.utils.logger import setup_logger
+from app.utils.responses import RawJSONResponse
+from app.utils.pagination import encode_cursor, decode_cursor, CURSOR_NEXT, CURSOR_PREV
 from app.core.dependencies import get_current_user, get_optional_current_user
 
 logger = setup_logger(__name__)
@@ -23,18 +36,120 @@ def generate_slug(title: str, post_id: int) -> str:
     slug = re.sub(r'[-\s]+', '-', slug)
     return f"{slug[:50]}-{post_id}"
 
+async def _get_post_with_author(db: AsyncSession, post_id: int) -> Optional[Post]:
+    """작성자 정보를 함께 로드한 게시글 조회 (비동기 세션은 지연 로딩 불가)"""
+    result = await db.execute(
+        select(Post)
+        .options(joinedload(Post.author))
+        .where(Post.id == post_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalars().first()
+
+# 목록에서 읽는 컬럼 (본문과 번역 본문은 제외 - PostListItem 참고)
+LIST_COLUMNS = (
+    Post.id, Post.user_id, Post.category_id, Post.slug, Post.status, Post.source_lang,
+    Post.auto_translated, Post.translation_status, Post.is_pinned, Post.is_featured,
+    Post.view_count, Post.like_count, Post.comment_count,
+    Post.created_at, Post.updated_at, Post.published_at,
+)
+# 두 언어 모두 응답할 때 추가로 읽는 컬럼
+BILINGUAL_LIST_COLUMNS = (
+    Post.title, Post.summary,
+    Post.translated_title_ko, Post.translated_title_ru,
+    Post.translated_summary_ko, Post.translated_summary_ru,
+)
+# ?lang=ko|ru 상세 조회에서 읽는 컬럼 (제목/본문/요약은 localized_*로 한 언어만)
+LOCALIZED_DETAIL_COLUMNS = LIST_COLUMNS + (
+    Post.tags, Post.images, Post.attachments, Post.allow_comments, Post.share_count,
+)
+AUTHOR_SUMMARY_COLUMNS = (User.id, User.username, User.nickname, User.profile_image)
+
+# 목록 정렬 (고정글 먼저, 최신순) - 페이지/커서 방식 공통, ix_posts_board_order 인덱스 순서
+BOARD_ORDER = (desc(Post.is_pinned), desc(Post.created_at), desc(Post.id))
+
+# 발췌문용으로 DB에서 잘라 읽는 길이 (HTML 태그 제거 전이라 여유 있게)
+EXCERPT_SOURCE_LENGTH = EXCERPT_LENGTH * 4
+
+def _resolve_lang(lang: Optional[str]) -> Optional[str]:
+    """응답 언어 - lang=ko|ru일 때만 한 언어로, 없거나 all이면 None (두 언어 모두, 기존 응답 형태)"""
+    if lang in ("ko", "ru"):
+        return lang
+    return None
+
+def _localized(field: str, lang: str):
+    """원문 언어면 원문, 아니면 번역문 (번역 전이면 원문) - DB에서 고른 컬럼 하나만 전송"""
+    original = getattr(Post, field)
+    translated = getattr(Post, f"translated_{field}_{lang}")
+    return case(
+        (func.coalesce(Post.source_lang, "ko") == lang, original),
+        else_=func.coalesce(translated, original)
+    )
+
+def _list_query(lang: Optional[str]):
+    """목록용 쿼리 - 필요한 컬럼과 본문 앞부분만 읽음 (lang이 있으면 그 언어만)"""
+    options = [joinedload(Post.author).load_only(*AUTHOR_SUMMARY_COLUMNS)]
+    if lang:
+        options += [
+            load_only(*LIST_COLUMNS),
+            with_expression(Post.localized_title, _localized("title", lang)),
+            with_expression(Post.localized_summary, _localized("summary", lang)),
+            with_expression(Post.localized_content, func.substr(_localized("content", lang), 1, EXCERPT_SOURCE_LENGTH)),
+        ]
+    else:
+        options += [
+            load_only(*LIST_COLUMNS, *BILINGUAL_LIST_COLUMNS),
+            with_expression(Post.excerpt_ko, func.substr(_localized("content", "ko"), 1, EXCERPT_SOURCE_LENGTH)),
+            with_expression(Post.excerpt_ru, func.substr(_localized("content", "ru"), 1, EXCERPT_SOURCE_LENGTH)),
+        ]
+    return select(Post).options(*options)
+
+def _list_response(posts: List[Post], lang: Optional[str], **fields):
+    if lang:
+        return PostLocalizedListResponse(items=posts, lang=lang, **fields)
+    return PostListResponse(items=posts, **fields)
+
+async def _get_post_version(db: AsyncSession, post_id: int):
+    """상세 조회 권한/캐시 확인에 필요한 컬럼만 조회 (게시글/작성자 updated_at이 응답 버전)"""
+    result = await db.execute(
+        select(
+            Post.category_id, Post.source_lang, Post.translation_status, Post.view_count,
+            Post.updated_at, User.updated_at.label("author_updated_at")
+        )
+        .outerjoin(User, User.id == Post.user_id)
+        .where(Post.id == post_id)
+    )
+    return result.first()
+
+async def _get_localized_post(db: AsyncSession, post_id: int, lang: str) -> Optional[Post]:
+    """제목/본문/요약을 lang 한 언어로만 읽는 게시글 조회"""
+    result = await db.execute(
+        select(Post)
+        .options(
+            load_only(*LOCALIZED_DETAIL_COLUMNS),
+            joinedload(Post.author),
+            with_expression(Post.localized_title, _localized("title", lang)),
+            with_expression(Post.localized_content, _localized("content", lang)),
+            with_expression(Post.localized_summary, _localized("summary", lang)),
+        )
+        .where(Post.id == post_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalars().first()
+
 @router.post("/", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
 async def create_post(
     post_data: PostCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """게시글 생성 및 자동 번역 (로그인 필수)"""
+    """게시글 생성 및 자동 번역 요청 (로그인 필수, 번역은 백그라운드에서 처리)"""
     try:
         # category_slug가 제공된 경우 category_id로 변환
         category_id = post_data.category_id
         if post_data.category_slug and not category_id:
-            category = db.query(Category).filter(Category.slug == post_data.category_slug).first()
+            result = await db.execute(select(Category).where(Category.slug == post_data.category_slug))
+            category = result.scalars().first()
             if not category:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -49,7 +164,7 @@ async def create_post(
                 detail="category_id 또는 category_slug가 필요합니다"
             )
 
-        category = db.query(Category).filter(Category.id == category_id).first()
+        category = await db.get(Category, category_id)
         if not category:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -81,116 +196,217 @@ async def create_post(
         )
 
         db.add(new_post)
-        db.flush()  # ID 생성
+        await db.flush()  # ID 생성
 
         # Slug 생성
         new_post.slug = generate_slug(post_data.title, new_post.id)
 
-        # 자동 번역 처리
+        # 자동 번역은 커밋 후 백그라운드 작업으로, on_read 모드에서는 처음 읽을 때 처리
+        # (원문 언어 필드는 바로 채움)
         if post_data.auto_translate:
-            try:
-                # 원문 언어 확인
-                source_lang = post_data.source_lang
-                target_lang = "ru" if source_lang == "ko" else "ko"
-
-                # 제목 번역
-                title_result = await translation_service.translate_text(
-                    post_data.title,
-                    target_lang=target_lang,
-                    source_lang=source_lang
-                )
+            for field in POST_FIELDS:
+                setattr(new_post, f"translated_{field}_{post_data.source_lang}", getattr(new_post, field))
+            new_post.translation_status = _deferred_translation_status()
+        else:
+            new_post.translation_status = TranslationStatus.NONE
 
-                # 내용 번역
-                content_result = await translation_service.translate_text(
-                    post_data.content,
-                    target_lang=target_lang,
-                    source_lang=source_lang
-                )
+        await db.commit()
+        await post_counter.adjust(new_post.category_id, new_post.status, 1)
+        await response_cache.invalidate(post_tags(new_post.category_id))
+        if new_post.translation_status == TranslationStatus.PENDING:
+            await translation_queue.enqueue(new_post.id)
 
-                # 요약 번역 (있는 경우)
-                summary_result = None
-                if post_data.summary:
-                    summary_result = await translation_service.translate_text(
-                        post_data.summary,
-                        target_lang=target_lang,
-                        source_lang=source_lang
-                    )
-
-                # 번역 결과 저장
-                if source_lang == "ko":
-                    # 한국어가 원문인 경우
-                    new_post.translated_title_ko = post_data.title
-                    new_post.translated_content_ko = post_data.content
-                    new_post.translated_summary_ko = post_data.summary
-                    new_post.translated_title_ru = title_result["translated_text"]
-                    new_post.translated_content_ru = content_result["translated_text"]
-                    new_post.translated_summary_ru = summary_result["translated_text"] if summary_result else None
-                else:
-                    # 러시아어가 원문인 경우
-                    new_post.translated_title_ru = post_data.title
-                    new_post.translated_content_ru = post_data.content
-                    new_post.translated_summary_ru = post_data.summary
-                    new_post.translated_title_ko = title_result["translated_text"]
-                    new_post.translated_content_ko = content_result["translated_text"]
-                    new_post.translated_summary_ko = summary_result["translated_text"] if summary_result else None
-
-                new_post.auto_translated = True
-                logger.info(f"게시글 ID {new_post.id} 자동 번역 완료: {source_lang} → {target_lang}")
-
-            except Exception as e:
-                logger.error(f"게시글 번역 실패: {e}")
-                # 번역 실패 시에도 게시글은 저장
-                new_post.auto_translated = False
-
-        db.commit()
-        db.refresh(new_post)
-
-        return new_post
+        return await _get_post_with_author(db, new_post.id)
 
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"게시글 생성 실패: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="게시글 생성 중 오류가 발생했습니다"
         )
 
-@router.get("/", response_model=PostListResponse)
+def _deferred_translation_status() -> TranslationStatus:
+    """작성/수정 시 번역 상태 - 읽을 때 번역 모드면 ON_DEMAND, 아니면 백그라운드 작업(PENDING)"""
+    if settings.TRANSLATION_MODE == "on_read":
+        return TranslationStatus.ON_DEMAND
+    return TranslationStatus.PENDING
+
+async def _translate_on_read(db: AsyncSession, post: Post):
+    """번역이 없는 필드만 번역해 저장 (동일 텍스트 동시 요청은 번역 서비스에서 한 번만 실행)"""
+    target_lang = "ru" if (post.source_lang or "ko") == "ko" else "ko"
+    fields = [field for field in POST_FIELDS if getattr(post, f"translated_{field}_{target_lang}") is None]
+    try:
+        if await translate_post(db, post, fields):
+            await db.commit()
+            await response_cache.invalidate(post_tags(post.category_id))
+    except Exception as e:
+        # 이번 응답은 원문으로, 번역은 백그라운드 작업으로 재시도
+        logger.warning(f"게시글 ID {post.id} 읽기 시 번역 실패: {e}")
+        await translation_queue.enqueue(post.id, fields)
+
+async def _get_posts_by_cursor(
+    db: AsyncSession, query, cursor: Optional[str], page_size: int, total: int, lang: Optional[str]
+) -> PostListResponse:
+    """키셋 페이지네이션 - ix_posts_board_order 인덱스를 따라 page_size + 1개만 읽음"""
+    sort_key = tuple_(Post.is_pinned, Post.created_at, Post.id)
+    direction = CURSOR_NEXT
+
+    if cursor:
+        decoded = decode_cursor(cursor)
+        if decoded is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="유효하지 않은 커서입니다"
+            )
+        is_pinned, created_at, post_id, direction = decoded
+        cursor_key = tuple_(is_pinned, created_at, post_id)
+        if direction == CURSOR_NEXT:
+            query = query.where(sort_key < cursor_key)
+        else:
+            query = query.where(sort_key > cursor_key)
+
+    if direction == CURSOR_NEXT:
+        order = BOARD_ORDER
+    else:
+        order = [asc(Post.is_pinned), asc(Post.created_at), asc(Post.id)]
+
+    result = await db.execute(query.order_by(*order).limit(page_size + 1))
+    posts = list(result.scalars().all())
+    has_more = len(posts) > page_size
+    posts = posts[:page_size]
+    if direction == CURSOR_PREV:
+        posts.reverse()
+
+    next_cursor = None
+    prev_cursor = None
+    if posts:
+        first, last = posts[0], posts[-1]
+        if direction == CURSOR_NEXT:
+            has_next, has_prev = has_more, cursor is not None
+        else:
+            # 뒤 페이지에서 돌아온 경우 다음 페이지는 항상 존재
+            has_next, has_prev = True, has_more
+
+        if has_next:
+            next_cursor = encode_cursor(last.is_pinned, last.created_at, last.id, CURSOR_NEXT)
+        if has_prev:
+            prev_cursor = encode_cursor(first.is_pinned, first.created_at, first.id, CURSOR_PREV)
+
+    return _list_response(
+        posts,
+        lang,
+        total=total,
+        page_size=page_size,
+        total_pages=(total + page_size - 1) // page_size,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor
+    )
+
+def _list_etag(listing: PostListResponse) -> str:
+    """목록 ETag - 항목별 버전 (id, updated_at, 카운트, 작성자)과 페이지 정보로 계산 (본문 직렬화 없음)"""
+    return make_etag(
+        getattr(listing, "lang", None),
+        listing.total, listing.page, listing.page_size, listing.next_cursor, listing.prev_cursor,
+        [
+            (
+                item.id, item.updated_at, item.translation_status,
+                item.view_count, item.like_count, item.comment_count,
+                item.author.model_dump() if item.author else None,
+            )
+            for item in listing.items
+        ]
+    )
+
+async def _list_posts(
+    db: AsyncSession,
+    page: int,
+    page_size: int,
+    category_id: Optional[int],
+    status_filter: Optional[PostStatus],
+    use_cursor: bool,
+    cursor: Optional[str],
+    lang: Optional[str]
+) -> PostListResponse:
+    # 기본 쿼리 (목록 컬럼 + 작성자 요약, 본문 제외)
+    query = _list_query(lang)
+
+    # 필터 적용
+    if category_id:
+        query = query.where(Post.category_id == category_id)
+    if status_filter:
+        query = query.where(Post.status == status_filter)
+
+    # 전체 개수 (카운터 저장소에서 조회 - COUNT 쿼리 없음)
+    total = await post_counter.get_total(db, category_id, status_filter)
+
+    # 커서 방식: (is_pinned, created_at, id) 키셋으로 OFFSET 없이 조회
+    if use_cursor:
+        return await _get_posts_by_cursor(db, query, cursor, page_size, total, lang)
+
+    # 페이징
+    offset = (page - 1) * page_size
+    result = await db.execute(query.order_by(*BOARD_ORDER).offset(offset).limit(page_size))
+    posts = result.scalars().all()
+
+    return _list_response(
+        posts,
+        lang,
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=(total + page_size - 1) // page_size
+    )
+
+# Union 순서 주의: lang이 필수인 언어별 응답을 먼저 검사
+@router.get("/", response_model=Union[PostLocalizedListResponse, PostListResponse])
 async def get_posts(
+    request: Request,
+    http_response: Response,
     page: int = 1,
-    page_size: int = 20,
+    page_size: int = Query(20, ge=1, le=100),
     category_id: Optional[int] = None,
     status_filter: Optional[PostStatus] = PostStatus.PUBLISHED,
+    pagination: str = Query("page", pattern="^(page|cursor)$", description="page: 오프셋 방식, cursor: 키셋 방식"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor 또는 prev_cursor"),
+    lang: Optional[str] = Query(None, pattern="^(ko|ru|all)$", description="응답 언어 (ko|ru: 한 언어만, 기본 또는 all: 두 언어 모두)"),
     current_user: Optional[User] = Depends(get_optional_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """게시글 목록 조회 (로그인 불필요)"""
+    """게시글 목록 조회 (로그인 불필요, 비로그인 앞쪽 페이지는 응답 캐시 사용, If-None-Match 지원)"""
     try:
-        # 기본 쿼리 (author 정보 포함)
-        query = db.query(Post).options(joinedload(Post.author))
-
-        # 필터 적용
-        if category_id:
-            query = query.filter(Post.category_id == category_id)
-        if status_filter:
-            query = query.filter(Post.status == status_filter)
-
-        # 전체 개수
-        total = query.count()
-
-        # 페이징
-        offset = (page - 1) * page_size
-        posts = query.order_by(desc(Post.created_at)).offset(offset).limit(page_size).all()
-
-        return PostListResponse(
-            items=posts,
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=(total + page_size - 1) // page_size
-        )
+        lang = _resolve_lang(lang)
+        use_cursor = bool(cursor) or pagination == "cursor"
+
+        async def build(session: AsyncSession):
+            return await _list_posts(session, page, page_size, category_id, status_filter, use_cursor, cursor, lang)
+
+        if current_user is None and not use_cursor and page <= settings.RESPONSE_CACHE_MAX_PAGE:
+            params = {
+                "page": page,
+                "page_size": page_size,
+                "category_id": category_id,
+                "status_filter": status_filter.value if status_filter else None,
+                "lang": lang,
+            }
+
+            async def build_bytes(session: AsyncSession) -> bytes:
+                return (await build(session)).model_dump_json().encode()
+
+            cached = await response_cache.get_or_build("posts", params, post_list_tags(category_id), build_bytes, db)
+            if etag_matches(request, cached.etag):
+                return not_modified(cached.etag)
+            return RawJSONResponse(cached.body, headers={"ETag": cached.etag, "Cache-Control": "no-cache"})
+
+        listing = await build(db)
+        etag = _list_etag(listing)
+        if etag_matches(request, etag):
+            return not_modified(etag, "private, no-cache")
+        http_response.headers["ETag"] = etag
+        http_response.headers["Cache-Control"] = "private, no-cache"
+        return listing
 
     except HTTPException:
         raise
@@ -206,15 +422,23 @@ async def get_posts(
             detail=f"게시글 목록을 불러오는 중 오류가 발생했습니다: {str(e)}"
         )
 
-@router.get("/{post_id}", response_model=PostResponse)
+# Union 순서 주의: translated_* 필드를 허용하지 않는 언어별 응답을 먼저 검사
+@router.get("/{post_id}", response_model=Union[PostLocalizedResponse, PostResponse])
 async def get_post(
     post_id: int,
+    request: Request,
+    lang: Optional[str] = Query(None, pattern="^(ko|ru|all)$", description="응답 언어 (ko|ru: 한 언어만, 기본 또는 all: 두 언어 모두)"),
     current_user: Optional[User] = Depends(get_optional_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """게시글 상세 조회 (공지사항 외 로그인 필수)"""
-    post = db.query(Post).options(joinedload(Post.author)).filter(Post.id == post_id).first()
-    if not post:
+    """
+    게시글 상세 조회 (공지사항 외 로그인 필수, If-None-Match 지원)
+
+    버전 컬럼만 먼저 읽고, 직렬화된 응답이 캐시에 있으면 조회수만 바꿔 그대로 보낸다.
+    """
+    lang = _resolve_lang(lang)
+    version = await _get_post_version(db, post_id)
+    if not version:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="게시글을 찾을 수 없습니다"
@@ -222,7 +446,7 @@ async def get_post(
 
     # 로그인 하지 않은 경우, 공지사항만 조회 가능
     if not current_user:
-        category = db.query(Category).filter(Category.id == post.category_id).first()
+        category = await db.get(Category, version.category_id)
         if not category or category.slug != "notice":
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -230,21 +454,51 @@ async def get_post(
                 headers={"WWW-Authenticate": "Bearer"}
             )
 
-    # 조회수 증가
-    post.view_count += 1
-    db.commit()
-
-    return post
+    # 조회수 증가 (버퍼에 쌓고 주기적으로 DB에 반영 - 목록과 같이 반영된 값만 응답)
+    await view_counter.increment(post_id)
+
+    # 언어별 조회 통계
+    source_lang = version.source_lang or "ko"
+    reader_lang = current_user.preferred_lang.value if current_user and current_user.preferred_lang else None
+    await read_stats.record(version.category_id, source_lang, reader_lang or "guest")
+
+    # 읽을 때 번역: 원문과 다른 언어로 처음 읽을 때 번역해 저장 (번역 후 버전 다시 조회)
+    read_lang = lang or reader_lang
+    if version.translation_status == TranslationStatus.ON_DEMAND and read_lang and read_lang != source_lang:
+        await _translate_on_read(db, await _get_post_with_author(db, post_id))
+        version = await _get_post_version(db, post_id)
+
+    # 조회수는 읽을 때마다 바뀌므로 제외한 약한 ETag (조회수 차이는 같은 표현으로 봄)
+    etag = make_etag(post_id, version.updated_at, version.author_updated_at, lang, weak=True)
+    if etag_matches(request, etag):
+        return not_modified(etag, "private, no-cache")
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    view_count = version.view_count or 0
+
+    blob = await post_blob_cache.get(post_id, version.updated_at, version.author_updated_at, lang)
+    if blob is None:
+        if lang:
+            post = await _get_localized_post(db, post_id, lang)
+            response = PostLocalizedResponse.model_validate(post)
+            response.lang = lang
+        else:
+            post = await _get_post_with_author(db, post_id)
+            response = PostResponse.model_validate(post)
+        # 버전은 실제로 직렬화한 행 기준 (그 사이 수정되었으면 새 버전 키로 저장)
+        author_updated_at = post.author.updated_at if post.author else None
+        blob = await post_blob_cache.set(post_id, post.updated_at, author_updated_at, lang, response)
+
+    return RawJSONResponse(blob.render(view_count), headers=headers)
 
 @router.put("/{post_id}", response_model=PostResponse)
 async def update_post(
     post_id: int,
     post_data: PostUpdate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """게시글 수정 및 재번역 (로그인 필수, 작성자 또는 관리자만)"""
-    post = db.query(Post).filter(Post.id == post_id).first()
+    """게시글 수정 및 재번역 요청 (로그인 필수, 작성자 또는 관리자만)"""
+    post = await db.get(Post, post_id)
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -252,7 +506,7 @@ async def update_post(
         )
 
     # 공지사항은 관리자만 수정 가능
-    category = db.query(Category).filter(Category.id == post.category_id).first()
+    category = await db.get(Category, post.category_id)
     if category and category.slug == "notice":
         if current_user.role.value not in ["admin", "moderator"]:
             raise HTTPException(
@@ -271,63 +525,44 @@ async def update_post(
         # 수정 가능한 필드 업데이트
         update_data = post_data.model_dump(exclude_unset=True, exclude={'auto_translate'})
 
-        # 제목이나 내용이 변경된 경우 재번역
-        needs_retranslation = False
-        if 'title' in update_data or 'content' in update_data:
-            needs_retranslation = post_data.auto_translate
+        # 제목, 내용, 요약이 변경된 경우 재번역
+        retranslate_fields = []
+        if post_data.auto_translate:
+            retranslate_fields = [field for field in POST_FIELDS if field in update_data]
 
+        old_category_id, old_status = post.category_id, post.status
         for field, value in update_data.items():
             setattr(post, field, value)
 
-        # 재번역 처리
-        if needs_retranslation:
-            try:
-                source_lang = post.source_lang
-                target_lang = "ru" if source_lang == "ko" else "ko"
-
-                # 제목 번역 (변경된 경우)
-                if 'title' in update_data:
-                    title_result = await translation_service.translate_text(
-                        post.title,
-                        target_lang=target_lang,
-                        source_lang=source_lang
-                    )
-                    if source_lang == "ko":
-                        post.translated_title_ko = post.title
-                        post.translated_title_ru = title_result["translated_text"]
-                    else:
-                        post.translated_title_ru = post.title
-                        post.translated_title_ko = title_result["translated_text"]
-
-                # 내용 번역 (변경된 경우)
-                if 'content' in update_data:
-                    content_result = await translation_service.translate_text(
-                        post.content,
-                        target_lang=target_lang,
-                        source_lang=source_lang
-                    )
-                    if source_lang == "ko":
-                        post.translated_content_ko = post.content
-                        post.translated_content_ru = content_result["translated_text"]
-                    else:
-                        post.translated_content_ru = post.content
-                        post.translated_content_ko = content_result["translated_text"]
-
-                post.auto_translated = True
-                logger.info(f"게시글 ID {post_id} 재번역 완료")
-
-            except Exception as e:
-                logger.error(f"게시글 재번역 실패: {e}")
-
-        db.commit()
-        db.refresh(post)
-
-        return post
+        # 재번역은 커밋 후 백그라운드 작업으로, on_read 모드에서는 다음에 읽을 때 처리
+        if retranslate_fields:
+            target_lang = "ru" if post.source_lang == "ko" else "ko"
+            for field in retranslate_fields:
+                setattr(post, f"translated_{field}_{post.source_lang}", getattr(post, field))
+            post.translation_status = _deferred_translation_status()
+            if post.translation_status == TranslationStatus.ON_DEMAND:
+                # 이전 번역은 더 이상 맞지 않으므로 비워 두고 읽을 때 다시 번역
+                for field in retranslate_fields:
+                    setattr(post, f"translated_{field}_{target_lang}", None)
+
+        await db.commit()
+        await post_counter.move(old_category_id, old_status, post.category_id, post.status)
+        await response_cache.invalidate(post_tags(old_category_id, post.category_id))
+        if retranslate_fields and post.translation_status == TranslationStatus.PENDING:
+            await translation_queue.enqueue(post_id, retranslate_fields)
+
+        # 새 버전의 상세 응답을 미리 만들어 둠 (언어별 응답은 처음 조회할 때 생성)
+        post = await _get_post_with_author(db, post_id)
+        response = PostResponse.model_validate(post)
+        await post_blob_cache.set(
+            post_id, post.updated_at, post.author.updated_at if post.author else None, None, response
+        )
+        return response
 
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"게시글 수정 실패: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -338,10 +573,10 @@ async def update_post(
 async def delete_post(
     post_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """게시글 삭제 (로그인 필수, 작성자 또는 관리자만)"""
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = await db.get(Post, post_id)
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -349,7 +584,7 @@ async def delete_post(
         )
 
     # 공지사항은 관리자만 삭제 가능
-    category = db.query(Category).filter(Category.id == post.category_id).first()
+    category = await db.get(Category, post.category_id)
     if category and category.slug == "notice":
         if current_user.role.value not in ["admin", "moderator"]:
             raise HTTPException(
@@ -365,8 +600,11 @@ async def delete_post(
             )
 
     # 소프트 삭제
+    old_status = post.status
     post.status = PostStatus.DELETED
     post.deleted_at = datetime.utcnow()
-    db.commit()
+    await db.commit()
+    await post_counter.move(post.category_id, old_status, post.category_id, PostStatus.DELETED)
+    await response_cache.invalidate(post_tags(post.category_id))
 
     return None
\ No newline at end of file
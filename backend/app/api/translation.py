@@ -4,6 +4,7 @@ from pydantic import BaseModel
 from app.db.database import get_db
 from app.core.dependencies import get_current_user
 from app.services.translation import translation_service
+from app.services.translation_quota import translation_quota
 from app.models import User
 
 router = APIRouter()
@@ -19,14 +20,25 @@ async def translate_text(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
+    service = await translation_service.get()
+
     # Rate limiting 체크
-    if not await translation_service.check_rate_limit(current_user.id):
+    if not await service.check_rate_limit(current_user.id):
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="번역 요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요."
         )
 
-    result = await translation_service.translate_text(
+    # 사용자별 문자 수 한도 (롤링 윈도)
+    quota = await translation_quota.consume_user(current_user.id, len(request.text))
+    if not quota.allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"번역 문자 수 한도를 초과했습니다. ({quota.window}: {quota.used}/{quota.limit}자)",
+            headers={"Retry-After": str(int(quota.retry_after))}
+        )
+
+    result = await service.translate_text(
         request.text,
         request.target_lang,
         request.source_lang
@@ -36,6 +36,45 @@ class Settings(BaseSettings):
     GOOGLE_APPLICATION_CREDENTIALS: str = ""
     DEEPL_API_KEY: str = ""
     TRANSLATION_PROVIDER: str = "deepl"
+    TRANSLATION_MAX_CONCURRENCY: int = 8  # 동시에 실행할 프로바이더 호출 수
+    TRANSLATION_SETTINGS_POLL_SECONDS: int = 10  # SystemSettings 번역 설정 변경 확인 주기
+    # eager: 작성/수정 시 백그라운드 번역, on_read: 다른 언어 사용자가 처음 읽을 때 번역
+    TRANSLATION_MODE: str = "eager"
+
+    # 번역 캐시 (TTL은 SystemSettings의 translation_cache_ttl, translation_local_cache_ttl로 변경 가능)
+    TRANSLATION_CACHE_TTL_SECONDS: int = 86400
+    TRANSLATION_LOCAL_CACHE_TTL_SECONDS: int = 3600
+    TRANSLATION_LOCAL_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    TRANSLATION_CACHE_COMPRESS_MIN_BYTES: int = 1024  # 이 크기 이상인 값은 Redis에 zlib 압축 저장
+
+    # 번역 프로바이더 라우터
+    TRANSLATION_PROVIDER_TIMEOUT_SECONDS: float = 10.0  # 초과하면 실패로 보고 다음 프로바이더 시도
+    TRANSLATION_CIRCUIT_FAILURE_THRESHOLD: int = 5  # 연속 실패 시 서킷 열림
+    TRANSLATION_CIRCUIT_RESET_SECONDS: float = 30.0  # 서킷이 열린 뒤 시험 요청까지 대기
+    TRANSLATION_HEDGE_ENABLED: bool = False  # p95 지연 시간을 넘기면 대체 프로바이더에도 요청
+    TRANSLATION_HEDGE_DEFAULT_SECONDS: float = 2.0  # 지연 시간 관측이 부족할 때 헤지 기준
+
+    # 게시글 번역 작업 큐
+    TRANSLATION_WORKERS: int = 2  # 프로세스당 워커 수
+    TRANSLATION_JOB_MAX_ATTEMPTS: int = 5
+    TRANSLATION_JOB_RETRY_BASE_SECONDS: float = 5.0  # 재시도 대기 = base * 2^시도횟수 (최대 5분)
+    TRANSLATION_JOB_STALE_SECONDS: int = 600  # 이 시간 이상 PENDING인 게시글은 다시 큐에 넣음
+
+    # 번역 문자 수 한도 (롤링 윈도, 0이면 제한 없음)
+    TRANSLATION_USER_CHARS_PER_HOUR: int = 20_000  # 사용자별 번역 API 요청 문자 수
+    TRANSLATION_USER_CHARS_PER_DAY: int = 100_000
+    TRANSLATION_GLOBAL_CHARS_PER_HOUR: int = 0  # 프로바이더에 실제로 보내는 문자 수 (캐시 적중 제외)
+    TRANSLATION_GLOBAL_CHARS_PER_DAY: int = 0
+
+    # 비로그인 GET 응답 캐시 (게시글 목록, 카테고리)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL_SECONDS: int = 60
+    RESPONSE_CACHE_STALE_SECONDS: int = 10  # TTL 만료/무효화 후 이전 응답을 주면서 백그라운드에서 재생성하는 시간
+    RESPONSE_CACHE_MAX_PAGE: int = 5  # 이 페이지까지만 캐시 (오프셋 방식)
+
+    # 게시글 상세 응답 JSON 캐시 (게시글/작성자 updated_at 기준)
+    POST_BLOB_TTL_SECONDS: int = 3600
+    POST_BLOB_LOCAL_MAX_BYTES: int = 16 * 1024 * 1024
 
     # AWS S3
     AWS_ACCESS_KEY_ID: str = ""
@@ -65,6 +104,21 @@ class Settings(BaseSettings):
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 60
     TRANSLATION_RATE_LIMIT_PER_MINUTE: int = 20
+    RATE_LIMIT_TRUST_PROXY: bool = False  # nginx X-Real-IP 헤더 신뢰 여부 (nginx 뒤에서 실행할 때만 켬)
+
+    # 토큰 검증 캐시
+    TOKEN_CACHE_MAX_SIZE: int = 50000
+    TOKEN_REVOCATION_CHECK_SECONDS: int = 5
+
+    # 인증 사용자 캐시
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 10000
+
+    # 게시글 수 카운터 재집계 주기 (초)
+    POST_COUNT_RECONCILE_SECONDS: int = 300
+
+    # 조회수 버퍼 DB 반영 주기 (초)
+    VIEW_COUNT_FLUSH_SECONDS: int = 10
 
     class Config:
         env_file = ".env"
@@ -2,17 +2,32 @@ from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError
-from sqlalchemy.orm import Session
-from app.db.database import get_db
-from app.core.security import verify_token
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.database import get_async_db
+from app.core.security import verify_access_token
+from app.core.user_cache import UserSnapshot, user_cache
 from app.models import User, UserRole
 
 security = HTTPBearer(auto_error=False)
 
+async def _load_user(db: AsyncSession, user_id: int) -> Optional[UserSnapshot]:
+    """캐시된 사용자 스냅샷 조회 (없거나 만료되면 DB에서 로드)"""
+    snapshot = user_cache.get(user_id)
+    if snapshot is not None:
+        return snapshot
+
+    user = await db.get(User, user_id)
+    if user is None:
+        return None
+
+    snapshot = UserSnapshot.from_user(user)
+    user_cache.set(user_id, snapshot)
+    return snapshot
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
+    db: AsyncSession = Depends(get_async_db)
+) -> UserSnapshot:
     if not credentials:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -23,7 +38,7 @@ async def get_current_user(
     token = credentials.credentials
 
     try:
-        payload = verify_token(token, "access")
+        payload = await verify_access_token(token)
         user_id = payload.get("sub")
         if user_id is None:
             raise HTTPException(
@@ -36,7 +51,13 @@ async def get_current_user(
             detail=f"토큰 검증에 실패했습니다: {str(e)}",
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    try:
+        user = await _load_user(db, int(user_id))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않은 토큰입니다",
+        )
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -52,8 +73,8 @@ async def get_current_user(
     return user
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: UserSnapshot = Depends(get_current_user)
+) -> UserSnapshot:
     if not current_user.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -62,8 +83,8 @@ async def get_current_active_user(
     return current_user
 
 async def get_current_admin(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: UserSnapshot = Depends(get_current_user)
+) -> UserSnapshot:
     if not current_user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -77,8 +98,8 @@ async def get_current_admin(
     return current_user
 
 async def get_current_moderator(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: UserSnapshot = Depends(get_current_user)
+) -> UserSnapshot:
     if current_user.role not in [UserRole.ADMIN, UserRole.MODERATOR]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -88,8 +109,8 @@ async def get_current_moderator(
 
 async def get_optional_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    db: Session = Depends(get_db)
-) -> Optional[User]:
+    db: AsyncSession = Depends(get_async_db)
+) -> Optional[UserSnapshot]:
     """
     선택적 인증 - 토큰이 없으면 None 반환, 있으면 사용자 반환
     """
@@ -98,12 +119,12 @@ async def get_optional_current_user(
 
     try:
         token = credentials.credentials
-        payload = verify_token(token, "access")
+        payload = await verify_access_token(token)
         user_id = payload.get("sub")
         if user_id is None:
             return None
 
-        user = db.query(User).filter(User.id == int(user_id)).first()
+        user = await _load_user(db, int(user_id))
         if not user or not user.is_active:
             return None
 
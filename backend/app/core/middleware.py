@@ -1,35 +1,116 @@
+import math
 import time
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import JSONResponse
+from jose import JWTError
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+from app.core.rate_limit import get_route_limit, rate_limiter
+from app.core.security import verify_token
 from app.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+# BaseHTTPMiddleware 대신 순수 ASGI 미들웨어로 구현
+# (요청마다 태스크/메모리 스트림을 만들지 않고, 스트리밍 응답도 그대로 전달)
+
+class LoggingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.time()
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
 
         # 요청 로깅
-        logger.info(f"{request.method} {request.url.path} - {request.client.host}")
+        logger.info(f"{method} {path} - {client[0] if client else 'unknown'}")
+
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # 응답 시간 계산
+                process_time = time.time() - start_time
+                MutableHeaders(scope=message).append("X-Process-Time", str(process_time))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # 응답 로깅
+            process_time = time.time() - start_time
+            logger.info(
+                f"{method} {path} - "
+                f"Status: {status_code} - "
+                f"Time: {process_time:.4f}s"
+            )
+
+class RateLimitMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        # CORS preflight는 한도에서 제외
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        route_limit = get_route_limit(scope["method"], scope["path"])
+        if route_limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        budget, limit = route_limit
+        result = await rate_limiter.hit(f"{budget}:{_client_key(scope)}", limit)
+
+        headers = {
+            "X-RateLimit-Limit": str(result.limit),
+            "X-RateLimit-Remaining": str(result.remaining),
+            "X-RateLimit-Reset": str(math.ceil(result.reset_after)),
+        }
+
+        if not result.allowed:
+            headers["Retry-After"] = str(math.ceil(result.retry_after))
+            response = JSONResponse(
+                status_code=429,
+                content={"detail": "요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요."},
+                headers=headers
+            )
+            await response(scope, receive, send)
+            return
 
-        response = await call_next(request)
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for name, value in headers.items():
+                    response_headers[name] = value
+            await send(message)
 
-        # 응답 시간 계산
-        process_time = time.time() - start_time
-        response.headers["X-Process-Time"] = str(process_time)
+        await self.app(scope, receive, send_wrapper)
 
-        # 응답 로깅
-        logger.info(
-            f"{request.method} {request.url.path} - "
-            f"Status: {response.status_code} - "
-            f"Time: {process_time:.4f}s"
-        )
+def _client_key(scope: Scope) -> str:
+    """로그인 사용자는 user id, 그 외에는 클라이언트 IP 기준"""
+    request_headers = Headers(scope=scope)
 
-        return response
+    authorization = request_headers.get("authorization", "")
+    if authorization.lower().startswith("bearer "):
+        try:
+            payload = verify_token(authorization[7:], "access")
+            if payload.get("sub"):
+                return f"user:{payload['sub']}"
+        except JWTError:
+            pass
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        # TODO: Redis를 사용한 Rate Limiting 구현
-        # 현재는 통과
-        response = await call_next(request)
-        return response
\ No newline at end of file
+    # nginx가 설정하는 X-Real-IP 우선
+    client_ip = request_headers.get("x-real-ip") if settings.RATE_LIMIT_TRUST_PROXY else None
+    if not client_ip and scope.get("client"):
+        client_ip = scope["client"][0]
+    return f"ip:{client_ip or 'unknown'}"
@@ -0,0 +1,140 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+from app.core.config import settings
+from app.db.redis import get_async_redis, mark_async_redis_down
+from app.utils.cache import TTLCache
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# GCRA(Generic Cell Rate Algorithm): 키마다 "이론적 도착 시각(TAT)" 하나만 저장
+# KEYS[1] = 키, ARGV = [현재 시각(ms), 기간(ms), 기간당 허용 횟수]
+# 반환: {허용 여부, 남은 횟수, 재시도까지 ms, 완전 회복까지 ms}
+GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+local interval = period / limit
+
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+
+local new_tat = tat + interval
+local allow_at = new_tat - period
+if allow_at > now then
+    return {0, 0, math.ceil(allow_at - now), math.ceil(tat - now)}
+end
+
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil(new_tat - now))
+local remaining = math.floor((period - (new_tat - now)) / interval)
+return {1, remaining, 0, math.ceil(new_tat - now)}
+"""
+
+PERIOD_MS = 60_000
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float  # 초
+    reset_after: float  # 초 (한도가 완전히 회복될 때까지)
+
+class _TokenBucket:
+    __slots__ = ("tokens", "updated_at")
+
+    def __init__(self, tokens: float, updated_at: float):
+        self.tokens = tokens
+        self.updated_at = updated_at
+
+class RateLimiter:
+    """
+    Redis Lua(GCRA) 기반 요청 제한
+
+    Redis 오류 시 RECONNECT_INTERVAL 동안 프로세스 내 토큰 버킷으로 대체한다 (get_async_redis 백오프).
+    """
+
+    def __init__(self):
+        self._script = None
+        self._buckets = TTLCache(maxsize=100_000, ttl=PERIOD_MS / 1000 * 2)
+        self._lock = threading.Lock()
+
+    async def hit(self, key: str, limit: int) -> RateLimitResult:
+        redis_client = get_async_redis()
+        if redis_client is not None:
+            try:
+                return await self._hit_redis(redis_client, key, limit)
+            except Exception as e:
+                logger.warning(f"Redis rate limit 실패 - 로컬 토큰 버킷 사용: {e}")
+                mark_async_redis_down()
+        return self._hit_local(key, limit)
+
+    async def _hit_redis(self, redis_client, key: str, limit: int) -> RateLimitResult:
+        if self._script is None:
+            self._script = redis_client.register_script(GCRA_SCRIPT)
+
+        now_ms = int(time.time() * 1000)
+        allowed, remaining, retry_ms, reset_ms = await self._script(
+            keys=[f"rate_limit:{key}"],
+            args=[now_ms, PERIOD_MS, limit]
+        )
+        return RateLimitResult(
+            allowed=bool(allowed),
+            limit=limit,
+            remaining=int(remaining),
+            retry_after=int(retry_ms) / 1000,
+            reset_after=int(reset_ms) / 1000
+        )
+
+    def _hit_local(self, key: str, limit: int) -> RateLimitResult:
+        rate = limit / (PERIOD_MS / 1000)  # 초당 회복량
+        now = time.monotonic()
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = _TokenBucket(float(limit), now)
+            else:
+                bucket.tokens = min(float(limit), bucket.tokens + (now - bucket.updated_at) * rate)
+                bucket.updated_at = now
+
+            allowed = bucket.tokens >= 1
+            if allowed:
+                bucket.tokens -= 1
+            self._buckets.set(key, bucket)
+
+            return RateLimitResult(
+                allowed=allowed,
+                limit=limit,
+                remaining=int(bucket.tokens),
+                retry_after=0 if allowed else (1 - bucket.tokens) / rate,
+                reset_after=(limit - bucket.tokens) / rate
+            )
+
+# (메서드, 경로 prefix, 분당 허용 횟수) - 위에서부터 처음 일치하는 항목 적용
+ROUTE_LIMITS = [
+    ("POST", "/api/auth/", 10),  # 로그인/가입 무차별 대입 방지
+    ("POST", "/api/translate", settings.TRANSLATION_RATE_LIMIT_PER_MINUTE),
+    ("POST", "/api/posts", 20),
+    ("POST", "/api/comments", 30),
+]
+
+# 제한하지 않는 경로
+EXEMPT_PATHS = ("/health",)
+
+def get_route_limit(method: str, path: str) -> Optional[tuple]:
+    """요청에 적용할 (budget 이름, 분당 허용 횟수) - 제한 대상이 아니면 None"""
+    if not path.startswith("/api") or path in EXEMPT_PATHS:
+        return None
+
+    for route_method, prefix, limit in ROUTE_LIMITS:
+        if method == route_method and path.startswith(prefix):
+            return f"{route_method}:{prefix}", limit
+
+    return "default", settings.RATE_LIMIT_PER_MINUTE
+
+rate_limiter = RateLimiter()
@@ -3,11 +3,31 @@ from typing import Optional, Dict, Any
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
+from app.db.redis import get_async_redis, mark_async_redis_down
+from app.utils.cache import TTLCache
+from app.utils.logger import setup_logger
+import hashlib
 import secrets
 import string
+import time
+
+logger = setup_logger(__name__)
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# 검증된 토큰 payload 캐시: sha256(token) -> payload (토큰 exp까지 유효)
+_token_cache = TTLCache(
+    maxsize=settings.TOKEN_CACHE_MAX_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
+
+# 폐기된 jti: 이 워커에서 폐기했거나 Redis에서 확인된 항목 (토큰 만료 시각까지 유지)
+_revoked_jtis = TTLCache(maxsize=settings.TOKEN_CACHE_MAX_SIZE, ttl=settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400)
+# 폐기되지 않았음이 확인된 jti (다른 워커의 폐기는 최대 이 TTL만큼 늦게 반영)
+_active_jtis = TTLCache(maxsize=settings.TOKEN_CACHE_MAX_SIZE, ttl=settings.TOKEN_REVOCATION_CHECK_SECONDS)
+
+REVOKED_KEY_PREFIX = "revoked_jti:"
+
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -31,18 +51,76 @@ def create_refresh_token(data: Dict[str, Any], expires_delta: Optional[timedelta
     return encoded_jwt
 
 def verify_token(token: str, token_type: str = "access") -> Dict[str, Any]:
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        if payload.get("type") != token_type:
-            raise JWTError(f"Invalid token type: expected {token_type}, got {payload.get('type')}")
-        return payload
-    except JWTError as e:
-        # 더 자세한 에러 로깅
-        import traceback
-        print(f"Token verification failed: {e}")
-        print(f"Token (first 20 chars): {token[:20]}...")
-        print(f"Traceback: {traceback.format_exc()}")
-        raise
+    """서명/만료/타입 검증 (I/O 없음 - 폐기 여부는 이 워커가 아는 것만, 인증에는 verify_access_token 사용)"""
+    token_hash = hashlib.sha256(token.encode()).hexdigest()
+    payload = _token_cache.get(token_hash)
+
+    if payload is None:
+        try:
+            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        except JWTError as e:
+            logger.debug(f"Token verification failed: {e}")
+            raise
+        _token_cache.set(token_hash, payload, expires_at=payload.get("exp"))
+
+    if payload.get("type") != token_type:
+        raise JWTError(f"Invalid token type: expected {token_type}, got {payload.get('type')}")
+
+    jti = payload.get("jti")
+    if jti and _revoked_jtis.get(jti):
+        raise JWTError("Token has been revoked")
+
+    return payload
+
+async def verify_access_token(token: str) -> Dict[str, Any]:
+    """access 토큰 검증 + 폐기 여부 확인 (인증 의존성, 로그아웃용)"""
+    payload = verify_token(token, "access")
+
+    jti = payload.get("jti")
+    if jti and await is_jti_revoked(jti):
+        raise JWTError("Token has been revoked")
+
+    return payload
+
+async def revoke_jti(jti: str, expires_at: Optional[datetime] = None):
+    """토큰 폐기 (로그아웃, 강제 로그아웃) - expires_at 이후에는 토큰 자체가 만료됨"""
+    if not jti:
+        return
+    if expires_at is None:
+        expires_at = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    ttl = max(int((expires_at - datetime.utcnow()).total_seconds()), 1)
+
+    _revoked_jtis.set(jti, True, expires_at=time.time() + ttl)
+    _active_jtis.delete(jti)
+
+    redis_client = get_async_redis()
+    if redis_client is not None:
+        try:
+            await redis_client.setex(f"{REVOKED_KEY_PREFIX}{jti}", ttl, 1)
+        except Exception as e:
+            logger.warning(f"토큰 폐기 정보 저장 실패: {e}")
+            mark_async_redis_down()
+
+async def is_jti_revoked(jti: str) -> bool:
+    """폐기 여부 확인 (DB 조회 없음, Redis 조회는 TOKEN_REVOCATION_CHECK_SECONDS마다 최대 1회)"""
+    if _revoked_jtis.get(jti):
+        return True
+    if _active_jtis.get(jti):
+        return False
+
+    redis_client = get_async_redis()
+    if redis_client is not None:
+        try:
+            ttl = await redis_client.ttl(f"{REVOKED_KEY_PREFIX}{jti}")
+            if ttl and ttl > 0:
+                _revoked_jtis.set(jti, True, expires_at=time.time() + ttl)
+                return True
+        except Exception as e:
+            logger.warning(f"토큰 폐기 여부 확인 실패: {e}")
+            mark_async_redis_down()
+
+    _active_jtis.set(jti, True)
+    return False
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     # bcrypt는 최대 72바이트까지만 지원하므로 잘라냄
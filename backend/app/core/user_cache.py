@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from typing import Optional
+from app.core.config import settings
+from app.models.user import User, UserRole, UserType, Language
+from app.utils.cache import TTLCache
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """인증된 사용자의 읽기 전용 스냅샷 (세션과 분리되어 캐시 가능)"""
+    id: int
+    email: str
+    username: Optional[str]
+    nickname: str
+    nickname_ko: Optional[str]
+    nickname_ru: Optional[str]
+    role: UserRole
+    user_type: Optional[UserType]
+    is_active: bool
+    is_verified: bool
+    preferred_lang: Optional[Language]
+    profile_image: Optional[str]
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserSnapshot":
+        return cls(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            nickname=user.nickname,
+            nickname_ko=user.nickname_ko,
+            nickname_ru=user.nickname_ru,
+            role=user.role,
+            user_type=user.user_type,
+            is_active=bool(user.is_active),
+            is_verified=bool(user.is_verified),
+            preferred_lang=user.preferred_lang,
+            profile_image=user.profile_image,
+        )
+
+# user_id -> UserSnapshot
+# 다른 워커의 캐시는 무효화되지 않으므로 변경 반영은 최대 TTL만큼 늦어질 수 있음
+user_cache = TTLCache(maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS)
+
+def invalidate_user(user_id: int):
+    """사용자 정보(활성 상태, 권한, 닉네임 등) 변경 시 호출"""
+    user_cache.delete(user_id)
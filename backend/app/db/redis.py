@@ -0,0 +1,63 @@
+import time
+from typing import Optional
+import redis
+import redis.asyncio as aioredis
+from app.core.config import settings
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 연결 실패 후 재시도까지 대기 시간 (초)
+RECONNECT_INTERVAL = 30
+
+_redis_client: Optional[redis.Redis] = None
+_last_attempt: Optional[float] = None
+_async_redis_client: Optional[aioredis.Redis] = None
+_async_down_until = 0.0
+
+def get_redis() -> Optional[redis.Redis]:
+    """공유 Redis 클라이언트 반환 (연결할 수 없으면 None)"""
+    global _redis_client, _last_attempt
+
+    if _redis_client is not None:
+        return _redis_client
+
+    now = time.monotonic()
+    if _last_attempt is not None and now - _last_attempt < RECONNECT_INTERVAL:
+        return None
+    _last_attempt = now
+
+    try:
+        client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+        client.ping()
+        _redis_client = client
+    except Exception as e:
+        logger.warning(f"Redis 연결 실패: {e}")
+
+    return _redis_client
+
+def get_async_redis() -> Optional[aioredis.Redis]:
+    """
+    공유 비동기 Redis 클라이언트 반환
+
+    연결은 첫 명령 실행 시 수립되므로 호출자가 예외를 처리하고 mark_async_redis_down()으로 알린다.
+    실패 후 RECONNECT_INTERVAL 동안은 None을 반환해 호출자가 바로 대체 경로로 가게 한다.
+    """
+    global _async_redis_client
+
+    if time.monotonic() < _async_down_until:
+        return None
+
+    if _async_redis_client is None:
+        _async_redis_client = aioredis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5
+        )
+    return _async_redis_client
+
+def mark_async_redis_down():
+    """비동기 Redis 명령 실패 - RECONNECT_INTERVAL 동안 get_async_redis()가 None을 반환 (로그는 호출자가 남김)"""
+    global _async_down_until
+    _async_down_until = time.monotonic() + RECONNECT_INTERVAL
@@ -2,11 +2,16 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 from app.core.config import settings
 from app.db.database import engine, Base
 from app.api import auth, users, posts, comments, categories, partners, admin, translation, data, verification
 from app.core.middleware import LoggingMiddleware, RateLimitMiddleware
+from app.services.post_counter import post_counter
+from app.services.view_counter import view_counter
+from app.services.translation import translation_service
+from app.services.translation_queue import translation_queue
 from app.utils.logger import setup_logger
 
 # 모든 모델 import (테이블 생성을 위해 필요)
@@ -25,8 +30,21 @@ async def lifespan(app: FastAPI):
         logger.info("데이터베이스 연결 성공")
     except Exception as e:
         logger.warning(f"데이터베이스 연결 실패 (파일 기반 모드로 동작): {e}")
+
+    # 백그라운드 작업
+    background_tasks = [
+        asyncio.create_task(post_counter.run_reconciler()),
+        asyncio.create_task(view_counter.run_flusher()),
+        asyncio.create_task(translation_service.warm_up()),
+        asyncio.create_task(translation_service.run_settings_watcher()),
+        asyncio.create_task(translation_queue.run_recovery()),
+        *[asyncio.create_task(translation_queue.run_worker()) for _ in range(settings.TRANSLATION_WORKERS)],
+    ]
     yield
     # 종료 시
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
     logger.info("애플리케이션 종료")
 
 app = FastAPI(
@@ -36,6 +54,10 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# 커스텀 미들웨어 (나중에 추가한 미들웨어가 바깥쪽 - 429 응답에도 CORS 헤더가 붙도록 CORS보다 먼저 추가)
+app.add_middleware(RateLimitMiddleware)
+app.add_middleware(LoggingMiddleware)
+
 # CORS 미들웨어
 app.add_middleware(
     CORSMiddleware,
@@ -45,10 +67,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 커스텀 미들웨어
-app.add_middleware(LoggingMiddleware)
-app.add_middleware(RateLimitMiddleware)
-
 # 라우터 등록
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(users.router, prefix="/api/users", tags=["Users"])
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, JSON, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, JSON, Index, Enum as SQLEnum
+from sqlalchemy.orm import relationship, query_expression
 # from sqlalchemy.dialects.postgresql import ARRAY
 from datetime import datetime
 import enum
@@ -11,6 +11,13 @@ class PostStatus(str, enum.Enum):
     HIDDEN = "hidden"
     DELETED = "deleted"
 
+class TranslationStatus(str, enum.Enum):
+    NONE = "none"             # 자동 번역 사용 안 함
+    PENDING = "pending"       # 번역 작업 대기/진행 중
+    ON_DEMAND = "on_demand"   # 다른 언어 독자가 처음 읽을 때 번역 (TRANSLATION_MODE=on_read)
+    COMPLETED = "completed"
+    FAILED = "failed"         # 재시도 횟수 초과
+
 class CategoryLayoutType(str, enum.Enum):
     LIST = "list"           # 기본 리스트형
     GALLERY = "gallery"     # 갤러리/사진 정렬
@@ -69,6 +76,10 @@ class Category(Base):
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        # 게시판 목록 키셋 페이지네이션용 (category_id, status 필터 + is_pinned, created_at, id 정렬)
+        Index("ix_posts_board_order", "category_id", "status", "is_pinned", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -88,6 +99,14 @@ class Post(Base):
     translated_summary_ko = Column(String(500))
     translated_summary_ru = Column(String(500))
     auto_translated = Column(Boolean, default=False)
+    translation_status = Column(SQLEnum(TranslationStatus), default=TranslationStatus.NONE, index=True)
+    # 목록 조회 시 본문 앞부분 (with_expression으로 채움, 그 외에는 None)
+    excerpt_ko = query_expression()
+    excerpt_ru = query_expression()
+    # ?lang=ko|ru 조회 시 해당 언어로 정한 제목/본문/요약 (with_expression으로 채움)
+    localized_title = query_expression()
+    localized_content = query_expression()
+    localized_summary = query_expression()
 
     # 메타데이터
     tags = Column(JSON, default=list)
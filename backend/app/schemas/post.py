@@ -2,6 +2,11 @@ from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
+import html
+import re
+
+# 목록 발췌문 길이 (HTML 태그 제거 후 글자 수)
+EXCERPT_LENGTH = 150
 
 class PostStatus(str, Enum):
     DRAFT = "draft"
@@ -9,6 +14,13 @@ class PostStatus(str, Enum):
     HIDDEN = "hidden"
     DELETED = "deleted"
 
+class TranslationStatus(str, Enum):
+    NONE = "none"
+    PENDING = "pending"
+    ON_DEMAND = "on_demand"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
 class PostBase(BaseModel):
     title: str = Field(..., min_length=1, max_length=255, description="게시글 제목")
     content: str = Field(..., min_length=1, description="게시글 내용")
@@ -90,6 +102,7 @@ class PostResponse(PostBase):
     translated_summary_ko: Optional[str] = None
     translated_summary_ru: Optional[str] = None
     auto_translated: bool = False
+    translation_status: Optional[TranslationStatus] = None  # 백그라운드 번역 진행 상태
 
     # 메타데이터
     is_pinned: bool = False
@@ -112,10 +125,149 @@ class PostResponse(PostBase):
     class Config:
         from_attributes = True
 
+class AuthorSummary(BaseModel):
+    """목록용 작성자 정보 (이메일 제외)"""
+    id: int
+    username: Optional[str] = None
+    nickname: Optional[str] = None
+    profile_image: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+def make_excerpt(text: Optional[str]) -> Optional[str]:
+    """HTML 태그를 제거하고 EXCERPT_LENGTH 글자로 자른 발췌문"""
+    if not text:
+        return None
+    text = html.unescape(re.sub(r"<[^>]*>?", " ", text))
+    text = " ".join(text.split())
+    if len(text) > EXCERPT_LENGTH:
+        text = text[:EXCERPT_LENGTH].rstrip() + "…"
+    return text or None
+
+class PostListItemBase(BaseModel):
+    """게시글 목록 항목 공통 필드 (본문 제외)"""
+    id: int
+    user_id: int
+    category_id: Optional[int] = None
+    slug: Optional[str] = None
+    status: PostStatus
+    source_lang: Optional[str] = None
+    auto_translated: bool = False
+    translation_status: Optional[TranslationStatus] = None
+
+    is_pinned: bool = False
+    is_featured: bool = False
+
+    view_count: int = 0
+    like_count: int = 0
+    comment_count: int = 0
+
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    published_at: Optional[datetime] = None
+
+    author: Optional[AuthorSummary] = None
+
+    class Config:
+        from_attributes = True
+
+class PostListItem(PostListItemBase):
+    """
+    게시글 목록 항목 (두 언어 모두)
+
+    본문(content, translated_content_*) 대신 언어별 발췌문만 포함한다.
+    전체 본문은 상세 조회(GET /api/posts/{id})에서 받는다.
+    """
+    title: str
+    summary: Optional[str] = None
+    translated_title_ko: Optional[str] = None
+    translated_title_ru: Optional[str] = None
+    translated_summary_ko: Optional[str] = None
+    translated_summary_ru: Optional[str] = None
+    excerpt_ko: Optional[str] = None
+    excerpt_ru: Optional[str] = None
+
+    @field_validator('excerpt_ko', 'excerpt_ru')
+    @classmethod
+    def build_excerpt(cls, v):
+        # DB에서는 본문 앞부분만 잘라 읽으므로 여기서 태그 제거 후 길이를 맞춤
+        return make_excerpt(v)
+
+class PostLocalizedListItem(PostListItemBase):
+    """게시글 목록 항목 (?lang=ko|ru) - 요청 언어로 정한 제목/요약/발췌문만 포함"""
+    title: str = Field(validation_alias="localized_title")
+    summary: Optional[str] = Field(None, validation_alias="localized_summary")
+    excerpt: Optional[str] = Field(None, validation_alias="localized_content")
+
+    @field_validator('excerpt')
+    @classmethod
+    def build_excerpt(cls, v):
+        return make_excerpt(v)
+
+    class Config:
+        from_attributes = True
+        populate_by_name = True
+
+class PostLocalizedResponse(BaseModel):
+    """
+    게시글 상세 응답 (?lang=ko|ru)
+
+    요청 언어가 원문 언어면 원문, 아니면 번역문 (번역 전이면 원문)을
+    title/content/summary에 하나씩만 담는다.
+    """
+    id: int
+    user_id: int
+    category_id: Optional[int] = None
+    slug: Optional[str] = None
+    status: PostStatus
+    source_lang: str
+    lang: Optional[str] = None  # 응답 언어
+
+    title: str = Field(validation_alias="localized_title")
+    content: str = Field(validation_alias="localized_content")
+    summary: Optional[str] = Field(None, validation_alias="localized_summary")
+    tags: Optional[List[str]] = Field(default_factory=list)
+    images: Optional[List[str]] = Field(default_factory=list)
+    attachments: Optional[List[dict]] = Field(default_factory=list)
+    allow_comments: bool = True
+
+    auto_translated: bool = False
+    translation_status: Optional[TranslationStatus] = None
+
+    is_pinned: bool = False
+    is_featured: bool = False
+
+    view_count: int = 0
+    like_count: int = 0
+    comment_count: int = 0
+    share_count: int = 0
+
+    created_at: datetime
+    updated_at: datetime
+    published_at: Optional[datetime] = None
+
+    author: Optional[AuthorInfo] = None
+
+    class Config:
+        from_attributes = True
+        populate_by_name = True
+        # 응답 모델 Union에서 translated_* 필드가 있는 PostResponse와 구분
+        extra = "forbid"
+
 class PostListResponse(BaseModel):
     """게시글 목록 응답"""
-    items: List[PostResponse]
-    total: int
-    page: int
+    items: List[PostListItem]
+    total: int  # 카운터 저장소 기준 (근사값)
+    page: Optional[int] = None  # 커서 방식에서는 생략
     page_size: int
     total_pages: int
+
+    # 커서 방식 페이지네이션
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+class PostLocalizedListResponse(PostListResponse):
+    """게시글 목록 응답 (?lang=ko|ru)"""
+    items: List[PostLocalizedListItem]
+    lang: str
@@ -0,0 +1,107 @@
+from datetime import datetime
+from typing import NamedTuple, Optional
+import orjson
+from pydantic import BaseModel
+from app.core.config import settings
+from app.db.redis import get_async_redis, mark_async_redis_down
+from app.utils.cache import SizedLRUCache
+from app.utils.logger import setup_logger
+from app.utils.metrics import metrics
+
+logger = setup_logger(__name__)
+
+# view_count는 빼고 직렬화한 뒤 마지막 키로 붙임 (응답할 때 실제 조회수를 넣음)
+VIEW_COUNT_FIELD = b'"view_count":'
+
+class PostBlob(NamedTuple):
+    """view_count 앞뒤로 나눈 직렬화된 게시글 응답"""
+    prefix: bytes
+    suffix: bytes
+
+    def render(self, view_count: int) -> bytes:
+        return self.prefix + str(view_count).encode() + self.suffix
+
+    @property
+    def size(self) -> int:
+        return len(self.prefix) + len(self.suffix)
+
+def _split(raw: bytes) -> PostBlob:
+    """view_count를 뺀 JSON 객체의 닫는 괄호 앞에 view_count 자리를 만듦 (본문 내용은 검색하지 않음)"""
+    separator = b"," if raw != b"{}" else b""
+    return PostBlob(raw[:-1] + separator + VIEW_COUNT_FIELD, b"}")
+
+class PostBlobCache:
+    """
+    게시글 상세 응답 JSON 캐시
+
+    키는 (게시글 ID, 버전, 응답 언어)이고 버전은 게시글과 작성자의 updated_at이다.
+    수정되면 키가 바뀌므로 따로 지우지 않고, 이전 버전은 TTL로 만료된다.
+    1단계는 프로세스 내 LRU, 2단계는 Redis에 저장한다.
+    """
+
+    def __init__(self):
+        self.local = SizedLRUCache(
+            maxbytes=settings.POST_BLOB_LOCAL_MAX_BYTES,
+            ttl=settings.POST_BLOB_TTL_SECONDS
+        )
+
+    def _key(
+        self, post_id: int, updated_at: Optional[datetime], author_updated_at: Optional[datetime], lang: Optional[str]
+    ) -> str:
+        version = ":".join(value.isoformat() if value else "-" for value in (updated_at, author_updated_at))
+        return f"post_blob:{post_id}:{lang or 'all'}:{version}"
+
+    async def get(
+        self, post_id: int, updated_at: Optional[datetime], author_updated_at: Optional[datetime], lang: Optional[str]
+    ) -> Optional[PostBlob]:
+        key = self._key(post_id, updated_at, author_updated_at, lang)
+        blob = self.local.get(key)
+        if blob is not None:
+            metrics.counter("post_blob_cache_requests_total", tier="local", result="hit").inc()
+            return blob
+
+        raw = None
+        redis_client = get_async_redis()
+        if redis_client is not None:
+            try:
+                raw = await redis_client.get(key)
+            except Exception as e:
+                logger.warning(f"게시글 응답 캐시 조회 실패: {e}")
+                mark_async_redis_down()
+
+        if raw is None:
+            metrics.counter("post_blob_cache_requests_total", tier="redis", result="miss").inc()
+            return None
+        metrics.counter("post_blob_cache_requests_total", tier="redis", result="hit").inc()
+        blob = _split(raw.encode())
+        self.local.set(key, blob, blob.size)
+        return blob
+
+    async def set(
+        self,
+        post_id: int,
+        updated_at: Optional[datetime],
+        author_updated_at: Optional[datetime],
+        lang: Optional[str],
+        response: BaseModel
+    ) -> PostBlob:
+        """응답 모델을 orjson으로 직렬화해 두 단계에 저장"""
+        data = response.model_dump()
+        data.pop("view_count", None)
+        raw = orjson.dumps(data)
+        blob = _split(raw)
+
+        key = self._key(post_id, updated_at, author_updated_at, lang)
+        self.local.set(key, blob, blob.size)
+        redis_client = get_async_redis()
+        if redis_client is None:
+            return blob
+        try:
+            await redis_client.set(key, raw.decode(), ex=settings.POST_BLOB_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"게시글 응답 캐시 저장 실패: {e}")
+            mark_async_redis_down()
+        return blob
+
+# 싱글톤 인스턴스
+post_blob_cache = PostBlobCache()
@@ -0,0 +1,127 @@
+import asyncio
+from typing import Dict, Optional
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.db.redis import get_async_redis, mark_async_redis_down
+from app.models.post import Post
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Redis 해시: 필드 "{category_id}:{status}" -> 게시글 수
+COUNTS_KEY = "post_counts"
+# 재집계가 끝난 해시에만 존재하는 필드 (HINCRBY로 부분 생성된 해시와 구분)
+RECONCILED_FIELD = "_reconciled"
+
+class PostCounter:
+    """
+    (category_id, status)별 게시글 수 저장소
+
+    생성/삭제/상태 변경 시 증감하고 주기적으로 COUNT 집계와 맞춘다.
+    Redis가 없으면 프로세스 메모리에 보관한다 (워커 간 오차는 재집계로 보정).
+    """
+
+    def __init__(self):
+        self._local: Dict[str, int] = {}
+
+    def _field(self, category_id: int, status) -> str:
+        status_value = status.value if hasattr(status, "value") else str(status)
+        return f"{category_id}:{status_value}"
+
+    async def _load(self) -> Optional[Dict[str, int]]:
+        redis_client = get_async_redis()
+        if redis_client is not None:
+            try:
+                counts = await redis_client.hgetall(COUNTS_KEY)
+                if RECONCILED_FIELD not in counts:
+                    return None
+                return {k: int(v) for k, v in counts.items()}
+            except Exception as e:
+                logger.warning(f"게시글 카운터 조회 실패: {e}")
+                mark_async_redis_down()
+
+        if RECONCILED_FIELD not in self._local:
+            return None
+        return self._local
+
+    async def reconcile(self, db: AsyncSession) -> Dict[str, int]:
+        """COUNT(*) GROUP BY로 전체 카운터 재집계"""
+        result = await db.execute(
+            select(Post.category_id, Post.status, func.count(Post.id)).group_by(
+                Post.category_id, Post.status
+            )
+        )
+        rows = result.all()
+
+        counts = {self._field(category_id, status): count for category_id, status, count in rows}
+        counts[RECONCILED_FIELD] = 1
+
+        redis_client = get_async_redis()
+        if redis_client is not None:
+            try:
+                async with redis_client.pipeline(transaction=True) as pipe:
+                    pipe.delete(COUNTS_KEY)
+                    pipe.hset(COUNTS_KEY, mapping=counts)
+                    await pipe.execute()
+            except Exception as e:
+                logger.warning(f"게시글 카운터 저장 실패: {e}")
+                mark_async_redis_down()
+
+        self._local = counts
+        return counts
+
+    async def get_total(self, db: AsyncSession, category_id: Optional[int] = None, status=None) -> int:
+        """필터에 해당하는 게시글 수 (COUNT 쿼리 없이)"""
+        counts = await self._load()
+        if counts is None:
+            counts = await self.reconcile(db)
+
+        status_value = status.value if hasattr(status, "value") else status
+        total = 0
+        for field, count in counts.items():
+            if field == RECONCILED_FIELD:
+                continue
+            field_category, field_status = field.split(":", 1)
+            if category_id and field_category != str(category_id):
+                continue
+            if status_value and field_status != status_value:
+                continue
+            total += count
+        return max(total, 0)
+
+    async def adjust(self, category_id: int, status, delta: int):
+        """카운터 증감 (재집계 전이면 무시 - 다음 조회 때 재집계됨)"""
+        field = self._field(category_id, status)
+
+        redis_client = get_async_redis()
+        if redis_client is not None:
+            try:
+                await redis_client.hincrby(COUNTS_KEY, field, delta)
+            except Exception as e:
+                logger.warning(f"게시글 카운터 갱신 실패: {e}")
+                mark_async_redis_down()
+
+        if RECONCILED_FIELD in self._local:
+            self._local[field] = self._local.get(field, 0) + delta
+
+    async def move(self, old_category_id: int, old_status, new_category_id: int, new_status):
+        """게시판 이동 또는 상태 변경 반영"""
+        if self._field(old_category_id, old_status) == self._field(new_category_id, new_status):
+            return
+        await self.adjust(old_category_id, old_status, -1)
+        await self.adjust(new_category_id, new_status, 1)
+
+    async def run_reconciler(self):
+        """주기적 재집계 루프 (lifespan에서 실행)"""
+        while True:
+            await asyncio.sleep(settings.POST_COUNT_RECONCILE_SECONDS)
+            try:
+                async with AsyncSessionLocal() as db:
+                    await self.reconcile(db)
+            except Exception as e:
+                logger.error(f"게시글 카운터 재집계 실패: {e}")
+
+# 싱글톤 인스턴스
+post_counter = PostCounter()
@@ -0,0 +1,67 @@
+import threading
+from collections import defaultdict
+from typing import Dict, List
+from app.db.redis import get_async_redis, mark_async_redis_down
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Redis 해시: 필드 "{category_id}:{원문 언어}:{독자 언어}" -> 상세 조회 수
+READS_KEY = "post_reads:lang"
+
+class ReadStats:
+    """
+    카테고리별 원문 언어 / 독자 언어 조회 통계
+
+    게시판마다 다른 언어 독자가 실제로 얼마나 읽는지 보고
+    번역 방식(작성 시 번역 / 읽을 때 번역)을 정하는 데 사용한다.
+    Redis가 없으면 프로세스 메모리에 보관한다.
+    """
+
+    def __init__(self):
+        self._local: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    async def record(self, category_id: int, source_lang: str, reader_lang: str):
+        field = f"{category_id}:{source_lang}:{reader_lang}"
+        redis_client = get_async_redis()
+        if redis_client is not None:
+            try:
+                await redis_client.hincrby(READS_KEY, field, 1)
+                return
+            except Exception as e:
+                logger.warning(f"조회 통계 갱신 실패: {e}")
+                mark_async_redis_down()
+
+        with self._lock:
+            self._local[field] += 1
+
+    async def snapshot(self) -> List[Dict]:
+        """[{category_id, source_lang, reader_lang, reads}, ...]"""
+        counts: Dict[str, int] = defaultdict(int)
+        with self._lock:
+            for field, count in self._local.items():
+                counts[field] += count
+
+        redis_client = get_async_redis()
+        if redis_client is not None:
+            try:
+                for field, count in (await redis_client.hgetall(READS_KEY)).items():
+                    counts[field] += int(count)
+            except Exception as e:
+                logger.warning(f"조회 통계 조회 실패: {e}")
+                mark_async_redis_down()
+
+        stats = []
+        for field, count in counts.items():
+            category_id, source_lang, reader_lang = field.split(":")
+            stats.append({
+                "category_id": int(category_id),
+                "source_lang": source_lang,
+                "reader_lang": reader_lang,
+                "reads": count,
+            })
+        return sorted(stats, key=lambda item: (item["category_id"], item["source_lang"], item["reader_lang"]))
+
+# 싱글톤 인스턴스
+read_stats = ReadStats()
@@ -0,0 +1,160 @@
+import asyncio
+import hashlib
+import json
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.db.redis import get_async_redis, mark_async_redis_down
+from app.utils.etag import etag_for_bytes
+from app.utils.logger import setup_logger
+from app.utils.metrics import metrics
+
+logger = setup_logger(__name__)
+
+# 응답 본문 (값: 헤더 JSON + "\n" + 응답 JSON)
+ENTRY_KEY_PREFIX = "response_cache:"
+# 태그별 마지막 무효화 시각 (만료 없음 - 게시판 수만큼만 생김)
+TAG_KEY_PREFIX = "response_cache_tag:"
+# 백그라운드 재생성 중복 방지 락
+REFRESH_LOCK_PREFIX = "response_cache_refresh:"
+REFRESH_LOCK_SECONDS = 10
+
+# 응답 본문을 만드는 함수 (요청 세션 또는 백그라운드 재생성용 새 세션을 받음)
+Builder = Callable[[AsyncSession], Awaitable[bytes]]
+
+def post_tags(*category_ids: Optional[int]) -> List[str]:
+    """게시글 변경 시 무효화할 태그 (전체 목록 + 해당 게시판 목록)"""
+    return ["posts:all"] + [f"posts:category:{category_id}" for category_id in set(category_ids) if category_id]
+
+def post_list_tags(category_id: Optional[int]) -> List[str]:
+    """게시글 목록 응답의 태그"""
+    return [f"posts:category:{category_id}"] if category_id else ["posts:all"]
+
+CATEGORY_TAGS = ["categories"]
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str  # 본문 해시 (저장할 때 한 번만 계산)
+
+class ResponseCache:
+    """
+    비로그인 GET 응답 캐시 (직렬화된 JSON 바이트)
+
+    키는 (라우트, 정규화된 쿼리)이고, 저장할 때 태그별 무효화 시각을 함께 기록한다.
+    조회 시 본문과 태그 값을 MGET 한 번으로 읽어, 태그가 바뀌었거나 TTL이 지났으면
+    RESPONSE_CACHE_STALE_SECONDS 동안은 이전 본문을 응답하면서 백그라운드에서 다시 만든다.
+    Redis 오류 시에는 RECONNECT_INTERVAL 동안 캐시 없이 매번 만든다 (get_async_redis 백오프).
+    """
+
+    def __init__(self):
+        self._refresh_tasks = set()
+
+    def _entry_key(self, route: str, params: Dict) -> str:
+        query = json.dumps(params, sort_keys=True, default=str)
+        return f"{ENTRY_KEY_PREFIX}{route}:{hashlib.sha1(query.encode()).hexdigest()}"
+
+    async def get_or_build(self, route: str, params: Dict, tags: List[str], build: Builder, db: AsyncSession) -> CachedResponse:
+        if not settings.RESPONSE_CACHE_ENABLED:
+            return self._built(await build(db))
+
+        redis_client = get_async_redis()
+        if redis_client is None:
+            return self._built(await build(db))
+
+        key = self._entry_key(route, params)
+        tag_keys = [f"{TAG_KEY_PREFIX}{tag}" for tag in tags]
+        try:
+            raw, *tag_values = await redis_client.mget([key] + tag_keys)
+        except Exception as e:
+            logger.warning(f"응답 캐시 조회 실패: {e}")
+            mark_async_redis_down()
+            return self._built(await build(db))
+
+        if raw is not None:
+            header, body = raw.split("\n", 1)
+            header = json.loads(header)
+            body = body.encode()
+            # etag가 없는 이전 형식 항목은 본문 해시로
+            cached = CachedResponse(body, header.get("etag") or etag_for_bytes(body))
+            now = time.time()
+
+            # TTL이 지났거나 저장 후 태그가 무효화되었으면 그 시각부터 stale
+            stale_since = min([header["stored_at"] + settings.RESPONSE_CACHE_TTL_SECONDS] + [
+                float(value) for tag, value in zip(tags, tag_values)
+                if value is not None and value != header["tags"].get(tag)
+            ])
+
+            if now < stale_since:
+                self._record(route, "hit")
+                return cached
+            if now - stale_since < settings.RESPONSE_CACHE_STALE_SECONDS:
+                self._record(route, "stale")
+                self._start_refresh(key, tags, tag_keys, build)
+                return cached
+
+        self._record(route, "miss")
+        cached = self._built(await build(db))
+        await self._store(key, tags, tag_values, cached)
+        return cached
+
+    def _built(self, body: bytes) -> CachedResponse:
+        return CachedResponse(body, etag_for_bytes(body))
+
+    async def _store(self, key: str, tags: List[str], tag_values: List[Optional[str]], cached: CachedResponse):
+        # 태그 값은 만들기 전에 읽은 값 - 만드는 도중 무효화되면 다음 조회에서 stale로 처리됨
+        redis_client = get_async_redis()
+        if redis_client is None:
+            return
+        header = json.dumps({"stored_at": time.time(), "tags": dict(zip(tags, tag_values)), "etag": cached.etag})
+        try:
+            await redis_client.set(
+                key,
+                header + "\n" + cached.body.decode(),
+                ex=settings.RESPONSE_CACHE_TTL_SECONDS + settings.RESPONSE_CACHE_STALE_SECONDS
+            )
+        except Exception as e:
+            logger.warning(f"응답 캐시 저장 실패: {e}")
+            mark_async_redis_down()
+
+    def _start_refresh(self, key: str, tags: List[str], tag_keys: List[str], build: Builder):
+        task = asyncio.create_task(self._refresh(key, tags, tag_keys, build))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _refresh(self, key: str, tags: List[str], tag_keys: List[str], build: Builder):
+        """stale 응답을 백그라운드에서 다시 만듦 (워커 간 하나만)"""
+        redis_client = get_async_redis()
+        if redis_client is None:
+            return
+        try:
+            if not await redis_client.set(f"{REFRESH_LOCK_PREFIX}{key}", 1, nx=True, ex=REFRESH_LOCK_SECONDS):
+                return
+            tag_values = await redis_client.mget(tag_keys)
+            async with AsyncSessionLocal() as db:
+                cached = self._built(await build(db))
+            await self._store(key, tags, tag_values, cached)
+            await redis_client.delete(f"{REFRESH_LOCK_PREFIX}{key}")
+        except Exception as e:
+            logger.warning(f"응답 캐시 재생성 실패 ({key}): {e}")
+
+    async def invalidate(self, tags: Iterable[str]):
+        """태그가 붙은 응답을 stale로 표시 (키를 찾아 지우지 않고 태그 시각만 갱신)"""
+        redis_client = get_async_redis()
+        if redis_client is None:
+            # Redis 백오프 중 - 저장된 응답은 TTL로 만료됨
+            logger.warning(f"응답 캐시 무효화 건너뜀 (Redis 사용 불가): {list(tags)}")
+            return
+        now = str(time.time())
+        try:
+            await redis_client.mset({f"{TAG_KEY_PREFIX}{tag}": now for tag in tags})
+        except Exception as e:
+            logger.warning(f"응답 캐시 무효화 실패: {e}")
+            mark_async_redis_down()
+
+    def _record(self, route: str, result: str):
+        metrics.counter("response_cache_requests_total", route=route, result=result).inc()
+
+# 싱글톤 인스턴스
+response_cache = ResponseCache()
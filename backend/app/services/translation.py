@@ -1,16 +1,69 @@
+import asyncio
 import hashlib
-import json
-from typing import Optional, Dict, List
+import re
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Tuple
 from enum import Enum
-import redis
+import redis.asyncio as aioredis
 import deepl
 from google.cloud import translate_v2 as translate
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from app.core.config import settings
+from app.db.redis import get_async_redis, mark_async_redis_down
+from app.services.translation_cache import TranslationCache
+from app.services.translation_quota import translation_quota
+from app.services.translation_providers import (
+    BaseTranslationProvider, DeepLProvider, GoogleProvider, ProviderRouter, StubProvider, TranslationError
+)
 from app.utils.logger import setup_logger
+from app.utils.metrics import metrics
 
 logger = setup_logger(__name__)
 
+# 워커 간 동일 번역 락 유지 시간 / 다른 워커의 결과를 기다리는 최대 시간
+SINGLE_FLIGHT_LOCK_MS = 30_000
+SINGLE_FLIGHT_WAIT_SECONDS = 5.0
+SINGLE_FLIGHT_POLL_SECONDS = 0.1
+
+# 락 값이 이 요청의 토큰일 때만 삭제 (만료 후 다른 워커가 잡은 락은 그대로 둠)
+# KEYS = 락 키 목록, ARGV[1] = 토큰
+RELEASE_LOCKS_SCRIPT = """
+local released = 0
+for _, key in ipairs(KEYS) do
+    if redis.call('GET', key) == ARGV[1] then
+        redis.call('DEL', key)
+        released = released + 1
+    end
+end
+return released
+"""
+
+# 세그먼트 번역: 이 길이를 넘는 문단은 문장 단위로 나눔
+SEGMENT_MAX_CHARS = 1000
+_PARAGRAPH_SEPARATOR = re.compile(r"(\n[ \t]*\n\s*)")
+_SENTENCE_SEPARATOR = re.compile(r"(?<=[.!?。…])(\s+)")
+
+def split_segments(text: str) -> List[Tuple[str, bool]]:
+    """
+    텍스트를 문단(긴 문단은 문장) 단위로 분할
+
+    [(조각, 번역 대상 여부), ...] - 구분자(빈 줄, 공백)도 그대로 포함하므로
+    조각을 순서대로 이어 붙이면 원문이 된다.
+    """
+    pieces = []
+    for i, paragraph in enumerate(_PARAGRAPH_SEPARATOR.split(text)):
+        if i % 2 or not paragraph.strip():
+            pieces.append((paragraph, False))
+            continue
+
+        sentences = [paragraph] if len(paragraph) <= SEGMENT_MAX_CHARS else _SENTENCE_SEPARATOR.split(paragraph)
+        for j, sentence in enumerate(sentences):
+            pieces.append((sentence, not (j % 2) and bool(sentence.strip())))
+    return pieces
+
 def get_settings_from_db():
     """DB에서 시스템 설정 가져오기"""
     try:
@@ -34,27 +87,53 @@ def get_settings_from_db():
         logger.error(f"DB에서 설정 가져오기 실패: {e}")
         return {}
 
+def get_settings_version():
+    """번역 설정의 마지막 변경 시각 (설정 변경 감지용)"""
+    from app.db.database import SessionLocal
+    from app.models.admin import SystemSettings
+
+    db = SessionLocal()
+    try:
+        return db.query(func.max(SystemSettings.updated_at)).filter(
+            SystemSettings.category == "translation"
+        ).scalar()
+    finally:
+        db.close()
+
 class TranslationProvider(str, Enum):
     GOOGLE = "google"
     DEEPL = "deepl"
+    STUB = "stub"  # 로컬 개발용 (외부 호출 없음)
 
 class TranslationService:
     def __init__(self):
-        # Redis 클라이언트 초기화 (개발 시에는 None으로 설정)
-        try:
-            self.redis_client = redis.from_url(
-                settings.REDIS_URL,
-                decode_responses=True
-            )
-            # 연결 테스트
-            self.redis_client.ping()
-        except:
-            logger.warning("Redis 연결 실패 - 캐시 없이 진행합니다")
-            self.redis_client = None
+        # 락/요청 제한은 공유 비동기 클라이언트(get_async_redis)를 사용 때마다 가져와 쓴다.
+        # 번역 캐시는 압축 값을 저장하므로 바이트 그대로 받는 전용 클라이언트 사용
+        # (연결은 첫 명령 때 수립, 실패는 mark_async_redis_down()으로 공유 백오프에 알림)
+        cache_redis_client = aioredis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5
+        )
+
+        # 동기 SDK(DeepL, Google) 호출용 스레드 풀 - 동시 호출 수 제한
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.TRANSLATION_MAX_CONCURRENCY,
+            thread_name_prefix="translation"
+        )
 
         # DB에서 설정 가져오기
         db_settings = get_settings_from_db()
 
+        # 번역 캐시 (프로세스 내 LRU + Redis)
+        self.cache = TranslationCache(cache_redis_client, db_settings)
+        # 번역 중인 캐시 키 -> 결과 Future (동일 요청 단일 실행)
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self._init_providers(db_settings)
+
+    def _init_providers(self, db_settings: Dict[str, str]):
+        """설정으로 프로바이더 클라이언트와 라우터 생성 (설정 변경 시 reload()에서 다시 호출)"""
         # 번역 프로바이더 초기화
         provider_name = db_settings.get('translation_provider') or getattr(settings, 'TRANSLATION_PROVIDER', 'deepl')
         self.provider = TranslationProvider(provider_name.lower())
@@ -82,10 +161,45 @@ class TranslationService:
         else:
             logger.warning("DeepL API Key가 설정되지 않았습니다")
 
+        # 프로바이더 라우터 (서킷 브레이커, 장애 시 대체 프로바이더, 헤지 요청)
+        # 진행 중인 요청은 이전 라우터의 클라이언트로 끝까지 처리됨
+        self.router = ProviderRouter(self._build_providers())
+
+    def reload(self):
+        """SystemSettings를 다시 읽어 프로바이더 클라이언트와 캐시 TTL 갱신 (캐시와 스레드 풀은 유지)"""
+        db_settings = get_settings_from_db()
+        self.cache.configure(db_settings)
+        self._init_providers(db_settings)
+        logger.info("번역 설정 다시 로드 완료")
+
+    async def _run_provider_call(self, provider: str, func, *args, **kwargs):
+        """
+        동기 프로바이더 SDK 호출을 스레드 풀에서 실행
+
+        대기열 길이(translation_queue_depth), 대기 시간, 호출 지연 시간을 메트릭으로 기록한다.
+        """
+        queue_depth = metrics.gauge("translation_queue_depth")
+        queued_at = time.perf_counter()
+
+        def _call():
+            queue_depth.dec()
+            started_at = time.perf_counter()
+            metrics.histogram("translation_queue_wait_seconds").observe(started_at - queued_at)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metrics.histogram("translation_provider_latency_seconds", provider=provider).observe(
+                    time.perf_counter() - started_at
+                )
+
+        queue_depth.inc()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _call)
+
     def _get_cache_key(self, text: str, source_lang: str, target_lang: str) -> str:
-        """캐시 키 생성"""
+        """캐시 키 생성 (현재 네임스페이스 버전 포함)"""
         content = f"{text}:{source_lang}:{target_lang}"
-        return f"translation:{hashlib.sha256(content.encode()).hexdigest()}"
+        return self.cache.key(hashlib.sha256(content.encode()).hexdigest())
 
     async def translate_text(
         self,
@@ -109,156 +223,293 @@ class TranslationService:
                 "cached": bool
             }
         """
-        if not text or not text.strip():
-            return {
-                "translated_text": "",
-                "source_lang": source_lang or "ko",
-                "target_lang": target_lang,
-                "cached": False
-            }
+        results = await self.translate_batch([text], target_lang, source_lang)
+        return results[0]
 
-        # 캐시 확인 (Redis가 사용 가능한 경우에만)
-        cached_result = None
-        if self.redis_client:
-            try:
-                cache_key = self._get_cache_key(text, source_lang or "auto", target_lang)
-                cached_result = self.redis_client.get(cache_key)
-            except:
-                pass
+    async def translate_batch(
+        self,
+        texts: List[str],
+        target_lang: str,
+        source_lang: Optional[str] = None,
+        raise_errors: bool = False
+    ) -> List[Dict[str, str]]:
+        """
+        여러 텍스트를 일괄 번역
 
-        if cached_result:
-            result = json.loads(cached_result)
-            result["cached"] = True
-            return result
+        캐시는 프로세스 내 LRU, Redis MGET 순으로 확인하고, 캐시에 없는 텍스트만 모아
+        프로바이더에 한 번에 요청한 뒤 두 단계 캐시에 모두 저장한다.
+        결과는 texts와 같은 순서로 반환한다.
 
-        # 번역 수행
-        result = await self._perform_translation(text, target_lang, source_lang)
+        프로바이더 호출이 실패하면 raise_errors=True일 때 TranslationError를 올리고,
+        아니면 원문을 그대로 반환한다 (실패한 결과는 캐시하지 않음).
+        """
+        results: List[Optional[Dict[str, str]]] = [None] * len(texts)
+
+        # 번역이 필요한 텍스트 -> 원래 위치 목록 (중복 제거)
+        positions: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                results[i] = {
+                    "translated_text": "",
+                    "source_lang": source_lang or "ko",
+                    "target_lang": target_lang,
+                    "cached": False
+                }
+            else:
+                positions.setdefault(text, []).append(i)
+
+        if not positions:
+            return results
+
+        pending = list(positions.keys())
+        await self.cache.refresh_version()
+        cache_keys = [self._get_cache_key(text, source_lang or "auto", target_lang) for text in pending]
+
+        # 캐시 확인
+        cached_values = await self.cache.get_many(cache_keys)
+
+        misses = []
+        saved_chars = 0
+        for text, cache_key, cached_value in zip(pending, cache_keys, cached_values):
+            if cached_value:
+                result = cached_value
+                result["cached"] = True
+                saved_chars += len(text)
+                for i in positions[text]:
+                    results[i] = dict(result)
+            else:
+                misses.append((text, cache_key))
 
-        # 캐시 저장 (24시간) - Redis가 사용 가능한 경우에만
-        if self.redis_client:
-            try:
-                cache_key = self._get_cache_key(text, source_lang or "auto", target_lang)
-                self.redis_client.setex(
-                    cache_key,
-                    86400,  # 24 hours
-                    json.dumps(result)
-                )
-            except:
-                pass
+        # 캐시 덕분에 기본 프로바이더에 보내지 않은 문자 수
+        if saved_chars:
+            metrics.counter("translation_chars_saved_total", provider=self.provider.value).inc(saved_chars)
 
-        result["cached"] = False
-        return result
+        if not misses:
+            return results
 
-    async def _perform_translation(
+        # 번역 수행 (캐시에 없는 텍스트만 한 번에)
+        miss_texts = [text for text, _ in misses]
+        try:
+            translated = await self._translate_misses(misses, target_lang, source_lang, raise_errors)
+        except TranslationError:
+            if raise_errors:
+                raise
+            for text, result in zip(miss_texts, self._untranslated(miss_texts, target_lang, source_lang)):
+                result["cached"] = False
+                for i in positions[text]:
+                    results[i] = dict(result)
+            return results
+
+        for (text, _), result in zip(misses, translated):
+            result.setdefault("cached", False)
+            for i in positions[text]:
+                results[i] = dict(result)
+
+        return results
+
+    async def _translate_misses(
         self,
-        text: str,
+        misses: List[Tuple[str, str]],
         target_lang: str,
-        source_lang: Optional[str] = None
-    ) -> Dict[str, str]:
-        """실제 번역 수행"""
-        if self.provider == TranslationProvider.GOOGLE:
-            return await self._translate_with_google(text, target_lang, source_lang)
-        elif self.provider == TranslationProvider.DEEPL:
-            return await self._translate_with_deepl(text, target_lang, source_lang)
-        else:
-            raise ValueError(f"지원하지 않는 번역 프로바이더: {self.provider}")
+        source_lang: Optional[str] = None,
+        raise_errors: bool = False
+    ) -> List[Dict[str, str]]:
+        """
+        캐시에 없는 (텍스트, 캐시 키) 목록 번역 - 동일 요청 단일 실행(single-flight)
+
+        같은 프로세스에서 이미 번역 중인 키는 그 결과를 기다리고,
+        나머지만 _translate_owned()로 번역한다.
+        기다린 번역이 실패하면 그 텍스트만 원문으로 반환한다 (raise_errors=True면 TranslationError).
+        """
+        loop = asyncio.get_running_loop()
+        owned, waiting = [], []
+        for i, (_, cache_key) in enumerate(misses):
+            future = self._inflight.get(cache_key)
+            if future is None:
+                self._inflight[cache_key] = loop.create_future()
+                owned.append(i)
+            else:
+                metrics.counter("translation_single_flight_total", scope="process").inc()
+                waiting.append((i, future))
+
+        results: List[Optional[Dict[str, str]]] = [None] * len(misses)
+        if owned:
+            owned_results = None
+            try:
+                owned_results = await self._translate_owned([misses[i] for i in owned], target_lang, source_lang)
+                for i, result in zip(owned, owned_results):
+                    results[i] = result
+            finally:
+                # 실패하면 None을 전달해 기다리던 요청도 실패 처리
+                for n, i in enumerate(owned):
+                    future = self._inflight.pop(misses[i][1])
+                    future.set_result(dict(owned_results[n]) if owned_results else None)
+
+        for i, future in waiting:
+            result = await asyncio.shield(future)
+            if result is None:
+                if raise_errors:
+                    raise TranslationError("동일한 번역 요청이 실패했습니다")
+                result = self._untranslated([misses[i][0]], target_lang, source_lang)[0]
+            results[i] = dict(result)
 
-    async def _translate_with_google(
+        return results
+
+    async def _translate_owned(
         self,
-        text: str,
+        misses: List[Tuple[str, str]],
         target_lang: str,
         source_lang: Optional[str] = None
-    ) -> Dict[str, str]:
-        """Google Cloud Translation API를 사용한 번역"""
-        if not self.google_client:
-            logger.error("Google Translation 클라이언트가 초기화되지 않았습니다")
-            return {
-                "translated_text": text,
-                "source_lang": source_lang or "ko",
-                "target_lang": target_lang
-            }
+    ) -> List[Dict[str, str]]:
+        """
+        Redis 락으로 워커 간 중복 번역 방지
 
+        다른 워커가 락을 가진 텍스트는 캐시에 결과가 저장될 때까지 잠시 기다리고,
+        제한 시간 안에 채워지지 않으면 직접 번역한다. 결과는 락을 풀기 전에 캐시에 저장하고,
+        락은 요청마다 만든 토큰을 값으로 잡아 자기 락일 때만 해제한다.
+        """
+        lock_keys = [cache_key.replace("translation:", "translation_lock:", 1) for _, cache_key in misses]
+        # held: 이 요청이 잡은 락, locked: 직접 번역할 텍스트 (락 획득 실패 시 모두 직접 번역)
+        held = [False] * len(misses)
+        locked = [True] * len(misses)
+        # 락 값 - 해제할 때 자기 락인지 확인
+        token = uuid.uuid4().hex
+        redis_client = get_async_redis()
+        if redis_client is not None:
+            try:
+                pipe = redis_client.pipeline(transaction=False)
+                for lock_key in lock_keys:
+                    pipe.set(lock_key, token, nx=True, px=SINGLE_FLIGHT_LOCK_MS)
+                held = [bool(ok) for ok in await pipe.execute()]
+                locked = held
+            except Exception as e:
+                logger.warning(f"번역 락 획득 실패: {e}")
+                mark_async_redis_down()
+
+        results: List[Optional[Dict[str, str]]] = [None] * len(misses)
+        contested = [i for i, ok in enumerate(locked) if not ok]
+        if contested:
+            metrics.counter("translation_single_flight_total", scope="redis").inc(len(contested))
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + SINGLE_FLIGHT_WAIT_SECONDS
+            while contested and loop.time() < deadline:
+                await asyncio.sleep(SINGLE_FLIGHT_POLL_SECONDS)
+                cached_values = await self.cache.get_many([misses[i][1] for i in contested])
+                still_waiting = []
+                for i, cached_value in zip(contested, cached_values):
+                    if cached_value:
+                        cached_value["cached"] = True
+                        results[i] = cached_value
+                    else:
+                        still_waiting.append(i)
+                contested = still_waiting
+
+        todo = [i for i, result in enumerate(results) if result is None]
         try:
-            # Google Translation API 호출
-            result = self.google_client.translate(
-                text,
-                target_language=target_lang,
-                source_language=source_lang
-            )
-
-            return {
-                "translated_text": result["translatedText"],
-                "source_lang": result.get("detectedSourceLanguage", source_lang or "ko"),
-                "target_lang": target_lang
-            }
-        except Exception as e:
-            logger.error(f"Google 번역 실패: {e}")
-            return {
-                "translated_text": text,
-                "source_lang": source_lang or "ko",
-                "target_lang": target_lang
-            }
+            if todo:
+                translated = await self._perform_translation([misses[i][0] for i in todo], target_lang, source_lang)
+                await self.cache.set_many([(misses[i][1], result) for i, result in zip(todo, translated)])
+                for i, result in zip(todo, translated):
+                    results[i] = result
+        finally:
+            owned_locks = [lock_key for lock_key, ok in zip(lock_keys, held) if ok]
+            if owned_locks:
+                # 락을 잡은 클라이언트로 해제 (실패해도 PX 만료로 풀림)
+                try:
+                    await redis_client.register_script(RELEASE_LOCKS_SCRIPT)(keys=owned_locks, args=[token])
+                except Exception as e:
+                    logger.warning(f"번역 락 해제 실패: {e}")
+                    mark_async_redis_down()
 
-    async def _translate_with_deepl(
+        return results
+
+    async def translate_segmented(
         self,
-        text: str,
+        texts: List[str],
         target_lang: str,
-        source_lang: Optional[str] = None
-    ) -> Dict[str, str]:
-        """DeepL API를 사용한 번역"""
-        if not self.deepl_client:
-            logger.error("DeepL 클라이언트가 초기화되지 않았습니다")
-            return {
-                "translated_text": text,
-                "source_lang": source_lang or "ko",
-                "target_lang": target_lang
-            }
+        source_lang: Optional[str] = None,
+        raise_errors: bool = False
+    ) -> List[Dict[str, str]]:
+        """
+        긴 본문용 세그먼트 단위 번역 (번역 메모리)
 
-        try:
-            # DeepL 언어 코드 매핑 (KO → KO, RU → RU, EN → EN-US)
-            deepl_target_lang = target_lang.upper()
-            if deepl_target_lang == "EN":
-                deepl_target_lang = "EN-US"
-
-            deepl_source_lang = None
-            if source_lang:
-                deepl_source_lang = source_lang.upper()
-
-            # DeepL API 호출
-            result = self.deepl_client.translate_text(
-                text,
-                target_lang=deepl_target_lang,
-                source_lang=deepl_source_lang
-            )
-
-            detected_lang = result.detected_source_lang.lower() if result.detected_source_lang else (source_lang or "ko")
-
-            return {
-                "translated_text": result.text,
-                "source_lang": detected_lang,
-                "target_lang": target_lang
-            }
-        except Exception as e:
-            logger.error(f"DeepL 번역 실패: {e}")
-            return {
-                "translated_text": text,
-                "source_lang": source_lang or "ko",
-                "target_lang": target_lang
-            }
+        각 텍스트를 split_segments()로 나눈 뒤 모든 세그먼트를 translate_batch 한 번으로 번역한다.
+        세그먼트마다 따로 캐시되므로 수정된 본문은 바뀐 문단/문장만 프로바이더로 전송되고,
+        결과는 원래 순서대로 다시 이어 붙인다.
+        """
+        split_texts = [split_segments(text or "") for text in texts]
+        segments = [piece for pieces in split_texts for piece, translatable in pieces if translatable]
 
+        translated_segments = iter(
+            await self.translate_batch(segments, target_lang, source_lang, raise_errors=raise_errors)
+        )
 
-    async def translate_batch(
+        results = []
+        for pieces in split_texts:
+            parts = []
+            cached = True
+            detected_lang = None
+            for piece, translatable in pieces:
+                if not translatable:
+                    parts.append(piece)
+                    continue
+                result = next(translated_segments)
+                parts.append(result["translated_text"])
+                cached = cached and result["cached"]
+                detected_lang = detected_lang or result["source_lang"]
+                metrics.counter("translation_segments_total", cached=str(result["cached"]).lower()).inc()
+
+            results.append({
+                "translated_text": "".join(parts),
+                "source_lang": detected_lang or source_lang or "ko",
+                "target_lang": target_lang,
+                "cached": cached
+            })
+        return results
+
+    def _build_providers(self) -> List[BaseTranslationProvider]:
+        """설정된 프로바이더 목록 (기본 프로바이더 먼저, 나머지는 장애 시 대체용)"""
+        if self.provider == TranslationProvider.STUB:
+            return [StubProvider()]
+
+        available = {}
+        if self.google_client:
+            available[TranslationProvider.GOOGLE] = GoogleProvider(self.google_client, self._run_provider_call)
+        if self.deepl_client:
+            available[TranslationProvider.DEEPL] = DeepLProvider(self.deepl_client, self._run_provider_call)
+
+        if self.provider not in available:
+            logger.error(f"{self.provider.value} 클라이언트가 초기화되지 않았습니다")
+        order = [self.provider] + [provider for provider in available if provider != self.provider]
+        return [available[provider] for provider in order if provider in available]
+
+    async def _perform_translation(
         self,
         texts: List[str],
         target_lang: str,
         source_lang: Optional[str] = None
     ) -> List[Dict[str, str]]:
-        """여러 텍스트를 일괄 번역"""
-        results = []
-        for text in texts:
-            result = await self.translate_text(text, target_lang, source_lang)
-            results.append(result)
-        return results
+        """
+        실제 번역 수행 (texts 순서대로 결과 반환)
+
+        모든 프로바이더가 실패하거나 전체 문자 수 한도를 넘으면 TranslationError
+        """
+        quota = await translation_quota.consume_global(sum(len(text) for text in texts))
+        if not quota.allowed:
+            metrics.counter("translation_quota_rejected_total", scope="global", window=quota.window).inc()
+            raise TranslationError(f"전체 번역 문자 수 한도 초과 ({quota.window}: {quota.used}/{quota.limit})")
+        return await self.router.translate(texts, target_lang, source_lang)
+
+    def _untranslated(self, texts: List[str], target_lang: str, source_lang: Optional[str]) -> List[Dict[str, str]]:
+        """번역 실패 시 원문 그대로 반환"""
+        return [
+            {
+                "translated_text": text,
+                "source_lang": source_lang or "ko",
+                "target_lang": target_lang
+            }
+            for text in texts
+        ]
 
     async def translate_content(
         self,
@@ -280,24 +531,21 @@ class TranslationService:
                 "ru": {"title": "...", "content": "..."}
             }
         """
-        translations = {}
+        keys = [key for key, value in content.items() if isinstance(value, str) and value]
 
-        for lang in target_langs:
+        async def _translate_to(lang: str) -> Dict[str, str]:
             if lang == source_lang:
-                translations[lang] = content
-                continue
+                return content
 
-            translated = {}
-            for key, value in content.items():
-                if isinstance(value, str) and value:
-                    result = await self.translate_text(value, lang, source_lang)
-                    translated[key] = result["translated_text"]
-                else:
-                    translated[key] = value
+            results = await self.translate_batch([content[key] for key in keys], lang, source_lang)
+            translated = dict(content)
+            for key, result in zip(keys, results):
+                translated[key] = result["translated_text"]
+            return translated
 
-            translations[lang] = translated
-
-        return translations
+        # 언어별 요청은 동시에 진행
+        translated_langs = await asyncio.gather(*[_translate_to(lang) for lang in target_langs])
+        return dict(zip(target_langs, translated_langs))
 
     def detect_language(self, text: str) -> str:
         """언어 자동 감지"""
@@ -319,39 +567,104 @@ class TranslationService:
 
     async def check_rate_limit(self, user_id: int) -> bool:
         """사용자별 번역 요청 제한 확인"""
-        if not self.redis_client:
+        redis_client = get_async_redis()
+        if redis_client is None:
             # Redis가 없으면 제한하지 않음
             return True
 
         try:
             key = f"translation_rate:{user_id}"
-            current_count = self.redis_client.get(key)
+            current_count = await redis_client.get(key)
 
             if current_count is None:
                 # 처음 요청
-                self.redis_client.setex(key, 60, 1)
+                await redis_client.setex(key, 60, 1)
                 return True
 
             current_count = int(current_count)
             if current_count >= settings.TRANSLATION_RATE_LIMIT_PER_MINUTE:
                 return False
 
-            self.redis_client.incr(key)
+            await redis_client.incr(key)
             return True
-        except:
+        except Exception as e:
             # Redis 오류 시 제한하지 않음
+            logger.warning(f"번역 요청 제한 확인 실패: {e}")
+            mark_async_redis_down()
             return True
 
-    def clear_cache(self, pattern: Optional[str] = None):
-        """번역 캐시 삭제"""
-        if pattern:
-            keys = self.redis_client.keys(f"translation:*{pattern}*")
-        else:
-            keys = self.redis_client.keys("translation:*")
+    async def clear_cache(self, pattern: Optional[str] = None) -> int:
+        """
+        번역 캐시 삭제
+
+        pattern이 없으면 네임스페이스 버전만 올리고 (O(1)) 새 버전 번호를,
+        있으면 SCAN + UNLINK로 일치하는 키를 나누어 삭제하고 삭제한 키 수를 반환한다.
+        """
+        if not pattern:
+            return await self.cache.bump_version()
+        return await self.cache.purge(f"translation:*{pattern}*")
 
-        if keys:
-            self.redis_client.delete(*keys)
-            logger.info(f"{len(keys)}개의 번역 캐시가 삭제되었습니다")
+class LazyTranslationService:
+    """
+    첫 사용 시 TranslationService를 생성하는 프록시
+
+    import 시점에 Redis 연결 확인, DB 설정 조회, 프로바이더 클라이언트 생성을 하지 않는다.
+    run_settings_watcher()가 번역 설정 변경을 감지하면 프로바이더 클라이언트를 다시 만든다.
+    """
+
+    def __init__(self):
+        self._instance: Optional[TranslationService] = None
+        self._init_task: Optional[asyncio.Task] = None
+        self._settings_version = None
+
+    @property
+    def initialized(self) -> bool:
+        return self._instance is not None
+
+    async def get(self) -> TranslationService:
+        """
+        생성된 TranslationService 반환
+
+        생성(Redis/DB/SDK 초기화)은 스레드에서 한 번만 하고, 동시에 들어온 요청은
+        같은 작업을 기다린다. 이벤트 루프를 막지 않는다. 실패하면 다음 호출에서 다시 시도.
+        """
+        if self._instance is None:
+            if self._init_task is None:
+                self._init_task = asyncio.create_task(self._create())
+            # 기다리던 요청이 취소돼도 생성 작업은 계속
+            await asyncio.shield(self._init_task)
+        return self._instance
+
+    async def _create(self):
+        try:
+            self._instance = await asyncio.to_thread(TranslationService)
+        finally:
+            self._init_task = None
+
+    async def warm_up(self):
+        """시작 후 백그라운드 스레드에서 미리 생성 (첫 요청이 초기화 비용을 내지 않도록)"""
+        try:
+            await self.get()
+        except Exception as e:
+            logger.error(f"번역 서비스 초기화 실패: {e}")
+
+    async def reload_settings(self):
+        """번역 설정을 다시 로드 (아직 생성 전이면 첫 사용 시 최신 설정으로 생성됨)"""
+        if self._instance is not None:
+            await asyncio.to_thread(self._instance.reload)
+
+    async def run_settings_watcher(self):
+        """SystemSettings(category=translation)의 마지막 변경 시각을 주기적으로 확인"""
+        while True:
+            try:
+                version = await asyncio.to_thread(get_settings_version)
+                if self._settings_version is not None and version != self._settings_version:
+                    logger.info("번역 설정 변경 감지 - 프로바이더 클라이언트 재생성")
+                    await self.reload_settings()
+                self._settings_version = version
+            except Exception as e:
+                logger.error(f"번역 설정 변경 확인 실패: {e}")
+            await asyncio.sleep(settings.TRANSLATION_SETTINGS_POLL_SECONDS)
 
-# 싱글톤 인스턴스
-translation_service = TranslationService()
\ No newline at end of file
+# 싱글톤 인스턴스 (첫 사용 시 초기화)
+translation_service = LazyTranslationService()
\ No newline at end of file
@@ -0,0 +1,302 @@
+import asyncio
+import json
+import time
+import uuid
+import zlib
+from typing import Dict, List, Optional, Tuple
+import redis.asyncio as aioredis
+from app.core.config import settings
+from app.db.redis import get_async_redis, mark_async_redis_down
+from app.utils.cache import SizedLRUCache
+from app.utils.logger import setup_logger
+from app.utils.metrics import metrics
+
+logger = setup_logger(__name__)
+
+# 캐시 네임스페이스 버전 (키: translation:v{버전}:{해시}) - 전체 삭제는 버전 증가로 처리
+VERSION_KEY = "translation_cache_version"
+# 다른 워커의 버전 증가를 확인하는 주기 (초)
+VERSION_CHECK_SECONDS = 5
+
+# 패턴 삭제 진행 상황 (Redis 해시, 1시간 보관)
+PURGE_KEY_PREFIX = "translation_cache_purge:"
+PURGE_STATUS_TTL = 3600
+# SCAN 1회당 조회 수 / UNLINK 1회당 삭제 수
+SCAN_BATCH_SIZE = 1000
+
+# zlib으로 압축된 값의 접두사 (압축하지 않은 값은 JSON이므로 '{'로 시작)
+COMPRESSED_PREFIX = b"z:"
+
+def _encode(result: Dict[str, str]) -> bytes:
+    data = json.dumps(result, ensure_ascii=False).encode()
+    if len(data) >= settings.TRANSLATION_CACHE_COMPRESS_MIN_BYTES:
+        return COMPRESSED_PREFIX + zlib.compress(data)
+    return data
+
+def _decode(raw: bytes) -> Dict[str, str]:
+    if raw.startswith(COMPRESSED_PREFIX):
+        raw = zlib.decompress(raw[len(COMPRESSED_PREFIX):])
+    return json.loads(raw)
+
+class TranslationCache:
+    """
+    2단계 번역 캐시
+
+    1단계: 프로세스 내 LRU (전체 바이트 크기 제한)
+    2단계: Redis (큰 값은 zlib 압축)
+
+    TTL은 SystemSettings(translation_cache_ttl, translation_local_cache_ttl)로 바꿀 수 있다.
+    조회/적중/제거 횟수는 translation_cache_* 메트릭으로 기록한다.
+    """
+
+    def __init__(self, redis_client: Optional[aioredis.Redis], db_settings: Optional[Dict[str, str]] = None):
+        # 압축 값을 저장하므로 decode_responses=False 클라이언트
+        self.redis_client = redis_client
+        self.ttl = settings.TRANSLATION_CACHE_TTL_SECONDS
+        self.local = SizedLRUCache(
+            maxbytes=settings.TRANSLATION_LOCAL_CACHE_MAX_BYTES,
+            ttl=settings.TRANSLATION_LOCAL_CACHE_TTL_SECONDS
+        )
+        self.configure(db_settings or {})
+
+        self.version = 0
+        self._version_checked_at: Optional[float] = None
+        # 진행 중인 패턴 삭제 작업 (작업 ID -> 진행 상황)
+        self._purge_jobs: Dict[str, Dict] = {}
+        self._purge_tasks = set()
+
+    def configure(self, db_settings: Dict[str, str]):
+        """SystemSettings 값으로 TTL 갱신"""
+        try:
+            if db_settings.get("translation_cache_ttl"):
+                self.ttl = int(db_settings["translation_cache_ttl"])
+            if db_settings.get("translation_local_cache_ttl"):
+                self.local.ttl = int(db_settings["translation_local_cache_ttl"])
+        except ValueError as e:
+            logger.error(f"번역 캐시 TTL 설정 오류: {e}")
+
+    def _redis(self) -> Optional[aioredis.Redis]:
+        """Redis 클라이언트 (공유 백오프 중이면 None - 요청마다 타임아웃을 기다리지 않도록)"""
+        if get_async_redis() is None:
+            return None
+        return self.redis_client
+
+    def key(self, digest: str) -> str:
+        """현재 네임스페이스 버전의 캐시 키"""
+        return f"translation:v{self.version}:{digest}"
+
+    async def refresh_version(self):
+        """VERSION_CHECK_SECONDS마다 Redis의 네임스페이스 버전 확인 (바뀌었으면 로컬 캐시 비움)"""
+        now = time.monotonic()
+        if self._version_checked_at is not None and now - self._version_checked_at < VERSION_CHECK_SECONDS:
+            return
+        self._version_checked_at = now
+
+        redis_client = self._redis()
+        if not redis_client:
+            return
+        try:
+            value = await redis_client.get(VERSION_KEY)
+        except Exception as e:
+            logger.warning(f"번역 캐시 버전 조회 실패: {e}")
+            mark_async_redis_down()
+            return
+
+        version = int(value) if value else 0
+        if version != self.version:
+            self.version = version
+            self.clear_local()
+
+    async def bump_version(self) -> int:
+        """전체 캐시 무효화 - 키를 지우지 않고 버전만 올림 (이전 버전 키는 TTL로 만료)"""
+        self.clear_local()
+        if self.redis_client:
+            self.version = int(await self.redis_client.incr(VERSION_KEY))
+        else:
+            self.version += 1
+        self._version_checked_at = time.monotonic()
+        logger.info(f"번역 캐시 버전 변경: v{self.version}")
+        return self.version
+
+    def start_purge(self, match: str) -> str:
+        """패턴 삭제를 백그라운드로 시작하고 작업 ID 반환"""
+        job_id = uuid.uuid4().hex
+        self._purge_jobs[job_id] = {"job_id": job_id, "match": match, "status": "running", "scanned": 0, "deleted": 0}
+        task = asyncio.create_task(self.purge(match, job_id))
+        self._purge_tasks.add(task)
+        task.add_done_callback(self._purge_tasks.discard)
+        return job_id
+
+    async def purge(self, match: str, job_id: Optional[str] = None) -> int:
+        """
+        SCAN + UNLINK로 패턴에 맞는 키를 나누어 삭제
+
+        KEYS와 달리 Redis를 오래 막지 않으며, 배치마다 진행 상황을 기록한다.
+        """
+        self.clear_local()
+        progress = self._purge_jobs.get(job_id) or {
+            "job_id": job_id, "match": match, "status": "running", "scanned": 0, "deleted": 0
+        }
+
+        try:
+            if self.redis_client:
+                cursor = 0
+                while True:
+                    cursor, keys = await self.redis_client.scan(cursor, match=match, count=SCAN_BATCH_SIZE)
+                    progress["scanned"] += len(keys)
+                    if keys:
+                        progress["deleted"] += await self.redis_client.unlink(*keys)
+                    await self._save_progress(progress)
+                    if cursor == 0:
+                        break
+            progress["status"] = "completed"
+            logger.info(f"번역 캐시 {progress['deleted']}개 삭제 ({match})")
+        except Exception as e:
+            progress["status"] = "failed"
+            progress["error"] = str(e)
+            logger.error(f"번역 캐시 삭제 실패 ({match}): {e}")
+            mark_async_redis_down()
+        finally:
+            await self._save_progress(progress)
+            # Redis에 기록했으면 이후 조회는 Redis에서
+            if self.redis_client:
+                self._purge_jobs.pop(job_id, None)
+
+        return progress["deleted"]
+
+    async def _save_progress(self, progress: Dict):
+        # 다른 워커에서도 진행 상황을 조회할 수 있도록 Redis에 기록
+        if not self.redis_client or not progress.get("job_id"):
+            return
+        try:
+            key = f"{PURGE_KEY_PREFIX}{progress['job_id']}"
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.hset(key, mapping={k: str(v) for k, v in progress.items()})
+            pipe.expire(key, PURGE_STATUS_TTL)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"번역 캐시 삭제 진행 상황 저장 실패: {e}")
+            mark_async_redis_down()
+
+    async def purge_status(self, job_id: str) -> Optional[Dict]:
+        if job_id in self._purge_jobs:
+            return dict(self._purge_jobs[job_id])
+        if not self.redis_client:
+            return None
+        try:
+            progress = await self.redis_client.hgetall(f"{PURGE_KEY_PREFIX}{job_id}")
+        except Exception as e:
+            logger.warning(f"번역 캐시 삭제 진행 상황 조회 실패: {e}")
+            mark_async_redis_down()
+            return None
+        if not progress:
+            return None
+        progress = {k.decode(): v.decode() for k, v in progress.items()}
+        for field in ("scanned", "deleted"):
+            progress[field] = int(progress[field])
+        return progress
+
+    def _record(self, tier: str, result: str, count: int = 1):
+        if count:
+            metrics.counter("translation_cache_requests_total", tier=tier, result=result).inc(count)
+
+    async def get_many(self, keys: List[str]) -> List[Optional[Dict[str, str]]]:
+        """키 순서대로 캐시된 결과 반환 (없으면 None) - 로컬에 없는 키만 MGET 한 번으로 조회"""
+        values: List[Optional[Dict[str, str]]] = [None] * len(keys)
+        remote_positions = []
+        for i, key in enumerate(keys):
+            cached = self.local.get(key)
+            if cached is not None:
+                values[i] = dict(cached)
+            else:
+                remote_positions.append(i)
+
+        self._record("local", "hit", len(keys) - len(remote_positions))
+        self._record("local", "miss", len(remote_positions))
+
+        redis_client = self._redis()
+        if not remote_positions or not redis_client:
+            return values
+
+        try:
+            raw_values = await redis_client.mget([keys[i] for i in remote_positions])
+        except Exception as e:
+            logger.warning(f"번역 캐시 조회 실패: {e}")
+            mark_async_redis_down()
+            return values
+
+        hits = 0
+        for i, raw in zip(remote_positions, raw_values):
+            if raw is None:
+                continue
+            try:
+                result = _decode(raw)
+            except (ValueError, zlib.error) as e:
+                logger.warning(f"번역 캐시 값 손상 ({keys[i]}): {e}")
+                continue
+            hits += 1
+            values[i] = dict(result)
+            self._set_local(keys[i], result)
+
+        self._record("redis", "hit", hits)
+        self._record("redis", "miss", len(remote_positions) - hits)
+        return values
+
+    async def set_many(self, items: List[Tuple[str, Dict[str, str]]]):
+        """(키, 결과) 목록을 두 단계에 모두 저장"""
+        if not items:
+            return
+
+        encoded = []
+        for key, result in items:
+            result = dict(result)
+            self._set_local(key, result)
+            encoded.append((key, _encode(result)))
+
+        redis_client = self._redis()
+        if not redis_client:
+            return
+
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            for key, value in encoded:
+                pipe.setex(key, self.ttl, value)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"번역 캐시 저장 실패: {e}")
+            mark_async_redis_down()
+
+    def _set_local(self, key: str, result: Dict[str, str]):
+        # 키 + 번역문 길이로 크기 근사 (UTF-8 기준)
+        size = len(key) + sum(len(str(value).encode()) for value in result.values())
+        evicted = self.local.set(key, result, size)
+        if evicted:
+            metrics.counter("translation_cache_evictions_total", tier="local").inc(evicted)
+        metrics.gauge("translation_cache_local_bytes").set(self.local.size)
+
+    def clear_local(self):
+        self.local.clear()
+        metrics.gauge("translation_cache_local_bytes").set(0)
+
+    def stats(self) -> Dict:
+        """단계별 적중률과 로컬 캐시 사용량"""
+        tiers = {}
+        for tier in ("local", "redis"):
+            hits = metrics.counter("translation_cache_requests_total", tier=tier, result="hit").snapshot()
+            misses = metrics.counter("translation_cache_requests_total", tier=tier, result="miss").snapshot()
+            tiers[tier] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            }
+
+        return {
+            **tiers,
+            "local_entries": len(self.local),
+            "local_bytes": self.local.size,
+            "local_max_bytes": self.local.maxbytes,
+            "local_evictions": metrics.counter("translation_cache_evictions_total", tier="local").snapshot(),
+            "version": self.version,
+            "ttl": self.ttl,
+            "local_ttl": self.local.ttl,
+        }
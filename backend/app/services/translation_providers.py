@@ -0,0 +1,301 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+from app.core.config import settings
+from app.utils.logger import setup_logger
+from app.utils.metrics import metrics
+
+logger = setup_logger(__name__)
+
+class TranslationError(Exception):
+    """프로바이더 번역 실패"""
+
+class BaseTranslationProvider:
+    """
+    번역 프로바이더 공통 인터페이스
+
+    translate()는 texts 순서대로 결과를 반환하고, 실패하면 TranslationError를 올린다
+    (원문을 번역 결과처럼 반환하지 않음).
+    """
+
+    name = "base"
+    max_texts_per_request = 50
+
+    async def translate(self, texts: List[str], target_lang: str, source_lang: Optional[str] = None) -> List[Dict[str, str]]:
+        results = []
+        for start in range(0, len(texts), self.max_texts_per_request):
+            chunk = texts[start:start + self.max_texts_per_request]
+            results.extend(await self._translate_chunk(chunk, target_lang, source_lang))
+        return results
+
+    async def _translate_chunk(self, texts: List[str], target_lang: str, source_lang: Optional[str]) -> List[Dict[str, str]]:
+        raise NotImplementedError
+
+# 동기 SDK 호출을 스레드 풀에서 실행하는 함수 (TranslationService._run_provider_call)
+ProviderCall = Callable[..., Awaitable]
+
+class GoogleProvider(BaseTranslationProvider):
+    """Google Cloud Translation API (여러 텍스트를 한 번의 요청으로)"""
+
+    name = "google"
+    max_texts_per_request = 128
+
+    def __init__(self, client, run_call: ProviderCall):
+        self.client = client
+        self.run_call = run_call
+
+    async def _translate_chunk(self, texts, target_lang, source_lang):
+        try:
+            results = await self.run_call(
+                self.name,
+                self.client.translate,
+                texts,
+                target_language=target_lang,
+                source_language=source_lang
+            )
+        except Exception as e:
+            raise TranslationError(f"Google 번역 실패: {e}") from e
+
+        return [
+            {
+                "translated_text": result["translatedText"],
+                "source_lang": result.get("detectedSourceLanguage", source_lang or "ko"),
+                "target_lang": target_lang
+            }
+            for result in results
+        ]
+
+class DeepLProvider(BaseTranslationProvider):
+    """DeepL API (여러 텍스트를 한 번의 요청으로)"""
+
+    name = "deepl"
+    max_texts_per_request = 50
+
+    def __init__(self, client, run_call: ProviderCall):
+        self.client = client
+        self.run_call = run_call
+
+    async def _translate_chunk(self, texts, target_lang, source_lang):
+        # DeepL 언어 코드 매핑 (KO → KO, RU → RU, EN → EN-US)
+        deepl_target_lang = target_lang.upper()
+        if deepl_target_lang == "EN":
+            deepl_target_lang = "EN-US"
+
+        try:
+            results = await self.run_call(
+                self.name,
+                self.client.translate_text,
+                texts,
+                target_lang=deepl_target_lang,
+                source_lang=source_lang.upper() if source_lang else None
+            )
+        except Exception as e:
+            raise TranslationError(f"DeepL 번역 실패: {e}") from e
+
+        return [
+            {
+                "translated_text": result.text,
+                "source_lang": result.detected_source_lang.lower() if result.detected_source_lang else (source_lang or "ko"),
+                "target_lang": target_lang
+            }
+            for result in results
+        ]
+
+class StubProvider(BaseTranslationProvider):
+    """
+    로컬 개발/테스트용 프로바이더 (네트워크 호출 없음)
+
+    "[ru] 원문" 형태로 반환하며, 지연과 실패를 흉내 낼 수 있다.
+    """
+
+    def __init__(self, name: str = "stub", delay: float = 0.0, fail: bool = False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    async def _translate_chunk(self, texts, target_lang, source_lang):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise TranslationError(f"{self.name} 번역 실패 (stub)")
+        return [
+            {
+                "translated_text": f"[{target_lang}] {text}",
+                "source_lang": source_lang or "ko",
+                "target_lang": target_lang
+            }
+            for text in texts
+        ]
+
+class CircuitBreaker:
+    """
+    연속 실패 횟수 기반 서킷 브레이커
+
+    closed: 정상 / open: reset_seconds 동안 요청 차단 /
+    half_open: 시험 요청 하나만 허용 (성공하면 closed, 실패하면 다시 open)
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+
+    def allow_request(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_seconds:
+            self.state = self.HALF_OPEN
+            return True
+        return False
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def record_cancelled(self):
+        # 시험 요청이 헤지 경쟁에서 취소되면 다음 요청이 바로 다시 시험하도록
+        if self.state == self.HALF_OPEN:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic() - self.reset_seconds
+
+class ProviderRouter:
+    """
+    프로바이더 라우터
+
+    순서대로 (기본 프로바이더 먼저) 서킷이 닫힌 프로바이더를 골라 요청하고,
+    실패하거나 제한 시간을 넘기면 다음 프로바이더로 넘어간다 (failover).
+    hedge가 켜져 있으면 응답이 해당 프로바이더의 p95 지연 시간을 넘길 때
+    다음 프로바이더에도 같은 요청을 보내 먼저 성공한 결과를 사용한다.
+    """
+
+    # p95 계산에 필요한 최소 관측 수 (부족하면 TRANSLATION_HEDGE_DEFAULT_SECONDS 사용)
+    HEDGE_MIN_SAMPLES = 20
+
+    def __init__(
+        self,
+        providers: List[BaseTranslationProvider],
+        timeout: Optional[float] = None,
+        hedge: Optional[bool] = None
+    ):
+        self.providers = providers
+        self.timeout = timeout if timeout is not None else settings.TRANSLATION_PROVIDER_TIMEOUT_SECONDS
+        self.hedge = hedge if hedge is not None else settings.TRANSLATION_HEDGE_ENABLED
+        self.breakers = {
+            provider.name: CircuitBreaker(
+                settings.TRANSLATION_CIRCUIT_FAILURE_THRESHOLD,
+                settings.TRANSLATION_CIRCUIT_RESET_SECONDS
+            )
+            for provider in providers
+        }
+
+    def _latency(self, provider: BaseTranslationProvider):
+        return metrics.histogram("translation_router_latency_seconds", provider=provider.name)
+
+    def _hedge_delay(self, provider: BaseTranslationProvider) -> float:
+        latency = self._latency(provider)
+        if latency.count < self.HEDGE_MIN_SAMPLES:
+            return settings.TRANSLATION_HEDGE_DEFAULT_SECONDS
+        return min(latency.quantile(0.95), self.timeout)
+
+    def _next_available(self, candidates: List[BaseTranslationProvider]) -> Optional[BaseTranslationProvider]:
+        while candidates:
+            provider = candidates.pop(0)
+            if self.breakers[provider.name].allow_request():
+                return provider
+            metrics.counter("translation_router_skipped_total", provider=provider.name).inc()
+        return None
+
+    async def _call(self, provider: BaseTranslationProvider, texts, target_lang, source_lang) -> List[Dict[str, str]]:
+        breaker = self.breakers[provider.name]
+        # 실패/헤지로 취소된 요청도 프로바이더에는 전송되므로 호출마다 집계
+        metrics.counter("translation_chars_sent_total", provider=provider.name).inc(sum(len(text) for text in texts))
+        started_at = time.perf_counter()
+        try:
+            results = await asyncio.wait_for(provider.translate(texts, target_lang, source_lang), self.timeout)
+        except asyncio.CancelledError:
+            breaker.record_cancelled()
+            raise
+        except Exception as e:
+            breaker.record_failure()
+            metrics.counter("translation_router_failures_total", provider=provider.name).inc()
+            if isinstance(e, asyncio.TimeoutError):
+                raise TranslationError(f"{provider.name} 응답 시간 초과 ({self.timeout}s)") from e
+            if isinstance(e, TranslationError):
+                raise
+            raise TranslationError(f"{provider.name} 번역 실패: {e}") from e
+
+        breaker.record_success()
+        self._latency(provider).observe(time.perf_counter() - started_at)
+        return results
+
+    async def translate(self, texts: List[str], target_lang: str, source_lang: Optional[str] = None) -> List[Dict[str, str]]:
+        if not self.providers:
+            raise TranslationError("설정된 번역 프로바이더가 없습니다")
+
+        candidates = list(self.providers)
+        running: Dict[asyncio.Task, BaseTranslationProvider] = {}
+        errors = []
+
+        try:
+            while True:
+                if not running:
+                    provider = self._next_available(candidates)
+                    if provider is None:
+                        break
+                    running[asyncio.ensure_future(self._call(provider, texts, target_lang, source_lang))] = provider
+
+                # 헤지: 진행 중인 요청이 하나이고 대체 프로바이더가 남아 있을 때만
+                timeout = None
+                if self.hedge and len(running) == 1 and candidates:
+                    timeout = self._hedge_delay(next(iter(running.values())))
+
+                done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    provider = self._next_available(candidates)
+                    if provider is not None:
+                        metrics.counter("translation_router_hedges_total", provider=provider.name).inc()
+                        running[asyncio.ensure_future(self._call(provider, texts, target_lang, source_lang))] = provider
+                    continue
+
+                for task in done:
+                    provider = running.pop(task)
+                    try:
+                        return task.result()
+                    except TranslationError as e:
+                        logger.warning(f"번역 프로바이더 실패 - 다음 프로바이더 시도: {e}")
+                        errors.append(str(e))
+        finally:
+            for task in running:
+                task.cancel()
+
+        raise TranslationError("; ".join(errors) or "사용 가능한 번역 프로바이더가 없습니다 (서킷 열림)")
+
+    def status(self) -> List[Dict]:
+        """프로바이더별 서킷 상태와 지연 시간"""
+        return [
+            {
+                "provider": provider.name,
+                "state": self.breakers[provider.name].state,
+                "consecutive_failures": self.breakers[provider.name].failures,
+                "p50": self._latency(provider).quantile(0.5),
+                "p95": self._latency(provider).quantile(0.95),
+                "failures": metrics.counter("translation_router_failures_total", provider=provider.name).snapshot(),
+                "hedges": metrics.counter("translation_router_hedges_total", provider=provider.name).snapshot(),
+                "chars_sent": metrics.counter("translation_chars_sent_total", provider=provider.name).snapshot(),
+            }
+            for provider in self.providers
+        ]
@@ -0,0 +1,239 @@
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+import redis.asyncio as aioredis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.db.redis import get_async_redis, mark_async_redis_down
+from app.models.post import Post, TranslationStatus
+from app.services.response_cache import response_cache, post_tags
+from app.services.translation import translation_service
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Redis 리스트: 바로 처리할 작업 (JSON)
+QUEUE_KEY = "translation_jobs:ready"
+# Redis ZSET: 재시도 대기 작업 (score = 실행 가능 시각)
+DELAYED_KEY = "translation_jobs:delayed"
+# 여러 프로세스가 동시에 복구 스캔을 하지 않도록 하는 락
+RECOVER_LOCK_KEY = "translation_jobs:recover_lock"
+
+# 실행 시각이 지난 재시도 작업을 대기열로 옮김
+# KEYS = [DELAYED_KEY, QUEUE_KEY], ARGV = [현재 시각]
+PROMOTE_SCRIPT = """
+local jobs = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, 100)
+for _, job in ipairs(jobs) do
+    redis.call('ZREM', KEYS[1], job)
+    redis.call('RPUSH', KEYS[2], job)
+end
+return #jobs
+"""
+
+# 번역 대상 게시글 필드
+POST_FIELDS = ("title", "content", "summary")
+
+MAX_RETRY_DELAY = 300
+
+async def translate_post(db: AsyncSession, post: Post, fields: Iterable[str] = POST_FIELDS) -> bool:
+    """
+    게시글의 현재 원문을 번역해 translated_* 필드와 상태를 설정 (커밋은 호출자가)
+
+    번역하는 동안 원문이 수정됐다면 아무것도 바꾸지 않고 False를 반환한다
+    (그 수정이 넣은 작업이 처리). 번역 실패 시 TranslationError.
+    """
+    source_lang = post.source_lang or "ko"
+    target_lang = "ru" if source_lang == "ko" else "ko"
+    fields = list(fields)
+    to_translate = [field for field in fields if getattr(post, field)]
+    texts = [getattr(post, field) for field in to_translate]
+
+    # 본문은 문단/문장 단위로 캐시되므로 수정된 부분만 프로바이더로 전송
+    service = await translation_service.get()
+    results = await service.translate_segmented(
+        texts,
+        target_lang=target_lang,
+        source_lang=source_lang,
+        raise_errors=True
+    )
+
+    # 번역하는 동안 원문이 수정됐는지 확인 (원문 필드만 다시 읽음)
+    if to_translate:
+        await db.refresh(post, attribute_names=to_translate)
+    if [getattr(post, field) for field in to_translate] != texts:
+        return False
+
+    for field in fields:
+        if field in to_translate:
+            result = results[to_translate.index(field)]
+            setattr(post, f"translated_{field}_{source_lang}", getattr(post, field))
+            setattr(post, f"translated_{field}_{target_lang}", result["translated_text"])
+        else:
+            # 비어 있는 필드 (예: 요약 삭제)
+            setattr(post, f"translated_{field}_ko", None)
+            setattr(post, f"translated_{field}_ru", None)
+
+    post.auto_translated = True
+    post.translation_status = TranslationStatus.COMPLETED
+    logger.info(f"게시글 ID {post.id} 자동 번역 완료: {source_lang} → {target_lang}")
+    return True
+
+class TranslationJobQueue:
+    """
+    게시글 번역 작업 큐
+
+    작업은 Redis 리스트에 넣고 워커가 꺼내 처리한다.
+    실패하면 지수 백오프로 재시도하고, 최대 시도 횟수를 넘기면 FAILED로 표시한다.
+    Redis가 없으면 프로세스 내 asyncio.Queue를 사용한다.
+
+    DB의 translation_status = PENDING이 원본 기록이므로
+    큐에서 유실된 작업(재시작, Redis 장애)은 run_recovery()가 다시 넣는다.
+    """
+
+    def __init__(self):
+        self._redis: Optional[aioredis.Redis] = None
+        self._promote = None
+        self._local: Optional[asyncio.Queue] = None
+
+    def _local_queue(self) -> asyncio.Queue:
+        if self._local is None:
+            self._local = asyncio.Queue()
+        return self._local
+
+    def _blocking_redis(self) -> aioredis.Redis:
+        # BLPOP 대기 시간이 공유 클라이언트의 socket_timeout보다 길어 전용 클라이언트 사용
+        if self._redis is None:
+            self._redis = aioredis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_connect_timeout=0.5
+            )
+            self._promote = self._redis.register_script(PROMOTE_SCRIPT)
+        return self._redis
+
+    async def enqueue(self, post_id: int, fields: Iterable[str] = POST_FIELDS, attempt: int = 0, delay: float = 0):
+        """번역 작업 추가 (delay초 뒤 실행)"""
+        job = json.dumps({"post_id": post_id, "fields": list(fields), "attempt": attempt})
+
+        redis_client = get_async_redis()
+        if redis_client is not None:
+            try:
+                if delay > 0:
+                    await redis_client.zadd(DELAYED_KEY, {job: time.time() + delay})
+                else:
+                    await redis_client.rpush(QUEUE_KEY, job)
+                return
+            except Exception as e:
+                logger.warning(f"번역 작업 Redis 등록 실패 - 프로세스 내 큐 사용: {e}")
+                mark_async_redis_down()
+
+        queue = self._local_queue()
+        if delay > 0:
+            asyncio.get_running_loop().call_later(delay, queue.put_nowait, job)
+        else:
+            queue.put_nowait(job)
+
+    async def _next_job(self, timeout: int = 1) -> Optional[dict]:
+        queue = self._local_queue()
+        if not queue.empty():
+            return json.loads(queue.get_nowait())
+
+        if get_async_redis() is not None:
+            try:
+                redis_client = self._blocking_redis()
+                await self._promote(keys=[DELAYED_KEY, QUEUE_KEY], args=[time.time()])
+                item = await redis_client.blpop(QUEUE_KEY, timeout=timeout)
+                return json.loads(item[1]) if item else None
+            except Exception as e:
+                logger.warning(f"번역 작업 조회 실패: {e}")
+                mark_async_redis_down()
+
+        try:
+            return json.loads(await asyncio.wait_for(queue.get(), timeout))
+        except asyncio.TimeoutError:
+            return None
+
+    async def process(self, job: dict):
+        """작업 하나 처리 - 게시글의 현재 원문을 번역해 translated_* 필드를 채움"""
+        post_id = job["post_id"]
+        attempt = job.get("attempt", 0)
+        fields = [field for field in job["fields"] if field in POST_FIELDS]
+
+        async with AsyncSessionLocal() as db:
+            post = await db.get(Post, post_id)
+            if not post:
+                return
+
+            try:
+                await translate_post(db, post, fields)
+            except Exception as e:
+                if attempt + 1 >= settings.TRANSLATION_JOB_MAX_ATTEMPTS:
+                    post.translation_status = TranslationStatus.FAILED
+                    await db.commit()
+                    logger.error(f"게시글 ID {post_id} 번역 실패 ({attempt + 1}회 시도): {e}")
+                else:
+                    delay = min(settings.TRANSLATION_JOB_RETRY_BASE_SECONDS * 2 ** attempt, MAX_RETRY_DELAY)
+                    await self.enqueue(post_id, fields, attempt + 1, delay)
+                    logger.warning(f"게시글 ID {post_id} 번역 실패 - {delay:.0f}초 후 재시도: {e}")
+                return
+
+            await db.commit()
+            await response_cache.invalidate(post_tags(post.category_id))
+
+    async def run_worker(self):
+        """작업을 하나씩 꺼내 처리하는 워커 (lifespan에서 TRANSLATION_WORKERS개 실행)"""
+        while True:
+            job = await self._next_job()
+            if job is None:
+                continue
+            try:
+                await self.process(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"번역 작업 처리 실패 ({job}): {e}")
+
+    async def recover(self) -> int:
+        """오래 PENDING 상태인 게시글을 다시 큐에 넣음"""
+        stale_before = datetime.utcnow() - timedelta(seconds=settings.TRANSLATION_JOB_STALE_SECONDS)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Post.id).where(
+                    Post.translation_status == TranslationStatus.PENDING,
+                    Post.updated_at < stale_before
+                )
+            )
+            post_ids = result.scalars().all()
+
+        for post_id in post_ids:
+            await self.enqueue(post_id)
+        if post_ids:
+            logger.info(f"대기 중인 번역 작업 {len(post_ids)}건 재등록")
+        return len(post_ids)
+
+    async def run_recovery(self):
+        """시작 시와 이후 주기적으로 유실된 작업 복구"""
+        interval = settings.TRANSLATION_JOB_STALE_SECONDS
+        while True:
+            # Redis를 쓸 수 없으면 락 없이 복구 (중복 등록돼도 번역 결과는 같음)
+            acquired = True
+            redis_client = get_async_redis()
+            if redis_client is not None:
+                try:
+                    acquired = await redis_client.set(RECOVER_LOCK_KEY, 1, nx=True, ex=interval)
+                except Exception as e:
+                    logger.warning(f"번역 작업 복구 락 획득 실패: {e}")
+                    mark_async_redis_down()
+            try:
+                if acquired:
+                    await self.recover()
+            except Exception as e:
+                logger.error(f"번역 작업 복구 실패: {e}")
+            await asyncio.sleep(interval)
+
+# 싱글톤 인스턴스
+translation_queue = TranslationJobQueue()
@@ -0,0 +1,164 @@
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from app.core.config import settings
+from app.db.redis import get_async_redis, mark_async_redis_down
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 롤링 윈도 하나를 나누는 버킷 수 (1시간 윈도 = 1분 버킷 60개)
+BUCKETS = 60
+
+# 윈도별 Redis 해시 (필드: 버킷 번호 -> 문자 수)를 합산해 한도를 확인하고, 모두 통과하면 현재 버킷에 더함
+# KEYS = 윈도 키 목록, ARGV = [현재 시각(초), 문자 수, 윈도1 길이(초), 윈도1 한도, 윈도2 길이, ...]
+# 반환: {허용 여부, 초과한 윈도 번호(1부터), 초과한 윈도의 사용량}
+QUOTA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local chars = tonumber(ARGV[2])
+for i, key in ipairs(KEYS) do
+    local window = tonumber(ARGV[1 + i * 2])
+    local limit = tonumber(ARGV[2 + i * 2])
+    local current = math.floor(now / (window / 60))
+    local used = 0
+    local buckets = redis.call('HGETALL', key)
+    for j = 1, #buckets, 2 do
+        if tonumber(buckets[j]) <= current - 60 then
+            redis.call('HDEL', key, buckets[j])
+        else
+            used = used + tonumber(buckets[j + 1])
+        end
+    end
+    if limit > 0 and used + chars > limit then
+        return {0, i, used}
+    end
+end
+for i, key in ipairs(KEYS) do
+    local window = tonumber(ARGV[1 + i * 2])
+    redis.call('HINCRBY', key, math.floor(now / (window / 60)), chars)
+    redis.call('EXPIRE', key, window)
+end
+return {1, 0, 0}
+"""
+
+@dataclass(frozen=True)
+class QuotaWindow:
+    name: str
+    seconds: int
+    limit: int  # 0이면 제한 없음 (사용량만 집계)
+
+@dataclass(frozen=True)
+class QuotaResult:
+    allowed: bool
+    window: Optional[str] = None
+    limit: int = 0
+    used: int = 0
+    retry_after: float = 0  # 초 (가장 오래된 버킷이 빠질 때까지)
+
+def user_windows() -> List[QuotaWindow]:
+    return [
+        QuotaWindow("hour", 3600, settings.TRANSLATION_USER_CHARS_PER_HOUR),
+        QuotaWindow("day", 86400, settings.TRANSLATION_USER_CHARS_PER_DAY),
+    ]
+
+def global_windows() -> List[QuotaWindow]:
+    return [
+        QuotaWindow("hour", 3600, settings.TRANSLATION_GLOBAL_CHARS_PER_HOUR),
+        QuotaWindow("day", 86400, settings.TRANSLATION_GLOBAL_CHARS_PER_DAY),
+    ]
+
+class CharQuota:
+    """
+    번역 문자 수 한도 (롤링 윈도)
+
+    사용자별 한도는 번역 API 요청 문자 수로, 전체 한도는 캐시에 없어
+    실제로 프로바이더에 보내는 문자 수로 차감한다.
+    Redis 오류 시 RECONNECT_INTERVAL 동안 프로세스 내 카운터로 대체한다 (get_async_redis 백오프).
+    """
+
+    def __init__(self):
+        self._script = None
+        # 키 -> {버킷 번호: 문자 수}
+        self._local: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self._lock = threading.Lock()
+
+    def _key(self, scope: str, window: QuotaWindow) -> str:
+        return f"translation_quota:{scope}:{window.name}"
+
+    async def consume_user(self, user_id: int, chars: int) -> QuotaResult:
+        return await self.consume(f"user:{user_id}", user_windows(), chars)
+
+    async def consume_global(self, chars: int) -> QuotaResult:
+        return await self.consume("global", global_windows(), chars)
+
+    async def consume(self, scope: str, windows: List[QuotaWindow], chars: int) -> QuotaResult:
+        """모든 윈도가 한도 안이면 chars만큼 차감하고 허용, 하나라도 넘으면 차감 없이 거부"""
+        keys = [self._key(scope, window) for window in windows]
+        now = time.time()
+
+        redis_client = get_async_redis()
+        if redis_client is not None:
+            try:
+                if self._script is None:
+                    self._script = redis_client.register_script(QUOTA_SCRIPT)
+                args = [now, chars]
+                for window in windows:
+                    args.extend([window.seconds, window.limit])
+                allowed, index, used = await self._script(keys=keys, args=args)
+                return self._result(windows, bool(allowed), int(index), int(used))
+            except Exception as e:
+                logger.warning(f"번역 문자 한도 Redis 확인 실패 - 로컬 카운터 사용: {e}")
+                mark_async_redis_down()
+
+        with self._lock:
+            for i, (key, window) in enumerate(zip(keys, windows), start=1):
+                used = self._local_used(key, window, now)
+                if window.limit > 0 and used + chars > window.limit:
+                    return self._result(windows, False, i, used)
+            for key, window in zip(keys, windows):
+                bucket = int(now // (window.seconds / BUCKETS))
+                self._local[key][bucket] = self._local[key].get(bucket, 0) + chars
+        return QuotaResult(allowed=True)
+
+    def _local_used(self, key: str, window: QuotaWindow, now: float) -> int:
+        current = int(now // (window.seconds / BUCKETS))
+        buckets = self._local[key]
+        for bucket in [bucket for bucket in buckets if bucket <= current - BUCKETS]:
+            del buckets[bucket]
+        return sum(buckets.values())
+
+    def _result(self, windows: List[QuotaWindow], allowed: bool, index: int, used: int) -> QuotaResult:
+        if allowed:
+            return QuotaResult(allowed=True)
+        window = windows[index - 1]
+        return QuotaResult(
+            allowed=False,
+            window=window.name,
+            limit=window.limit,
+            used=used,
+            retry_after=window.seconds / BUCKETS
+        )
+
+    async def usage(self, scope: str, windows: List[QuotaWindow]) -> List[Dict]:
+        """윈도별 현재 사용량"""
+        now = time.time()
+        usage = []
+        redis_client = get_async_redis()
+        for window in windows:
+            key = self._key(scope, window)
+            current = int(now // (window.seconds / BUCKETS))
+            with self._lock:
+                used = self._local_used(key, window, now)
+            if redis_client is not None:
+                try:
+                    buckets = await redis_client.hgetall(key)
+                    used += sum(int(count) for bucket, count in buckets.items() if int(bucket) > current - BUCKETS)
+                except Exception as e:
+                    logger.warning(f"번역 문자 사용량 조회 실패: {e}")
+            usage.append({"window": window.name, "seconds": window.seconds, "limit": window.limit, "used": used})
+        return usage
+
+# 싱글톤 인스턴스
+translation_quota = CharQuota()
@@ -0,0 +1,150 @@
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Dict
+from sqlalchemy import bindparam, update
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.db.redis import get_async_redis, mark_async_redis_down
+from app.models.post import Post
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Redis 해시: 필드 post_id -> 아직 DB에 반영되지 않은 조회수
+PENDING_KEY = "post_views:pending"
+# DB에 반영 중인 조회수 (반영이 끝나야 삭제 - 실패하거나 프로세스가 죽으면 다음 반영에서 다시 읽음)
+FLUSHING_KEY = "post_views:flushing"
+# 한 주기에 한 워커만 FLUSHING_KEY를 처리하도록 하는 락 (풀지 않고 주기만큼 유지)
+FLUSH_LOCK_KEY = "post_views:flush_lock"
+
+class ViewCounter:
+    """
+    게시글 조회수 write-behind 버퍼
+
+    조회 시에는 Redis(없으면 프로세스 메모리)에만 증가시키고,
+    주기적으로 모아서 posts.view_count에 한 번에 반영한다.
+    """
+
+    def __init__(self):
+        self._local: Dict[int, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    async def increment(self, post_id: int):
+        """조회수 1 증가 (DB에는 다음 반영 때 더해짐)"""
+        redis_client = get_async_redis()
+        if redis_client is not None:
+            try:
+                await redis_client.hincrby(PENDING_KEY, post_id, 1)
+                return
+            except Exception as e:
+                logger.warning(f"조회수 버퍼 갱신 실패: {e}")
+                mark_async_redis_down()
+
+        with self._lock:
+            self._local[post_id] += 1
+
+    def _drain_local(self) -> Dict[int, int]:
+        """프로세스 메모리 버퍼를 비우고 누적분 반환"""
+        with self._lock:
+            deltas = dict(self._local)
+            self._local.clear()
+        return deltas
+
+    async def _claim_redis(self) -> Dict[int, int]:
+        """
+        Redis 버퍼에서 이번에 반영할 조회수를 FLUSHING_KEY로 떼어내 반환
+
+        이전 반영이 끝나지 못해 FLUSHING_KEY가 남아 있으면 그것부터 반영한다
+        (RENAME으로 덮어쓰지 않음). 새 조회는 그동안 PENDING_KEY에 쌓인다.
+        """
+        redis_client = get_async_redis()
+        if redis_client is None:
+            return {}
+
+        try:
+            # 다른 워커가 이번 주기를 처리 중이면 건너뜀 (같은 FLUSHING_KEY를 두 번 반영하지 않도록)
+            if not await redis_client.set(FLUSH_LOCK_KEY, 1, nx=True, ex=settings.VIEW_COUNT_FLUSH_SECONDS):
+                return {}
+            if not await redis_client.exists(FLUSHING_KEY):
+                if not await redis_client.exists(PENDING_KEY):
+                    return {}
+                await redis_client.rename(PENDING_KEY, FLUSHING_KEY)
+            flushing = await redis_client.hgetall(FLUSHING_KEY)
+        except Exception as e:
+            logger.warning(f"조회수 버퍼 읽기 실패: {e}")
+            mark_async_redis_down()
+            return {}
+
+        return {int(post_id): int(count) for post_id, count in flushing.items()}
+
+    async def _release_redis(self):
+        """DB 반영이 끝난 FLUSHING_KEY 삭제"""
+        redis_client = get_async_redis()
+        if redis_client is None:
+            return
+        try:
+            await redis_client.delete(FLUSHING_KEY)
+        except Exception as e:
+            # 남은 FLUSHING_KEY는 다음 반영에서 한 번 더 더해짐
+            logger.warning(f"조회수 버퍼 삭제 실패: {e}")
+            mark_async_redis_down()
+
+    def _restore(self, deltas: Dict[int, int]):
+        """DB 반영 실패 시 버퍼로 되돌림"""
+        with self._lock:
+            for post_id, count in deltas.items():
+                self._local[post_id] += count
+
+    async def flush(self) -> int:
+        """누적된 조회수를 한 번의 배치 UPDATE로 반영"""
+        local_deltas = self._drain_local()
+        redis_deltas = await self._claim_redis()
+
+        deltas = dict(local_deltas)
+        for post_id, count in redis_deltas.items():
+            deltas[post_id] = deltas.get(post_id, 0) + count
+        if not deltas:
+            return 0
+
+        posts = Post.__table__
+        stmt = (
+            update(posts)
+            .where(posts.c.id == bindparam("b_id"))
+            # updated_at은 그대로 (onupdate 적용 방지 - 조회수는 내용 변경이 아니므로 ETag/응답 캐시 버전 유지)
+            .values(view_count=posts.c.view_count + bindparam("b_delta"), updated_at=posts.c.updated_at)
+        )
+        try:
+            async with AsyncSessionLocal() as db:
+                connection = await db.connection()
+                await connection.execute(stmt, [
+                    {"b_id": post_id, "b_delta": count} for post_id, count in deltas.items()
+                ])
+                await db.commit()
+        except Exception:
+            # Redis 분은 FLUSHING_KEY에 남아 있으므로 로컬 분만 되돌림
+            self._restore(local_deltas)
+            raise
+
+        if redis_deltas:
+            await self._release_redis()
+        return len(deltas)
+
+    async def run_flusher(self):
+        """주기적 반영 루프 (lifespan에서 실행, 종료 시 마지막으로 한 번 더 반영)"""
+        try:
+            while True:
+                await asyncio.sleep(settings.VIEW_COUNT_FLUSH_SECONDS)
+                try:
+                    await self.flush()
+                except Exception as e:
+                    logger.error(f"조회수 반영 실패: {e}")
+        except asyncio.CancelledError:
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"종료 시 조회수 반영 실패: {e}")
+            raise
+
+# 싱글톤 인스턴스
+view_counter = ViewCounter()
@@ -0,0 +1,112 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+class TTLCache:
+    """
+    만료 시간이 있는 LRU 캐시 (스레드 안전)
+
+    maxsize를 넘으면 가장 오래 사용하지 않은 항목부터 제거한다.
+    항목별 만료 시각(expires_at)을 지정하지 않으면 기본 ttl을 사용한다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at <= time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, expires_at: Optional[float] = None):
+        if expires_at is None:
+            expires_at = time.time() + self.ttl
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+class SizedLRUCache:
+    """
+    전체 크기(바이트) 상한이 있는 만료 LRU 캐시 (스레드 안전)
+
+    set() 시 항목 크기를 함께 받고, 합계가 maxbytes를 넘으면
+    가장 오래 사용하지 않은 항목부터 제거한다.
+    """
+
+    def __init__(self, maxbytes: int, ttl: float):
+        self.maxbytes = maxbytes
+        self.ttl = ttl
+        self.size = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, size, expires_at = item
+            if expires_at <= time.time():
+                del self._data[key]
+                self.size -= size
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, size: int, expires_at: Optional[float] = None) -> int:
+        """항목 저장 후 공간 확보를 위해 제거한 항목 수 반환"""
+        if size > self.maxbytes:
+            return 0
+        if expires_at is None:
+            expires_at = time.time() + self.ttl
+
+        evicted = 0
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.size -= old[1]
+            self._data[key] = (value, size, expires_at)
+            self.size += size
+            while self.size > self.maxbytes:
+                _, (_, evicted_size, _) = self._data.popitem(last=False)
+                self.size -= evicted_size
+                evicted += 1
+        return evicted
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.size -= old[1]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,25 @@
+import hashlib
+from fastapi import Request, Response
+
+def make_etag(*parts, weak: bool = False) -> str:
+    """버전 값(id, updated_at 등)으로 ETag 생성 - 응답 본문을 직렬화하지 않고 계산"""
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+def etag_for_bytes(body: bytes) -> str:
+    """직렬화된 본문의 해시로 ETag 생성"""
+    return f'"{hashlib.sha1(body).hexdigest()}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더와 비교 (RFC 7232 약한 비교 - W/ 접두사 무시)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    tag = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == tag for candidate in header.split(","))
+
+def not_modified(etag: str, cache_control: str = "no-cache") -> Response:
+    """304 응답 (본문 없음)"""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
@@ -0,0 +1,111 @@
+import bisect
+import threading
+from typing import Dict, List, Tuple
+
+# 지연 시간 히스토그램 기본 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class Counter:
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self.value += amount
+
+    def snapshot(self):
+        return self.value
+
+class Gauge(Counter):
+    def dec(self, amount: float = 1):
+        self.inc(-amount)
+
+    def set(self, value: float):
+        with self._lock:
+            self.value = value
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        with self._lock:
+            self.counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """버킷 상한 기준 근사 분위수 (관측값이 없으면 0)"""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            target = q * self.count
+            seen = 0
+            for i, bucket_count in enumerate(self.counts):
+                seen += bucket_count
+                if seen >= target:
+                    return self.buckets[i] if i < len(self.buckets) else float("inf")
+            return float("inf")
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            buckets = {str(le): count for le, count in zip(self.buckets, self.counts)}
+            buckets["+Inf"] = self.counts[-1]
+            count, total = self.count, self.sum
+        return {
+            "count": count,
+            "sum": round(total, 6),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": buckets,
+        }
+
+class MetricsRegistry:
+    """
+    프로세스 내 메트릭 저장소
+
+    같은 이름과 라벨로 요청하면 같은 객체를 반환한다.
+    값은 워커별로 집계된다.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[Tuple[str, str, Tuple], object] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, kind: str, factory, name: str, labels: Dict[str, str]):
+        key = (kind, name, tuple(sorted(labels.items())))
+        metric = self._metrics.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.setdefault(key, factory())
+        return metric
+
+    def counter(self, name: str, **labels) -> Counter:
+        return self._get("counter", Counter, name, labels)
+
+    def gauge(self, name: str, **labels) -> Gauge:
+        return self._get("gauge", Gauge, name, labels)
+
+    def histogram(self, name: str, **labels) -> Histogram:
+        return self._get("histogram", Histogram, name, labels)
+
+    def snapshot(self, prefix: str = "") -> Dict[str, List[Dict]]:
+        """{메트릭 이름: [{"labels": {...}, "value": ...}, ...]}"""
+        result: Dict[str, List[Dict]] = {}
+        for (kind, name, labels), metric in list(self._metrics.items()):
+            if not name.startswith(prefix):
+                continue
+            result.setdefault(name, []).append({
+                "type": kind,
+                "labels": dict(labels),
+                "value": metric.snapshot(),
+            })
+        return result
+
+# 싱글톤 인스턴스
+metrics = MetricsRegistry()
@@ -0,0 +1,24 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+CURSOR_NEXT = "next"
+CURSOR_PREV = "prev"
+
+def encode_cursor(is_pinned: bool, created_at: datetime, post_id: int, direction: str = CURSOR_NEXT) -> str:
+    """(is_pinned, created_at, id) 키를 불투명한 커서 문자열로 인코딩"""
+    payload = [1 if is_pinned else 0, created_at.isoformat(), post_id, direction]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Optional[Tuple[bool, datetime, int, str]]:
+    """커서 문자열 디코딩 - 형식이 잘못된 경우 None 반환"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        is_pinned, created_at, post_id, direction = json.loads(base64.urlsafe_b64decode(padded))
+        if direction not in (CURSOR_NEXT, CURSOR_PREV):
+            return None
+        return bool(is_pinned), datetime.fromisoformat(created_at), int(post_id), direction
+    except (ValueError, TypeError):
+        return None
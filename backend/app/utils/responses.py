@@ -0,0 +1,5 @@
+from fastapi import Response
+
+class RawJSONResponse(Response):
+    """이미 직렬화된 JSON 바이트를 그대로 보내는 응답 (다시 인코딩하지 않음)"""
+    media_type = "application/json"
@@ -0,0 +1,30 @@
+"""Add board order index to posts
+
+Revision ID: b3e1f0a7c2d4
+Revises: 9f6d420a68f6
+Create Date: 2026-10-18 10:12:31.402117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3e1f0a7c2d4'
+down_revision = '9f6d420a68f6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 게시판 목록 키셋 페이지네이션 (category_id, status, is_pinned, created_at, id)
+    op.create_index(
+        'ix_posts_board_order',
+        'posts',
+        ['category_id', 'status', 'is_pinned', 'created_at', 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_posts_board_order', table_name='posts')
@@ -0,0 +1,51 @@
+"""Add translation status to posts
+
+Revision ID: c5d2a8e41f90
+Revises: b3e1f0a7c2d4
+Create Date: 2026-10-18 11:04:52.218840
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5d2a8e41f90'
+down_revision = 'b3e1f0a7c2d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Detect database dialect
+    bind = op.get_bind()
+    dialect_name = bind.dialect.name
+
+    # Check if column already exists
+    from sqlalchemy import inspect
+    inspector = inspect(bind)
+    existing_columns = [col['name'] for col in inspector.get_columns('posts')]
+
+    if 'translation_status' in existing_columns:
+        print("translation_status column already exists, skipping...")
+        return
+
+    if dialect_name == 'postgresql':
+        translation_status = sa.Enum('NONE', 'PENDING', 'COMPLETED', 'FAILED', name='translationstatus')
+        translation_status.create(bind, checkfirst=True)
+        op.add_column('posts', sa.Column('translation_status', translation_status, nullable=True))
+    else:
+        # SQLite-specific migration (uses string type for enums)
+        op.add_column('posts', sa.Column('translation_status', sa.String(20), nullable=True))
+
+    # Existing posts: auto-translated ones are complete, the rest never requested translation
+    op.execute("UPDATE posts SET translation_status = 'COMPLETED' WHERE auto_translated = true")
+    op.execute("UPDATE posts SET translation_status = 'NONE' WHERE translation_status IS NULL")
+
+    op.create_index('ix_posts_translation_status', 'posts', ['translation_status'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_posts_translation_status', table_name='posts')
+    op.drop_column('posts', 'translation_status')
+    op.execute("DROP TYPE IF EXISTS translationstatus")
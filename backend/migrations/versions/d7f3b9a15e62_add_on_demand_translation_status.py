@@ -0,0 +1,30 @@
+"""Add on_demand translation status
+
+Revision ID: d7f3b9a15e62
+Revises: c5d2a8e41f90
+Create Date: 2026-10-18 13:21:07.614205
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7f3b9a15e62'
+down_revision = 'c5d2a8e41f90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    if bind.dialect.name == 'postgresql':
+        op.execute("ALTER TYPE translationstatus ADD VALUE IF NOT EXISTS 'ON_DEMAND'")
+
+    # SQLite stores enums as strings - nothing to do
+
+
+def downgrade() -> None:
+    # PostgreSQL doesn't support removing enum values easily
+    op.execute("UPDATE posts SET translation_status = 'PENDING' WHERE translation_status = 'ON_DEMAND'")
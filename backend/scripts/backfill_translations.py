@@ -0,0 +1,280 @@
+"""
+번역되지 않은 게시글 / 댓글 / 파트너 리뷰 일괄 번역 스크립트
+
+- 서버 측 커서로 번역이 비어 있는 행만 id 순으로 스트리밍
+- batch-size개씩 묶어 프로바이더 다중 텍스트 API로 번역 (번역 캐시, 세그먼트 캐시 사용)
+- 동시 배치 수(--concurrency)와 분당 문자 수(--chars-per-minute) 제한
+- 배치가 끝날 때마다 체크포인트 저장 - 중단 후 다시 실행하면 이어서 진행
+- 결과는 배치마다 executemany UPDATE 한 번으로 저장하고 게시글 목록 응답 캐시 무효화
+
+사용법:
+    python scripts/backfill_translations.py
+    python scripts/backfill_translations.py --models post,comment --concurrency 8 --chars-per-minute 500000
+    python scripts/backfill_translations.py --reset   # 체크포인트 무시하고 처음부터
+"""
+import sys
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# UTF-8 인코딩 설정 (Windows 호환)
+if sys.platform == 'win32':
+    import codecs
+    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
+    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+
+# 프로젝트 루트를 Python 경로에 추가
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from sqlalchemy import and_, bindparam, or_, select, update
+from app.db.database import AsyncSessionLocal, async_engine
+from app.models.post import Post, Comment, PostStatus, TranslationStatus
+from app.models.partner import PartnerReview
+from app.services.response_cache import response_cache, post_tags
+from app.services.translation import translation_service
+
+DEFAULT_CHECKPOINT = backend_path / ".backfill_translations.json"
+
+# 모델별 번역 대상: (모델, 번역 필드, 대상 행 조건, 완료 시 추가로 설정할 값)
+TARGETS = {
+    "post": (
+        Post,
+        ("title", "content", "summary"),
+        Post.status != PostStatus.DELETED,
+        {"auto_translated": True, "translation_status": TranslationStatus.COMPLETED},
+    ),
+    "comment": (
+        Comment,
+        ("content",),
+        Comment.is_deleted == False,
+        {"auto_translated": True},
+    ),
+    "review": (
+        PartnerReview,
+        ("content",),
+        None,
+        {},
+    ),
+}
+
+def other_lang(lang: Optional[str]) -> str:
+    return "ko" if lang == "ru" else "ru"
+
+class CharBudget:
+    """분당 문자 수 토큰 버킷 (한 번에 한도보다 많이 요청하면 버킷이 가득 찰 때까지 기다림)"""
+
+    def __init__(self, chars_per_minute: int):
+        self.capacity = chars_per_minute
+        self.rate = chars_per_minute / 60
+        self.tokens = float(chars_per_minute)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, chars: int):
+        chars = min(chars, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= chars:
+                    self.tokens -= chars
+                    return
+                await asyncio.sleep((chars - self.tokens) / self.rate)
+
+class Checkpoint:
+    """
+    모델별 마지막으로 완료된 id 저장
+
+    배치는 순서와 관계없이 끝나므로, 앞선 배치가 모두 끝난 지점까지만 전진한다.
+    """
+
+    def __init__(self, path: Path, reset: bool):
+        self.path = path
+        self.data: Dict[str, int] = {}
+        if path.exists() and not reset:
+            self.data = json.loads(path.read_text())
+        self._dispatched: Dict[str, List[List]] = {}
+
+    def last_id(self, name: str) -> int:
+        return self.data.get(name, 0)
+
+    def dispatched(self, name: str, last_id: int) -> List:
+        entry = [last_id, False]
+        self._dispatched.setdefault(name, []).append(entry)
+        return entry
+
+    def completed(self, name: str, entry: List):
+        entry[1] = True
+        pending = self._dispatched[name]
+        advanced = False
+        while pending and pending[0][1]:
+            self.data[name] = pending.pop(0)[0]
+            advanced = True
+        if advanced:
+            self.path.write_text(json.dumps(self.data))
+
+class Backfill:
+    def __init__(self, args):
+        self.args = args
+        self.budget = CharBudget(args.chars_per_minute)
+        self.checkpoint = Checkpoint(Path(args.checkpoint), args.reset)
+        self.stats = {"rows": 0, "chars": 0, "failed_batches": 0}
+
+    async def run(self, name: str):
+        model, fields, condition, extra_values = TARGETS[name]
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.args.concurrency * 2)
+
+        workers = [
+            asyncio.create_task(self._worker(name, model, fields, extra_values, queue))
+            for _ in range(self.args.concurrency)
+        ]
+        try:
+            await self._produce(name, model, fields, condition, queue)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    async def _produce(self, name, model, fields, condition, queue: asyncio.Queue):
+        """번역이 비어 있는 행을 서버 측 커서로 읽어 배치 단위로 큐에 넣음"""
+        def untranslated(lang: str):
+            # 원문이 있는데 번역이 비어 있는 필드가 하나라도 있으면 대상 (빈 원문은 번역도 NULL로 저장됨)
+            return or_(*[
+                and_(getattr(model, field) != "", getattr(model, f"translated_{field}_{lang}").is_(None))
+                for field in fields
+            ])
+
+        missing = or_(
+            and_(model.source_lang == "ru", untranslated("ko")),
+            and_(or_(model.source_lang != "ru", model.source_lang.is_(None)), untranslated("ru")),
+        )
+        # 게시글은 저장 후 게시판별 응답 캐시를 무효화하므로 category_id도 읽음
+        extra_columns = [model.category_id] if hasattr(model, "category_id") else []
+        query = (
+            select(model.id, model.source_lang, *extra_columns, *[getattr(model, field) for field in fields])
+            .where(model.id > self.checkpoint.last_id(name), model.content.is_not(None), missing)
+            .order_by(model.id)
+        )
+        if condition is not None:
+            query = query.where(condition)
+
+        batch = []
+        async with async_engine.connect() as conn:
+            result = await conn.stream(query.execution_options(yield_per=self.args.batch_size))
+            async for row in result:
+                batch.append(row)
+                if len(batch) >= self.args.batch_size:
+                    await queue.put((batch, self.checkpoint.dispatched(name, batch[-1].id)))
+                    batch = []
+        if batch:
+            await queue.put((batch, self.checkpoint.dispatched(name, batch[-1].id)))
+
+    async def _worker(self, name, model, fields, extra_values, queue: asyncio.Queue):
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            rows, entry = item
+            try:
+                await self._translate_batch(model, fields, extra_values, rows)
+                if not self.args.dry_run:
+                    self.checkpoint.completed(name, entry)
+            except Exception as e:
+                # 체크포인트가 이 배치 앞에서 멈추므로 다음 실행 때 다시 처리됨
+                self.stats["failed_batches"] += 1
+                print(f"[{name}] id {rows[0].id}~{rows[-1].id} 번역 실패: {e}", flush=True)
+
+    async def _translate_batch(self, model, fields, extra_values, rows):
+        params = [{"b_id": row.id} for row in rows]
+
+        # 원문 언어별로 한 번에 번역
+        by_source: Dict[str, List[int]] = {}
+        for i, row in enumerate(rows):
+            by_source.setdefault(row.source_lang or "ko", []).append(i)
+
+        for source_lang, indexes in by_source.items():
+            target_lang = other_lang(source_lang)
+            texts = [getattr(rows[i], field) or "" for i in indexes for field in fields]
+            chars = sum(len(text) for text in texts)
+
+            if self.args.dry_run:
+                translated = texts
+            else:
+                await self.budget.acquire(chars)
+                service = await translation_service.get()
+                results = await service.translate_segmented(
+                    texts, target_lang=target_lang, source_lang=source_lang, raise_errors=True
+                )
+                translated = [result["translated_text"] for result in results]
+
+            position = 0
+            for i in indexes:
+                for field in fields:
+                    original = getattr(rows[i], field)
+                    params[i][f"b_{field}_{source_lang}"] = original
+                    params[i][f"b_{field}_{target_lang}"] = translated[position] if original else None
+                    position += 1
+            self.stats["chars"] += chars
+
+        if self.args.dry_run:
+            self.stats["rows"] += len(rows)
+            return
+
+        values = {
+            f"translated_{field}_{lang}": bindparam(f"b_{field}_{lang}")
+            for field in fields
+            for lang in ("ko", "ru")
+        }
+        statement = (
+            update(model.__table__)
+            .where(model.__table__.c.id == bindparam("b_id"))
+            .values(**values, **extra_values)
+        )
+        async with AsyncSessionLocal() as db:
+            conn = await db.connection()
+            await conn.execute(statement, params)
+            await db.commit()
+        self.stats["rows"] += len(rows)
+
+        # 번역문이 바뀐 게시판의 목록 응답 캐시 무효화 (translation_queue와 동일)
+        if hasattr(model, "category_id"):
+            await response_cache.invalidate(post_tags(*{row.category_id for row in rows}))
+
+async def main(args):
+    backfill = Backfill(args)
+    started_at = time.monotonic()
+
+    for name in args.models.split(","):
+        name = name.strip()
+        if name not in TARGETS:
+            print(f"알 수 없는 대상: {name} (post, comment, review 중 선택)")
+            continue
+        print(f"=== {name} (id > {backfill.checkpoint.last_id(name)}) ===", flush=True)
+        await backfill.run(name)
+
+    elapsed = time.monotonic() - started_at
+    stats = backfill.stats
+    print()
+    print(f"번역한 행: {stats['rows']}")
+    print(f"문자 수: {stats['chars']} ({stats['chars'] / max(elapsed / 60, 1e-9):.0f}/분)")
+    print(f"실패한 배치: {stats['failed_batches']}")
+    print(f"소요 시간: {elapsed:.1f}초")
+    await async_engine.dispose()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="번역되지 않은 콘텐츠 일괄 번역")
+    parser.add_argument("--models", default="post,comment,review", help="대상 (쉼표 구분: post, comment, review)")
+    parser.add_argument("--batch-size", type=int, default=50, help="배치당 행 수")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시에 번역할 배치 수")
+    parser.add_argument("--chars-per-minute", type=int, default=300_000, help="분당 최대 전송 문자 수")
+    parser.add_argument("--checkpoint", default=str(DEFAULT_CHECKPOINT), help="체크포인트 파일 경로")
+    parser.add_argument("--reset", action="store_true", help="체크포인트 무시하고 처음부터")
+    parser.add_argument("--dry-run", action="store_true", help="번역/저장 없이 대상 행과 문자 수만 집계")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,112 @@
+"""
+미들웨어 요청당 오버헤드 측정 스크립트
+
+/health 요청을 ASGI로 직접 호출해 (네트워크 제외)
+미들웨어 없음 / 기존 BaseHTTPMiddleware 방식 / 현재 순수 ASGI 방식을 비교한다.
+
+사용법: python scripts/bench_middleware.py [요청 수]
+"""
+import sys
+import asyncio
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+backend_path = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_path))
+
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from app.core.middleware import LoggingMiddleware, RateLimitMiddleware
+from app.utils.logger import logger
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    """변경 전 LoggingMiddleware (비교용)"""
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        logger.info(f"{request.method} {request.url.path} - {request.client.host}")
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        response.headers["X-Process-Time"] = str(process_time)
+        logger.info(
+            f"{request.method} {request.url.path} - "
+            f"Status: {response.status_code} - "
+            f"Time: {process_time:.4f}s"
+        )
+        return response
+
+class LegacyRateLimitMiddleware(BaseHTTPMiddleware):
+    """변경 전 RateLimitMiddleware (비교용 - 통과만 함)"""
+    async def dispatch(self, request: Request, call_next):
+        return await call_next(request)
+
+def build_app(*middlewares) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health_check():
+        return {"status": "healthy"}
+
+    for middleware in middlewares:
+        app.add_middleware(middleware)
+    return app
+
+async def call(app: FastAPI):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/health",
+        "raw_path": b"/health",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("localhost", 8000),
+    }
+
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+    response_complete = asyncio.Event()
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        # 본문을 다 보낸 뒤에는 응답이 끝날 때까지 기다렸다가 연결 종료 전달 (uvicorn과 같은 동작)
+        # 계속 http.request를 돌려주면 BaseHTTPMiddleware의 연결 종료 감시가 끝나지 않음
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body" and not message.get("more_body", False):
+            response_complete.set()
+
+    await app(scope, receive, send)
+
+async def bench(name: str, app: FastAPI, requests: int) -> float:
+    # 워밍업
+    for _ in range(200):
+        await call(app)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await call(app)
+    per_request = (time.perf_counter() - start) / requests * 1_000_000
+    print(f"{name:<28} {per_request:8.1f} µs/요청")
+    return per_request
+
+async def main(requests: int):
+    # 로그 출력 비용은 양쪽 동일하므로 측정에서 제외
+    logger.remove()
+
+    print(f"=== /health {requests}회 ===")
+    baseline = await bench("미들웨어 없음", build_app(), requests)
+    legacy = await bench("BaseHTTPMiddleware (이전)", build_app(LegacyLoggingMiddleware, LegacyRateLimitMiddleware), requests)
+    current = await bench("순수 ASGI (현재)", build_app(LoggingMiddleware, RateLimitMiddleware), requests)
+
+    print()
+    print(f"미들웨어 오버헤드: 이전 {legacy - baseline:.1f} µs → 현재 {current - baseline:.1f} µs")
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
@@ -0,0 +1,87 @@
+import json
+from datetime import datetime
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+from app.api import data
+from app.utils.etag import etag_for_bytes, etag_matches, make_etag, not_modified
+
+def request_with(if_none_match=None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match is not None else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+# ETag 생성
+
+def test_make_etag_is_stable_and_version_sensitive():
+    updated_at = datetime(2024, 1, 1)
+    assert make_etag(1, updated_at, "ko") == make_etag(1, updated_at, "ko")
+    assert make_etag(1, updated_at, "ko") != make_etag(1, updated_at, "ru")
+    assert make_etag(1, updated_at, None) != make_etag(1, datetime(2024, 1, 2), None)
+
+def test_weak_etag_prefix():
+    strong = make_etag(1)
+    weak = make_etag(1, weak=True)
+    assert strong.startswith('"') and strong.endswith('"')
+    assert weak == f"W/{strong}"
+
+def test_etag_for_bytes_follows_body():
+    assert etag_for_bytes(b'{"a":1}') == etag_for_bytes(b'{"a":1}')
+    assert etag_for_bytes(b'{"a":1}') != etag_for_bytes(b'{"a":2}')
+
+# If-None-Match 비교
+
+@pytest.mark.parametrize("header, expected", [
+    (None, False),
+    ("", False),
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"other"', False),
+    ('"other", "abc"', True),
+    ('"other",W/"abc"', True),
+    ("*", True),
+    (" * ", True),
+    ('"ab"', False),
+])
+def test_etag_matches(header, expected):
+    assert etag_matches(request_with(header), '"abc"') is expected
+
+def test_weak_etag_matches_strong_header():
+    assert etag_matches(request_with('"abc"'), 'W/"abc"')
+
+def test_not_modified_response():
+    response = not_modified('"abc"', cache_control="private, no-cache")
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == '"abc"'
+    assert response.headers["cache-control"] == "private, no-cache"
+
+# 엔드포인트 (게시판 데이터 로드)
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setattr(data, "DATA_FILE", tmp_path / "board_data.json")
+    app = FastAPI()
+    app.include_router(data.router, prefix="/api/data")
+    return TestClient(app)
+
+def test_load_returns_etag_then_304(client):
+    response = client.get("/api/data/load")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "no-cache"
+
+    cached = client.get("/api/data/load", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+def test_load_etag_changes_after_save(client):
+    etag = client.get("/api/data/load").headers["etag"]
+
+    assert client.post("/api/data/save", json={"freeboard": [{"id": 1}]}).status_code == 200
+
+    response = client.get("/api/data/load", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert json.loads(response.content) == {"freeboard": [{"id": 1}]}
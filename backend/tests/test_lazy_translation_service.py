@@ -0,0 +1,72 @@
+import asyncio
+import threading
+import time
+import pytest
+from app.services import translation
+from app.services.translation import LazyTranslationService
+
+class SlowService:
+    """생성에 시간이 걸리는 TranslationService 대역"""
+    created = 0
+    fail = False
+
+    def __init__(self):
+        time.sleep(0.2)
+        if SlowService.fail:
+            raise RuntimeError("초기화 실패")
+        SlowService.created += 1
+        self.thread = threading.get_ident()
+
+@pytest.fixture(autouse=True)
+def slow_service(monkeypatch):
+    SlowService.created, SlowService.fail = 0, False
+    monkeypatch.setattr(translation, "TranslationService", SlowService)
+
+def test_concurrent_get_creates_once_without_blocking_loop():
+    lazy = LazyTranslationService()
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while not lazy.initialized:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        tick_task = asyncio.create_task(ticker())
+        services = await asyncio.gather(*(lazy.get() for _ in range(5)))
+        await tick_task
+        return services, ticks
+
+    services, ticks = asyncio.run(run())
+    assert SlowService.created == 1
+    assert all(service is services[0] for service in services)
+    assert services[0].thread != threading.get_ident()
+    # 생성하는 동안에도 이벤트 루프가 다른 작업을 처리
+    assert ticks > 5
+
+def test_failed_creation_is_retried():
+    lazy = LazyTranslationService()
+    SlowService.fail = True
+    with pytest.raises(RuntimeError):
+        asyncio.run(lazy.get())
+    assert not lazy.initialized
+
+    SlowService.fail = False
+    assert asyncio.run(lazy.get()) is not None
+    assert SlowService.created == 1
+
+def test_cancelled_waiter_does_not_cancel_creation():
+    lazy = LazyTranslationService()
+
+    async def run():
+        waiter = asyncio.create_task(lazy.get())
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+        return await lazy.get()
+
+    service = asyncio.run(run())
+    assert lazy.initialized
+    assert SlowService.created == 1
+    assert service is not None
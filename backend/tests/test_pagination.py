@@ -0,0 +1,135 @@
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from app.api.posts import _get_posts_by_cursor, _list_posts, _list_query
+from app.db.database import Base
+from app.models import Category, Post, User
+from app.models.post import PostStatus
+from app.utils.pagination import CURSOR_NEXT, CURSOR_PREV, decode_cursor, encode_cursor
+
+# 커서 인코딩
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 3, 1, 12, 30, 45, 123456)
+    cursor = encode_cursor(True, created_at, 42, CURSOR_PREV)
+    assert decode_cursor(cursor) == (True, created_at, 42, CURSOR_PREV)
+
+def test_cursor_is_url_safe_without_padding():
+    cursor = encode_cursor(False, datetime(2024, 1, 1), 1)
+    assert "=" not in cursor
+    assert all(c.isalnum() or c in "-_" for c in cursor)
+    assert decode_cursor(cursor)[3] == CURSOR_NEXT
+
+@pytest.mark.parametrize("cursor", [
+    "",
+    "not-a-cursor",
+    "!!!",
+    encode_cursor(False, datetime(2024, 1, 1), 1)[:-3],
+])
+def test_malformed_cursor_is_rejected(cursor):
+    assert decode_cursor(cursor) is None
+
+def test_cursor_with_unknown_direction_is_rejected():
+    import base64
+    import json
+    raw = json.dumps([0, datetime(2024, 1, 1).isoformat(), 1, "sideways"]).encode()
+    assert decode_cursor(base64.urlsafe_b64encode(raw).decode()) is None
+
+# 키셋 경계 (SQLite)
+
+BASE_TIME = datetime(2024, 1, 1, 9, 0, 0)
+
+# (id, 고정 여부, created_at 오프셋(분)) - 같은 시각 글(3, 4)과 오래된 고정글 포함
+POSTS = [
+    (1, True, 0),
+    (2, False, 10),
+    (3, False, 20),
+    (4, False, 20),
+    (5, True, 5),
+    (6, False, 30),
+    (7, False, 1),
+]
+
+# (is_pinned, created_at, id) 내림차순
+EXPECTED_ORDER = [5, 1, 6, 4, 3, 2, 7]
+
+async def _with_board(tmp_path, check):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'board.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[User.__table__, Category.__table__, Post.__table__])
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as db:
+        db.add(User(id=1, email="author@example.com", username="author", nickname="author"))
+        db.add(Category(id=1, slug="free", name_ko="자유", name_ru="Свободная"))
+        for post_id, is_pinned, minutes in POSTS:
+            db.add(Post(
+                id=post_id, user_id=1, category_id=1, title=f"post {post_id}", content="본문",
+                status=PostStatus.PUBLISHED, is_pinned=is_pinned,
+                created_at=BASE_TIME + timedelta(minutes=minutes)
+            ))
+        await db.commit()
+
+    try:
+        async with session_factory() as db:
+            await check(db)
+    finally:
+        await engine.dispose()
+
+async def _walk(db, page_size):
+    """첫 페이지부터 next_cursor를 따라 끝까지, 다시 prev_cursor를 따라 처음까지"""
+    forward = []
+    cursor = None
+    while True:
+        listing = await _get_posts_by_cursor(db, _list_query(None), cursor, page_size, len(POSTS), None)
+        forward.append([item.id for item in listing.items])
+        if listing.next_cursor is None:
+            break
+        cursor = listing.next_cursor
+
+    backward = []
+    cursor = listing.prev_cursor
+    while cursor:
+        listing = await _get_posts_by_cursor(db, _list_query(None), cursor, page_size, len(POSTS), None)
+        backward.append([item.id for item in listing.items])
+        cursor = listing.prev_cursor
+    return forward, backward
+
+@pytest.mark.parametrize("page_size", [1, 2, 3, 7, 10])
+def test_cursor_pages_cover_every_post_once(tmp_path, page_size):
+    async def check(db):
+        forward, backward = await _walk(db, page_size)
+        assert [post_id for page in forward for post_id in page] == EXPECTED_ORDER
+        # 뒤로 돌아가면 앞으로 갈 때의 페이지를 역순으로 다시 만남
+        assert backward == forward[-2::-1]
+
+    asyncio.run(_with_board(tmp_path, check))
+
+def test_first_page_has_no_prev_cursor(tmp_path):
+    async def check(db):
+        listing = await _get_posts_by_cursor(db, _list_query(None), None, 3, len(POSTS), None)
+        assert listing.prev_cursor is None
+        assert listing.next_cursor is not None
+
+    asyncio.run(_with_board(tmp_path, check))
+
+def test_page_mode_uses_cursor_order(tmp_path, redis_down):
+    async def check(db):
+        pages = []
+        for page in (1, 2, 3):
+            listing = await _list_posts(db, page, 3, None, PostStatus.PUBLISHED, False, None, None)
+            pages.extend(item.id for item in listing.items)
+            assert listing.total == len(POSTS)
+        assert pages == EXPECTED_ORDER
+
+    asyncio.run(_with_board(tmp_path, check))
+
+def test_invalid_cursor_returns_400(tmp_path):
+    async def check(db):
+        with pytest.raises(HTTPException) as exc_info:
+            await _get_posts_by_cursor(db, _list_query(None), "garbage", 3, len(POSTS), None)
+        assert exc_info.value.status_code == 400
+
+    asyncio.run(_with_board(tmp_path, check))
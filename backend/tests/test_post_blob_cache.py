@@ -0,0 +1,69 @@
+import asyncio
+import json
+from datetime import datetime
+from typing import Dict, List, Optional
+import orjson
+from pydantic import BaseModel
+from app.services.post_blob_cache import PostBlobCache, _split
+
+class FakePostResponse(BaseModel):
+    id: int
+    title: str
+    attachments: List[Dict] = []
+    view_count: int = 0
+    updated_at: Optional[datetime] = None
+
+UPDATED_AT = datetime(2024, 5, 1, 10, 0, 0)
+
+def test_render_appends_view_count():
+    blob = _split(orjson.dumps({"id": 1, "title": "제목"}))
+    assert json.loads(blob.render(123)) == {"id": 1, "title": "제목", "view_count": 123}
+
+def test_render_of_empty_object():
+    assert json.loads(_split(b"{}").render(7)) == {"view_count": 7}
+
+def test_user_json_containing_view_count_is_untouched():
+    # 첨부파일 메타데이터에 같은 키/값이 있어도 최상위 view_count만 바뀜
+    attachments = [{"view_count": -1, "name": '"view_count":-1'}]
+    blob = _split(orjson.dumps({"id": 1, "attachments": attachments}))
+
+    rendered = json.loads(blob.render(42))
+    assert rendered["view_count"] == 42
+    assert rendered["attachments"] == attachments
+
+def test_size_counts_both_parts():
+    blob = _split(orjson.dumps({"id": 1}))
+    assert blob.size == len(blob.render(0)) - 1
+
+def test_set_then_get_from_local_tier(redis_down):
+    cache = PostBlobCache()
+    response = FakePostResponse(
+        id=1, title="제목", view_count=999,
+        attachments=[{"view_count": -1}], updated_at=UPDATED_AT
+    )
+
+    async def run():
+        stored = await cache.set(1, UPDATED_AT, None, "ko", response)
+        loaded = await cache.get(1, UPDATED_AT, None, "ko")
+        missing = await cache.get(1, UPDATED_AT, None, "ru")
+        return stored, loaded, missing
+
+    stored, loaded, missing = asyncio.run(run())
+    assert loaded == stored
+    assert missing is None
+
+    rendered = json.loads(loaded.render(5))
+    # 저장 시점의 view_count는 버리고 응답할 때 넣은 값 사용
+    assert rendered == {**response.model_dump(mode="json"), "view_count": 5}
+
+def test_key_changes_with_version():
+    cache = PostBlobCache()
+    later = datetime(2024, 5, 2)
+    keys = {
+        cache._key(1, UPDATED_AT, None, None),
+        cache._key(1, later, None, None),
+        cache._key(1, UPDATED_AT, later, None),
+        cache._key(1, UPDATED_AT, None, "ko"),
+        cache._key(2, UPDATED_AT, None, None),
+    }
+    assert len(keys) == 5
@@ -0,0 +1,111 @@
+import asyncio
+import time
+from types import SimpleNamespace
+import pytest
+import redis.asyncio as aioredis
+from fastapi.testclient import TestClient
+from app.core import middleware, rate_limit
+from app.core.rate_limit import RateLimiter, get_route_limit
+from app.db import redis as redis_module
+
+class Clock:
+    """rate_limit 모듈의 time 대신 사용하는 조작 가능한 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(monotonic=clock.monotonic, time=clock.time))
+    return clock
+
+def hit(limiter: RateLimiter, key: str, limit: int):
+    return asyncio.run(limiter.hit(key, limit))
+
+# Redis 없이 프로세스 내 토큰 버킷으로 대체
+
+def test_local_bucket_allows_limit_then_rejects(redis_down, clock):
+    limiter = RateLimiter()
+    results = [hit(limiter, "ip:1", 5) for _ in range(6)]
+
+    assert [result.allowed for result in results] == [True] * 5 + [False]
+    assert [result.remaining for result in results[:5]] == [4, 3, 2, 1, 0]
+    # 분당 5회 = 12초마다 1회 회복
+    assert results[5].retry_after == pytest.approx(12)
+    assert results[5].reset_after == pytest.approx(60)
+
+def test_local_bucket_refills_over_time(redis_down, clock):
+    limiter = RateLimiter()
+    for _ in range(5):
+        hit(limiter, "ip:1", 5)
+    assert not hit(limiter, "ip:1", 5).allowed
+
+    clock.now += 12
+    assert hit(limiter, "ip:1", 5).allowed
+    assert not hit(limiter, "ip:1", 5).allowed
+
+    # 완전히 회복되어도 한도 이상 쌓이지 않음
+    clock.now += 3600
+    assert [hit(limiter, "ip:1", 5).allowed for _ in range(6)] == [True] * 5 + [False]
+
+def test_local_buckets_are_per_key(redis_down, clock):
+    limiter = RateLimiter()
+    for _ in range(5):
+        hit(limiter, "ip:1", 5)
+    assert not hit(limiter, "ip:1", 5).allowed
+    assert hit(limiter, "ip:2", 5).allowed
+
+def test_redis_error_falls_back_and_backs_off(monkeypatch):
+    # 닫힌 포트 - GCRA 스크립트 실행이 연결 오류로 실패
+    unreachable = aioredis.from_url("redis://127.0.0.1:1/0", socket_connect_timeout=0.2, socket_timeout=0.2)
+    monkeypatch.setattr(redis_module, "_async_redis_client", unreachable)
+    monkeypatch.setattr(redis_module, "_async_down_until", 0.0)
+
+    result = hit(RateLimiter(), "ip:1", 5)
+
+    assert result.allowed
+    assert result.remaining == 4
+    # 이후 RECONNECT_INTERVAL 동안은 Redis를 시도하지 않음
+    assert redis_module.get_async_redis() is None
+    assert redis_module._async_down_until > time.monotonic() + redis_module.RECONNECT_INTERVAL - 5
+
+# 경로별 한도
+
+def test_route_limits():
+    assert get_route_limit("GET", "/health") is None
+    assert get_route_limit("GET", "/static/app.js") is None
+    assert get_route_limit("POST", "/api/auth/login") == ("POST:/api/auth/", 10)
+    assert get_route_limit("GET", "/api/auth/me")[0] == "default"
+    assert get_route_limit("GET", "/api/posts")[0] == "default"
+
+# 미들웨어 (CORS 안쪽에서 동작)
+
+@pytest.fixture
+def client(monkeypatch, redis_down):
+    from app.main import app
+    monkeypatch.setattr(middleware, "rate_limiter", RateLimiter())
+    return TestClient(app)
+
+def test_preflight_is_not_rate_limited(client):
+    headers = {"Origin": "http://example.com", "Access-Control-Request-Method": "GET"}
+    for _ in range(100):
+        response = client.options("/api", headers=headers)
+        assert response.status_code == 200
+        assert "x-ratelimit-limit" not in response.headers
+
+def test_rejected_request_has_cors_headers(client):
+    headers = {"Origin": "http://example.com"}
+    responses = [client.get("/api", headers=headers) for _ in range(61)]
+
+    assert all(response.status_code == 200 for response in responses[:60])
+    rejected = responses[60]
+    assert rejected.status_code == 429
+    assert "retry-after" in rejected.headers
+    assert "access-control-allow-origin" in rejected.headers
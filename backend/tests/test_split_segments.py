@@ -0,0 +1,53 @@
+import pytest
+from app.services.translation import SEGMENT_MAX_CHARS, split_segments
+
+def joined(pieces):
+    return "".join(piece for piece, _ in pieces)
+
+def translatable(pieces):
+    return [piece for piece, is_translatable in pieces if is_translatable]
+
+@pytest.mark.parametrize("text", [
+    "",
+    "한 줄",
+    "첫 문단\n\n둘째 문단",
+    "앞 공백\n \t\n\n  뒤 문단\n\n\n",
+    "\n\n처음이 빈 줄",
+    "Первый абзац.\r\n\r\nВторой абзац.",
+])
+def test_pieces_join_back_to_original(text):
+    assert joined(split_segments(text)) == text
+
+def test_empty_text_has_nothing_to_translate():
+    assert translatable(split_segments("")) == []
+    assert translatable(split_segments("\n\n  \n\n")) == []
+
+def test_short_text_is_one_segment():
+    assert split_segments("안녕하세요. 반갑습니다.") == [("안녕하세요. 반갑습니다.", True)]
+
+def test_paragraphs_are_split_on_blank_lines():
+    pieces = split_segments("첫 문단\n줄바꿈 포함\n\n둘째 문단\n \n셋째 문단")
+    assert translatable(pieces) == ["첫 문단\n줄바꿈 포함", "둘째 문단", "셋째 문단"]
+    # 구분자(빈 줄)는 번역하지 않고 그대로 둠
+    assert ("\n\n", False) in pieces
+    assert ("\n \n", False) in pieces
+
+def test_long_paragraph_is_split_into_sentences():
+    sentence = "가" * 300 + "."
+    paragraph = " ".join([sentence] * 4)
+    assert len(paragraph) > SEGMENT_MAX_CHARS
+
+    pieces = split_segments(paragraph)
+    assert translatable(pieces) == [sentence] * 4
+    assert joined(pieces) == paragraph
+    assert [piece for piece, is_translatable in pieces if not is_translatable] == [" "] * 3
+
+def test_paragraph_at_limit_is_not_split():
+    paragraph = ("가" * 99 + ". ") * (SEGMENT_MAX_CHARS // 101)
+    paragraph = paragraph[:SEGMENT_MAX_CHARS]
+    assert translatable(split_segments(paragraph)) == [paragraph]
+
+def test_editing_one_paragraph_keeps_other_segments():
+    before = translatable(split_segments("첫 문단\n\n둘째 문단\n\n셋째 문단"))
+    after = translatable(split_segments("첫 문단\n\n둘째 문단 (수정)\n\n셋째 문단"))
+    assert [segment for segment in after if segment not in before] == ["둘째 문단 (수정)"]
@@ -0,0 +1,54 @@
+import asyncio
+import time
+import pytest
+from app.db import redis as redis_module
+from app.services.translation_cache import TranslationCache, _decode, _encode
+
+class FailingRedis:
+    """모든 명령이 연결 오류로 실패하는 Redis 대역"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def mget(self, keys):
+        self.calls += 1
+        raise ConnectionError("연결 실패")
+
+    async def get(self, key):
+        self.calls += 1
+        raise ConnectionError("연결 실패")
+
+@pytest.fixture
+def redis_up(monkeypatch):
+    monkeypatch.setattr(redis_module, "_async_down_until", 0.0)
+
+def test_encode_round_trip_with_and_without_compression():
+    short = {"translated_text": "짧은 문장"}
+    long = {"translated_text": "긴 문장 " * 1000}
+    assert _decode(_encode(short)) == short
+    assert _encode(long).startswith(b"z:")
+    assert _decode(_encode(long)) == long
+
+def test_local_tier_without_redis(redis_down):
+    cache = TranslationCache(None)
+
+    async def run():
+        await cache.set_many([("a", {"translated_text": "A"})])
+        return await cache.get_many(["a", "b"])
+
+    assert asyncio.run(run()) == [{"translated_text": "A"}, None]
+
+def test_redis_failure_starts_shared_backoff(redis_up):
+    client = FailingRedis()
+    cache = TranslationCache(client)
+
+    async def run():
+        first = await cache.get_many(["a"])
+        # 백오프 동안에는 Redis를 다시 부르지 않음
+        second = await cache.get_many(["a"])
+        return first, second
+
+    assert asyncio.run(run()) == ([None], [None])
+    assert client.calls == 1
+    assert redis_module._async_down_until > time.monotonic()
+    assert redis_module.get_async_redis() is None
@@ -0,0 +1,86 @@
+import asyncio
+from types import SimpleNamespace
+import pytest
+from app.services import translation_quota as quota_module
+from app.services.translation_quota import BUCKETS, CharQuota, QuotaWindow
+
+HOUR = QuotaWindow("hour", 3600, 100)
+DAY = QuotaWindow("day", 86400, 150)
+
+# 1시간 윈도 버킷(60초) 경계에 맞춘 시작 시각
+START = 1_000 * 3600.0
+
+@pytest.fixture
+def clock(monkeypatch, redis_down):
+    """Redis 없이 (로컬 카운터) 시각을 조작"""
+    clock = SimpleNamespace(now=START)
+    monkeypatch.setattr(quota_module, "time", SimpleNamespace(time=lambda: clock.now))
+    return clock
+
+def consume(quota: CharQuota, chars: int, windows=(HOUR,), scope: str = "user:1"):
+    return asyncio.run(quota.consume(scope, list(windows), chars))
+
+def test_allows_up_to_limit_then_rejects(clock):
+    quota = CharQuota()
+    assert consume(quota, 60).allowed
+    assert consume(quota, 40).allowed
+
+    result = consume(quota, 1)
+    assert not result.allowed
+    assert (result.window, result.limit, result.used) == ("hour", 100, 100)
+    # 가장 오래된 버킷 하나가 빠질 때까지
+    assert result.retry_after == 3600 / BUCKETS
+
+def test_rejected_request_is_not_charged(clock):
+    quota = CharQuota()
+    consume(quota, 90)
+    assert not consume(quota, 20).allowed
+    assert consume(quota, 10).allowed
+
+def test_window_rolls_per_bucket(clock):
+    quota = CharQuota()
+    consume(quota, 100)
+
+    # 첫 사용 버킷이 윈도 안에 있는 동안은 거부
+    clock.now = START + 3599
+    assert not consume(quota, 1).allowed
+    # 버킷 60개가 지나면 첫 사용분이 빠짐
+    clock.now = START + 3600
+    assert consume(quota, 100).allowed
+    assert not consume(quota, 1).allowed
+
+def test_usage_within_a_bucket_expires_together(clock):
+    quota = CharQuota()
+    consume(quota, 50)
+    clock.now += 59
+    consume(quota, 50)
+
+    clock.now = START + 3600
+    assert consume(quota, 100).allowed
+
+def test_any_window_over_limit_rejects(clock):
+    quota = CharQuota()
+    assert consume(quota, 100, (HOUR, DAY)).allowed
+    clock.now += 3600
+    assert consume(quota, 50, (HOUR, DAY)).allowed
+    clock.now += 3600
+
+    result = consume(quota, 1, (HOUR, DAY))
+    assert not result.allowed
+    assert (result.window, result.used) == ("day", 150)
+    assert result.retry_after == 86400 / BUCKETS
+
+def test_zero_limit_only_counts(clock):
+    quota = CharQuota()
+    unlimited = QuotaWindow("hour", 3600, 0)
+    for _ in range(5):
+        assert consume(quota, 10_000, (unlimited,)).allowed
+
+    usage = asyncio.run(quota.usage("user:1", [unlimited]))
+    assert usage == [{"window": "hour", "seconds": 3600, "limit": 0, "used": 50_000}]
+
+def test_scopes_are_independent(clock):
+    quota = CharQuota()
+    consume(quota, 100, scope="user:1")
+    assert not consume(quota, 1, scope="user:1").allowed
+    assert consume(quota, 100, scope="user:2").allowed
@@ -0,0 +1,228 @@
+import asyncio
+import itertools
+import time
+from types import SimpleNamespace
+import pytest
+from app.core.config import settings
+from app.services import translation_providers
+from app.services.translation_providers import CircuitBreaker, ProviderRouter, StubProvider, TranslationError
+
+# 지연 시간 히스토그램은 프로바이더 이름별 전역 지표이므로 테스트마다 다른 이름 사용
+_names = itertools.count()
+
+def provider(prefix: str, **kwargs) -> StubProvider:
+    return StubProvider(f"{prefix}-{next(_names)}", **kwargs)
+
+def translate(router: ProviderRouter, texts=("테스트",)):
+    return asyncio.run(router.translate(list(texts), "ru", "ko"))
+
+@pytest.fixture
+def clock(monkeypatch):
+    """서킷 브레이커가 읽는 time.monotonic 조작"""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(translation_providers, "time", SimpleNamespace(
+        monotonic=lambda: clock.now,
+        perf_counter=time.perf_counter
+    ))
+    return clock
+
+# 서킷 브레이커 상태 전이
+
+def test_breaker_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=30)
+    for _ in range(2):
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+def test_success_resets_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=30)
+    for _ in range(5):
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 0
+
+def test_breaker_half_opens_after_reset_and_allows_one_trial(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30)
+    breaker.record_failure()
+
+    clock.now += 29.9
+    assert not breaker.allow_request()
+    clock.now += 0.1
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # 시험 요청이 끝나기 전에는 다른 요청 차단
+    assert not breaker.allow_request()
+
+def test_half_open_success_closes(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30)
+    breaker.record_failure()
+    clock.now += 30
+    breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+def test_half_open_failure_reopens_for_full_reset(clock):
+    breaker = CircuitBreaker(failure_threshold=5, reset_seconds=30)
+    for _ in range(5):
+        breaker.record_failure()
+    clock.now += 30
+    breaker.allow_request()
+
+    # 시험 요청은 한 번만 실패해도 다시 열림
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now += 29
+    assert not breaker.allow_request()
+    clock.now += 1
+    assert breaker.allow_request()
+
+def test_cancelled_trial_can_be_retried_immediately(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30)
+    breaker.record_failure()
+    clock.now += 30
+    breaker.allow_request()
+
+    breaker.record_cancelled()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+def test_cancel_while_closed_changes_nothing(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=30)
+    breaker.record_cancelled()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+# 장애 대체 (failover)
+
+def test_failover_to_next_provider():
+    primary, fallback = provider("primary", fail=True), provider("fallback")
+    router = ProviderRouter([primary, fallback], timeout=1.0, hedge=False)
+
+    results = translate(router, ["안녕하세요"])
+    assert results == [{"translated_text": "[ru] 안녕하세요", "source_lang": "ko", "target_lang": "ru"}]
+    assert (primary.calls, fallback.calls) == (1, 1)
+
+def test_primary_is_used_when_healthy():
+    primary, fallback = provider("primary"), provider("fallback")
+    router = ProviderRouter([primary, fallback], timeout=1.0, hedge=False)
+
+    translate(router)
+    assert (primary.calls, fallback.calls) == (1, 0)
+
+def test_timeout_moves_on_to_next_provider():
+    slow, fast = provider("slow", delay=1.0), provider("fast")
+    router = ProviderRouter([slow, fast], timeout=0.1, hedge=False)
+
+    start = time.perf_counter()
+    translate(router)
+    assert time.perf_counter() - start < 0.5
+    assert fast.calls == 1
+    assert router.breakers[slow.name].failures == 1
+
+def test_all_providers_failed_raises_with_each_error():
+    first, second = provider("first", fail=True), provider("second", fail=True)
+    router = ProviderRouter([first, second], timeout=1.0, hedge=False)
+
+    with pytest.raises(TranslationError) as exc_info:
+        translate(router)
+    assert first.name in str(exc_info.value)
+    assert second.name in str(exc_info.value)
+
+def test_no_providers_raises():
+    with pytest.raises(TranslationError):
+        translate(ProviderRouter([], timeout=1.0, hedge=False))
+
+# 서킷 브레이커와 라우터
+
+def test_open_circuit_skips_provider(clock):
+    broken, healthy = provider("broken", fail=True), provider("healthy")
+    router = ProviderRouter([broken, healthy], timeout=1.0, hedge=False)
+    router.breakers[broken.name] = CircuitBreaker(failure_threshold=3, reset_seconds=30)
+
+    for _ in range(10):
+        translate(router)
+    assert broken.calls == 3
+    assert healthy.calls == 10
+
+    # reset 후 시험 요청이 성공하면 다시 기본 프로바이더 사용
+    broken.fail = False
+    clock.now += 30
+    translate(router)
+    translate(router)
+    assert router.breakers[broken.name].state == CircuitBreaker.CLOSED
+    assert (broken.calls, healthy.calls) == (5, 10)
+
+def test_all_circuits_open_raises(clock):
+    only = provider("only", fail=True)
+    router = ProviderRouter([only], timeout=1.0, hedge=False)
+    router.breakers[only.name] = CircuitBreaker(failure_threshold=1, reset_seconds=30)
+
+    with pytest.raises(TranslationError):
+        translate(router)
+    with pytest.raises(TranslationError, match="서킷"):
+        translate(router)
+    assert only.calls == 1
+
+# 헤지 요청
+
+def test_hedge_returns_faster_provider_result():
+    slow, fast = provider("slow", delay=0.5), provider("fast", delay=0.01)
+    router = ProviderRouter([slow, fast], timeout=5.0, hedge=True)
+    router._hedge_delay = lambda provider: 0.05
+
+    start = time.perf_counter()
+    results = translate(router)
+    assert time.perf_counter() - start < 0.3
+    assert results[0]["translated_text"] == "[ru] 테스트"
+    assert (slow.calls, fast.calls) == (1, 1)
+    # 헤지에 져서 취소된 요청은 실패로 세지 않음
+    assert router.breakers[slow.name].state == CircuitBreaker.CLOSED
+    assert router.breakers[slow.name].failures == 0
+
+def test_no_hedge_before_delay():
+    primary, fallback = provider("primary", delay=0.01), provider("fallback")
+    router = ProviderRouter([primary, fallback], timeout=5.0, hedge=True)
+    router._hedge_delay = lambda provider: 0.5
+
+    translate(router)
+    assert (primary.calls, fallback.calls) == (1, 0)
+
+def test_hedge_disabled_waits_for_primary():
+    slow, fast = provider("slow", delay=0.2), provider("fast")
+    router = ProviderRouter([slow, fast], timeout=5.0, hedge=False)
+    router._hedge_delay = lambda provider: 0.01
+
+    translate(router)
+    assert (slow.calls, fast.calls) == (1, 0)
+
+def test_hedge_failure_falls_back_to_original_request():
+    slow, broken = provider("slow", delay=0.2), provider("broken", fail=True)
+    router = ProviderRouter([slow, broken], timeout=5.0, hedge=True)
+    router._hedge_delay = lambda provider: 0.05
+
+    results = translate(router)
+    assert results[0]["translated_text"] == "[ru] 테스트"
+    assert (slow.calls, broken.calls) == (1, 1)
+
+def test_hedge_delay_uses_default_until_enough_samples():
+    fast = provider("fast")
+    router = ProviderRouter([fast], timeout=5.0, hedge=True)
+    assert router._hedge_delay(fast) == settings.TRANSLATION_HEDGE_DEFAULT_SECONDS
+
+    for _ in range(ProviderRouter.HEDGE_MIN_SAMPLES):
+        translate(router)
+    assert router._hedge_delay(fast) < settings.TRANSLATION_HEDGE_DEFAULT_SECONDS
+
+def test_hedge_delay_is_capped_by_timeout():
+    slow = provider("slow")
+    router = ProviderRouter([slow], timeout=0.5, hedge=True)
+    for _ in range(ProviderRouter.HEDGE_MIN_SAMPLES):
+        router._latency(slow).observe(10.0)
+    assert router._hedge_delay(slow) == 0.5
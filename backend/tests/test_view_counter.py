@@ -0,0 +1,142 @@
+import asyncio
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from app.db.database import Base
+from app.models import Category, Post, User
+from app.services import view_counter as view_counter_module
+from app.services.view_counter import FLUSH_LOCK_KEY, FLUSHING_KEY, PENDING_KEY, ViewCounter
+
+class FakeRedis:
+    """조회수 버퍼가 쓰는 명령만 구현한 Redis 대역 (해시 값은 문자열)"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def hincrby(self, key, field, amount):
+        hash_ = self.data.setdefault(key, {})
+        hash_[str(field)] = str(int(hash_.get(str(field), 0)) + amount)
+        return int(hash_[str(field)])
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = str(value)
+        return True
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+    async def rename(self, src, dst):
+        self.data[dst] = self.data.pop(src)
+
+    async def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+class BrokenSession:
+    async def __aenter__(self):
+        raise RuntimeError("DB 연결 실패")
+
+    async def __aexit__(self, *exc):
+        return False
+
+@pytest.fixture
+def board(tmp_path, monkeypatch):
+    """게시글 1, 2가 있는 SQLite DB를 AsyncSessionLocal로 사용"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'views.db'}")
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def setup():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all, tables=[User.__table__, Category.__table__, Post.__table__])
+        async with session_factory() as db:
+            db.add(User(id=1, email="author@example.com", username="author", nickname="author"))
+            db.add(Category(id=1, slug="free", name_ko="자유", name_ru="Свободная"))
+            for post_id in (1, 2):
+                db.add(Post(id=post_id, user_id=1, category_id=1, title=f"post {post_id}", content="본문"))
+            await db.commit()
+
+    asyncio.run(setup())
+    monkeypatch.setattr(view_counter_module, "AsyncSessionLocal", session_factory)
+    yield session_factory
+    asyncio.run(engine.dispose())
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(view_counter_module, "get_async_redis", lambda: client)
+    return client
+
+def view_counts(session_factory):
+    async def run():
+        async with session_factory() as db:
+            return dict((await db.execute(select(Post.id, Post.view_count).order_by(Post.id))).all())
+    return asyncio.run(run())
+
+def test_flush_applies_redis_buffer(board, fake_redis):
+    counter = ViewCounter()
+
+    async def run():
+        for post_id in (1, 1, 2):
+            await counter.increment(post_id)
+        return await counter.flush()
+
+    assert asyncio.run(run()) == 2
+    assert view_counts(board) == {1: 2, 2: 1}
+    assert FLUSHING_KEY not in fake_redis.data
+    assert PENDING_KEY not in fake_redis.data
+
+def test_failed_flush_keeps_claimed_counts_for_next_flush(board, fake_redis, monkeypatch):
+    counter = ViewCounter()
+    asyncio.run(counter.increment(1))
+
+    monkeypatch.setattr(view_counter_module, "AsyncSessionLocal", BrokenSession)
+    with pytest.raises(RuntimeError):
+        asyncio.run(counter.flush())
+    assert fake_redis.data[FLUSHING_KEY] == {"1": "1"}
+
+    # 실패 후 새 조회는 PENDING_KEY에 쌓이고, 다음 반영은 남은 FLUSHING_KEY부터 처리
+    asyncio.run(counter.increment(2))
+    fake_redis.data.pop(FLUSH_LOCK_KEY)
+    monkeypatch.setattr(view_counter_module, "AsyncSessionLocal", board)
+    asyncio.run(counter.flush())
+    assert view_counts(board) == {1: 1, 2: 0}
+    assert fake_redis.data[PENDING_KEY] == {"2": "1"}
+
+    fake_redis.data.pop(FLUSH_LOCK_KEY)
+    asyncio.run(counter.flush())
+    assert view_counts(board) == {1: 1, 2: 1}
+
+def test_flush_skips_redis_while_another_worker_holds_lock(board, fake_redis):
+    counter = ViewCounter()
+    asyncio.run(counter.increment(1))
+    fake_redis.data[FLUSH_LOCK_KEY] = "1"
+
+    assert asyncio.run(counter.flush()) == 0
+    assert fake_redis.data[PENDING_KEY] == {"1": "1"}
+
+def test_local_buffer_when_redis_is_down(board, redis_down):
+    counter = ViewCounter()
+
+    async def run():
+        await counter.increment(2)
+        await counter.increment(2)
+        return await counter.flush()
+
+    assert asyncio.run(run()) == 1
+    assert view_counts(board) == {1: 0, 2: 2}
+
+def test_failed_flush_restores_local_buffer(board, redis_down, monkeypatch):
+    counter = ViewCounter()
+    asyncio.run(counter.increment(1))
+
+    monkeypatch.setattr(view_counter_module, "AsyncSessionLocal", BrokenSession)
+    with pytest.raises(RuntimeError):
+        asyncio.run(counter.flush())
+
+    monkeypatch.setattr(view_counter_module, "AsyncSessionLocal", board)
+    asyncio.run(counter.flush())
+    assert view_counts(board) == {1: 1, 2: 0}